@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from fastapi import Depends, FastAPI, HTTPException, Path, Query, Request, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.security import HTTPBearer
 
 from api.dependencies import (
@@ -21,6 +21,8 @@ from api.dependencies import (
     get_schema_service,
 )
 from api.models.pydantic_models import (
+    DATASETS_ADAPTER,
+    PROJECTS_ADAPTER,
     APIResponse,
     ContextualTemplatePayload,
     DatasetSummary,
@@ -144,14 +146,19 @@ async def list_projects(
     request: Request,
     project_service: ProjectService = Depends(get_project_service),
     user_info: Optional[Dict] = Depends(get_optional_user)
-) -> List[ProjectSummary]:
+) -> Response:
     """
     List all available projects.
 
     Scans the MONITOR_PATH and returns a summary of each valid project folder.
     """
     try:
-        return await project_service.list_projects()
+        projects = await project_service.list_projects()
+        # response_model above still documents the body in OpenAPI; the
+        # adapter only replaces FastAPI's slower serialization
+        return Response(
+            content=PROJECTS_ADAPTER.dump_json(projects), media_type="application/json"
+        )
     except Exception as e:
         logger.error(f"Error listing projects: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -183,7 +190,7 @@ async def list_project_datasets(
     project_id: str = Path(..., description="The ID of the project"),
     project_service: ProjectService = Depends(get_project_service),
     user_info: Optional[Dict] = Depends(get_optional_user)
-) -> List[DatasetSummary]:
+) -> Response:
     """
     List all datasets within a specific project.
 
@@ -193,7 +200,12 @@ async def list_project_datasets(
         # Validate input
         validated_project_id = InputValidator.validate_id(project_id, "Project ID")
 
-        return await project_service.get_project_datasets(validated_project_id)
+        datasets = await project_service.get_project_datasets(validated_project_id)
+        # response_model above still documents the body in OpenAPI; the
+        # adapter only replaces FastAPI's slower serialization
+        return Response(
+            content=DATASETS_ADAPTER.dump_json(datasets), media_type="application/json"
+        )
     except InputValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except ValueError as e:
@@ -5,10 +5,22 @@ Defines the structure of API communication and data validation.
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
-class ProjectSummary(BaseModel):
+class _ServerBuiltModel(BaseModel):
+    """Base for response models built from data the server itself produced."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+
+class _PayloadModel(BaseModel):
+    """Base for request bodies validated from client input."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class ProjectSummary(_ServerBuiltModel):
     """Summary information for a project."""
 
     project_id: str = Field(
@@ -25,11 +37,8 @@ class ProjectSummary(BaseModel):
         ..., description="Number of folders with dataset prefix (e.g., 'd_')"
     )
 
-    class Config:
-        from_attributes = True
 
-
-class DatasetSummary(BaseModel):
+class DatasetSummary(_ServerBuiltModel):
     """Summary information for a dataset."""
 
     dataset_id: str = Field(
@@ -43,8 +52,12 @@ class DatasetSummary(BaseModel):
         ..., description="The current metadata completion status, e.g., 'V1_Ingested'"
     )
 
-    class Config:
-        from_attributes = True
+
+# Adapters that serialize whole summary lists to JSON bytes in pydantic-core,
+# skipping FastAPI's per-item re-validation and jsonable_encoder pass
+_DEFERRED = ConfigDict(defer_build=True)
+PROJECTS_ADAPTER = TypeAdapter(List[ProjectSummary], config=_DEFERRED)
+DATASETS_ADAPTER = TypeAdapter(List[DatasetSummary], config=_DEFERRED)
 
 
 class ProjectDetail(ProjectSummary):
@@ -55,7 +68,7 @@ class ProjectDetail(ProjectSummary):
     )
 
 
-class SchemaInfo(BaseModel):
+class SchemaInfo(_ServerBuiltModel):
     """Information about a schema."""
 
     schema_id: str = Field(
@@ -75,7 +88,7 @@ class SchemaInfo(BaseModel):
     )
 
 
-class MetadataFile(BaseModel):
+class MetadataFile(_ServerBuiltModel):
     """Metadata file content with schema information."""
 
     content: Dict[str, Any] = Field(
@@ -90,7 +103,7 @@ class MetadataFile(BaseModel):
     )
 
 
-class MetadataUpdatePayload(BaseModel):
+class MetadataUpdatePayload(_PayloadModel):
     """Payload for updating metadata files."""
 
     content: Dict[str, Any] = Field(
@@ -98,7 +111,7 @@ class MetadataUpdatePayload(BaseModel):
     )
 
 
-class ContextualTemplatePayload(BaseModel):
+class ContextualTemplatePayload(_PayloadModel):
     """Payload for creating contextual templates."""
 
     schema_id: Optional[str] = Field(
@@ -107,7 +120,7 @@ class ContextualTemplatePayload(BaseModel):
     )
 
 
-class FinalizePayload(BaseModel):
+class FinalizePayload(_PayloadModel):
     """Payload for finalizing datasets."""
 
     experiment_id: str = Field(
@@ -115,7 +128,7 @@ class FinalizePayload(BaseModel):
     )
 
 
-class APIResponse(BaseModel):
+class APIResponse(_ServerBuiltModel):
     """Standard API response wrapper."""
 
     message: str = Field(..., description="Response message.")
@@ -124,7 +137,7 @@ class APIResponse(BaseModel):
     )
 
 
-class FileUploadResponse(BaseModel):
+class FileUploadResponse(_ServerBuiltModel):
     """Response for file upload operations."""
 
     message: str = Field(..., description="Upload status message.")
@@ -134,7 +147,7 @@ class FileUploadResponse(BaseModel):
     comment: Optional[str] = Field(None, description="Comment describing the uploaded file.")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(_ServerBuiltModel):
     """Standard error response."""
 
     error: str = Field(..., description="Error message.")
@@ -26,7 +26,7 @@ from app.core.exceptions import (
     MetadataValidationError,
     SchemaNotFoundError,
     PathNotFoundError,
-    PermissionError,
+    FSPermissionError,
     MDJourneyError,
     SecurityError,
     PathTraversalError,
@@ -581,8 +581,9 @@ class MetadataService:
 
         except (SecurityError, PathTraversalError) as e:
             raise SecurityError(f"Invalid dataset path: {str(e)}")
+        # The builtin PermissionError: OS permission failures become FSPermissionError
         except PermissionError as e:
-            raise PermissionError(self.monitor_path, "read", e)
+            raise FSPermissionError(self.monitor_path, "read", e)
         except Exception as e:
             raise MDJourneyError(
                 f"Error searching for dataset {dataset_id}",
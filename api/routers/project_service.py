@@ -7,9 +7,14 @@ import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import Any, List, Optional
-
-from api.models.pydantic_models import DatasetSummary, ProjectSummary
+from typing import Any, Dict, List, Optional
+
+from api.models.pydantic_models import (
+    DATASETS_ADAPTER,
+    PROJECTS_ADAPTER,
+    DatasetSummary,
+    ProjectSummary,
+)
 from app.core.config import DATASET_PREFIX, METADATA_SUBDIR, PROJECT_PREFIX, get_monitor_path
 from app.core.cache import cached, get_project_cache
 from app.services.metadata_generator import get_metadata_generator
@@ -31,7 +36,7 @@ class ProjectService:
     @cached(ttl_seconds=60, cache_type="memory")  # Cache project list for 1 minute
     async def list_projects(self) -> List[ProjectSummary]:
         """List all available projects."""
-        projects: List[ProjectSummary] = []
+        rows: List[Dict[str, Any]] = []
 
         logger.debug(f"ProjectService: monitor_path = {self.monitor_path}")
         logger.debug(f"ProjectService: monitor_path.exists() = {self.monitor_path.exists()}")
@@ -39,7 +44,7 @@ class ProjectService:
 
         if not self.monitor_path.exists():
             logger.warning("ProjectService: Monitor path does not exist!")
-            return projects
+            return []
 
         logger.debug(f"ProjectService: Scanning directory contents:")
 
@@ -64,16 +69,18 @@ class ProjectService:
                None, self._count_folders_and_datasets, project_path
             )
 
-            project_summary = ProjectSummary(
-                project_id=project_id,
-                project_title=project_title,
-                path=str(project_path.absolute()),
-                folder_count=folder_count,
-                dataset_count=dataset_count,
-            )
-            logger.debug(f"ProjectService: Adding project: {project_summary}")
-            projects.append(project_summary)
-
+            row = {
+                "project_id": project_id,
+                "project_title": project_title,
+                "path": str(project_path.absolute()),
+                "folder_count": folder_count,
+                "dataset_count": dataset_count,
+            }
+            logger.debug(f"ProjectService: Adding project: {row}")
+            rows.append(row)
+
+        # Validate the whole list in a single pydantic-core call
+        projects = PROJECTS_ADAPTER.validate_python(rows)
         logger.debug(f"ProjectService: Returning {len(projects)} projects")
         return projects
 
@@ -115,7 +122,7 @@ class ProjectService:
     @cached(ttl_seconds=120, cache_type="memory")  # Cache dataset list for 2 minutes
     async def get_project_datasets(self, project_id: str) -> List[DatasetSummary]:
         """List all datasets within a specific project."""
-        datasets = []
+        rows: List[Dict[str, Any]] = []
 
         project_path = self.monitor_path / project_id
         if not project_path.exists() or not project_path.is_dir():
@@ -136,16 +143,17 @@ class ProjectService:
                 None, self._get_dataset_info, dataset_path
             )
 
-            datasets.append(
-                DatasetSummary(
-                    dataset_id=dataset_id,
-                    dataset_title=dataset_title,
-                    path=str(dataset_path.absolute()),
-                    metadata_status=metadata_status,
-                )
+            rows.append(
+                {
+                    "dataset_id": dataset_id,
+                    "dataset_title": dataset_title,
+                    "path": str(dataset_path.absolute()),
+                    "metadata_status": metadata_status,
+                }
             )
 
-        return datasets
+        # Validate the whole list in a single pydantic-core call
+        return DATASETS_ADAPTER.validate_python(rows)
 
     def _scan_dataset_directories(self, project_path: Path) -> List[Path]:
         """Scan for dataset directories (sync function for thread pool)."""
@@ -4,10 +4,13 @@ Handles API key authentication and role-based access control.
 """
 
 import os
+import re
 import secrets
 import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Pattern, Set, Tuple
 from functools import wraps
 
 from fastapi import HTTPException, Depends, Request
@@ -15,12 +18,49 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.core.exceptions import SecurityError, AuthenticationError
 
+# Proxy headers consulted by get_client_ip
+_FORWARDED_FOR_HEADER = "X-Forwarded-For"
+_REAL_IP_HEADER = "X-Real-IP"
+
+# Read once at import time; changing ENABLE_AUTHENTICATION requires a restart
+_AUTH_DISABLED = os.getenv('ENABLE_AUTHENTICATION', 'false').lower() == 'false'
+
+# Identity used for every request while authentication is disabled; shared
+# across requests, so it is read-only
+_LOCAL_USER: Mapping[str, Any] = MappingProxyType({
+    'name': 'local_user',
+    'roles': ('admin',),
+    'created_at': None,
+    'last_used': None
+})
+
+
+# Server secret keying the API key digests. Keys are loaded from the
+# environment on startup, so a per-process fallback is enough when
+# MDJOURNEY_API_KEY_PEPPER is unset; set it to keep digests stable.
+_API_KEY_PEPPER = (
+    hashlib.blake2b(os.environ['MDJOURNEY_API_KEY_PEPPER'].encode(), digest_size=32).digest()
+    if os.environ.get('MDJOURNEY_API_KEY_PEPPER')
+    else secrets.token_bytes(32)
+)
+
+
+def _hash_api_key(api_key: str) -> bytes:
+    """Return the keyed digest under which an API key is stored and looked up."""
+    return hashlib.blake2b(api_key.encode(), digest_size=16, key=_API_KEY_PEPPER).digest()
+
 
 class APIKeyManager:
-    """Manages API keys for authentication."""
+    """Manages API keys for authentication.
+
+    Keys are stored by their keyed BLAKE2b digest, never in plaintext. Last-use
+    times are tracked separately so validation never mutates key records.
+    """
 
     def __init__(self):
-        self._api_keys: Dict[str, Dict] = {}
+        self._api_keys: Dict[bytes, Dict] = {}
+        # Key digest -> time.time_ns() of the most recent successful validation
+        self._last_used: Dict[bytes, int] = {}
         self._load_api_keys()
 
     def _load_api_keys(self):
@@ -28,11 +68,10 @@ class APIKeyManager:
         # In production, this should load from a secure database
         api_key = os.getenv('MDJOURNEY_API_KEY')
         if api_key:
-            self._api_keys[api_key] = {
+            self._api_keys[_hash_api_key(api_key)] = {
                 'name': 'default',
                 'roles': ['admin'],
                 'created_at': datetime.utcnow(),
-                'last_used': None
             }
 
     def generate_api_key(self, name: str, roles: List[str]) -> str:
@@ -47,11 +86,10 @@ class APIKeyManager:
             Generated API key
         """
         api_key = secrets.token_urlsafe(32)
-        self._api_keys[api_key] = {
+        self._api_keys[_hash_api_key(api_key)] = {
             'name': name,
             'roles': roles,
             'created_at': datetime.utcnow(),
-            'last_used': None
         }
         return api_key
 
@@ -65,11 +103,26 @@ class APIKeyManager:
         Returns:
             Key information if valid, None otherwise
         """
-        if api_key in self._api_keys:
-            key_info = self._api_keys[api_key]
-            key_info['last_used'] = datetime.utcnow()
-            return key_info
-        return None
+        key_hash = _hash_api_key(api_key)
+        key_info = self._api_keys.get(key_hash)
+        if key_info is not None:
+            self._last_used[key_hash] = time.time_ns()
+        return key_info
+
+    def get_last_used(self, api_key: str) -> Optional[datetime]:
+        """
+        Get when an API key was last validated.
+
+        Args:
+            api_key: The API key to look up
+
+        Returns:
+            UTC time of the last successful validation, or None if never used
+        """
+        last_used = self._last_used.get(_hash_api_key(api_key))
+        if last_used is None:
+            return None
+        return datetime.utcfromtimestamp(last_used / 1_000_000_000)
 
     def revoke_api_key(self, api_key: str) -> bool:
         """
@@ -81,10 +134,39 @@ class APIKeyManager:
         Returns:
             True if revoked, False if not found
         """
-        if api_key in self._api_keys:
-            del self._api_keys[api_key]
-            return True
-        return False
+        key_hash = _hash_api_key(api_key)
+        self._last_used.pop(key_hash, None)
+        return self._api_keys.pop(key_hash, None) is not None
+
+
+_PATH_PARAMETER = re.compile(r'\{[^/}]+\}')
+
+
+def _compile_endpoint_permissions(
+    endpoint_permissions: Dict[str, str]
+) -> Dict[str, List[Tuple[Pattern[str], str]]]:
+    """
+    Compile 'METHOD /path/{param}' keys into per-method path regexes.
+
+    Args:
+        endpoint_permissions: Mapping of endpoint templates to permissions
+
+    Returns:
+        Mapping of HTTP method to (compiled path pattern, permission) pairs
+    """
+    compiled: Dict[str, List[Tuple[Pattern[str], str]]] = {}
+    for endpoint, permission in endpoint_permissions.items():
+        method, template = endpoint.split(' ', 1)
+        literals = _PATH_PARAMETER.split(template)
+        pattern = '[^/]+'.join(re.escape(literal) for literal in literals)
+        compiled.setdefault(method, []).append(
+            (re.compile(pattern + r'\Z'), permission)
+        )
+    return compiled
+
+
+# Permissions of a role missing from RoleBasedAccessControl.ROLES
+_NO_PERMISSIONS: FrozenSet[str] = frozenset()
 
 
 class RoleBasedAccessControl:
@@ -124,6 +206,15 @@ class RoleBasedAccessControl:
         'POST /api/v1/config/reload': 'manage',
     }
 
+    # Flat role -> permission set built once from ROLES, so a check is one
+    # dict lookup and one set membership test per role
+    _ROLE_PERMS: Dict[str, FrozenSet[str]] = {
+        role: frozenset(info['permissions']) for role, info in ROLES.items()
+    }
+
+    # ENDPOINT_PERMISSIONS compiled once so templated paths match real requests
+    _ENDPOINT_PATTERNS = _compile_endpoint_permissions(ENDPOINT_PERMISSIONS)
+
     @classmethod
     def has_permission(cls, user_roles: List[str], required_permission: str) -> bool:
         """
@@ -136,11 +227,11 @@ class RoleBasedAccessControl:
         Returns:
             True if user has permission, False otherwise
         """
-        for role in user_roles:
-            if role in cls.ROLES:
-                if required_permission in cls.ROLES[role]['permissions']:
-                    return True
-        return False
+        role_perms = cls._ROLE_PERMS
+        return any(
+            required_permission in role_perms.get(role, _NO_PERMISSIONS)
+            for role in user_roles
+        )
 
     @classmethod
     def get_endpoint_permission(cls, method: str, path: str) -> Optional[str]:
@@ -154,8 +245,10 @@ class RoleBasedAccessControl:
         Returns:
             Required permission or None if no permission required
         """
-        endpoint_key = f"{method} {path}"
-        return cls.ENDPOINT_PERMISSIONS.get(endpoint_key)
+        for pattern, permission in cls._ENDPOINT_PATTERNS.get(method, ()):
+            if pattern.match(path):
+                return permission
+        return None
 
 
 # Global instances
@@ -163,11 +256,15 @@ api_key_manager = APIKeyManager()
 security_scheme = HTTPBearer()
 
 
-def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_scheme)) -> Dict:
+def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_scheme)) -> Mapping[str, Any]:
     """
     Get current authenticated user from API key.
     Returns a default user if authentication is disabled.
 
+    Endpoints guarded by require_permission or require_auth must bind this
+    dependency as ``user_info`` or ``current_user``, e.g.
+    ``user_info: Dict = Depends(get_current_user)``.
+
     Args:
         credentials: HTTP Bearer credentials
 
@@ -178,13 +275,8 @@ def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depen
         HTTPException: If authentication fails and is enabled
     """
     # Check if authentication is disabled
-    if os.getenv('ENABLE_AUTHENTICATION', 'false').lower() == 'false':
-        return {
-            'name': 'local_user',
-            'roles': ['admin'],
-            'created_at': datetime.utcnow(),
-            'last_used': datetime.utcnow()
-        }
+    if _AUTH_DISABLED:
+        return _LOCAL_USER
 
     if not credentials:
         raise HTTPException(
@@ -210,6 +302,9 @@ def require_permission(permission: str):
     """
     Decorator to require specific permission for an endpoint.
 
+    The endpoint must take the authenticated user as the ``user_info`` or
+    ``current_user`` keyword argument (see get_current_user).
+
     Args:
         permission: Required permission
 
@@ -219,12 +314,8 @@ def require_permission(permission: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Extract user info from dependencies
-            user_info = None
-            for arg in args:
-                if isinstance(arg, dict) and 'roles' in arg:
-                    user_info = arg
-                    break
+            # FastAPI passes dependencies as keyword arguments
+            user_info = kwargs.get('user_info') or kwargs.get('current_user')
 
             if not user_info:
                 raise HTTPException(
@@ -277,11 +368,12 @@ def get_client_ip(request: Request) -> str:
         Client IP address
     """
     # Check for forwarded headers first
-    forwarded_for = request.headers.get("X-Forwarded-For")
+    forwarded_for = request.headers.get(_FORWARDED_FOR_HEADER)
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+        # The client is the first hop; no need to split the whole chain
+        return forwarded_for.partition(",")[0].strip()
 
-    real_ip = request.headers.get("X-Real-IP")
+    real_ip = request.headers.get(_REAL_IP_HEADER)
     if real_ip:
         return real_ip
 
@@ -290,7 +382,7 @@ def get_client_ip(request: Request) -> str:
 
 
 # Optional authentication dependency for endpoints that can work with or without auth
-def get_optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))) -> Optional[Dict]:
+def get_optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))) -> Optional[Mapping[str, Any]]:
     """
     Get current user if authenticated, None otherwise.
     Returns a default user if authentication is disabled.
@@ -302,13 +394,8 @@ def get_optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depe
         User information dictionary or None
     """
     # Check if authentication is disabled
-    if os.getenv('ENABLE_AUTHENTICATION', 'false').lower() == 'false':
-        return {
-            'name': 'local_user',
-            'roles': ['admin'],
-            'created_at': datetime.utcnow(),
-            'last_used': datetime.utcnow()
-        }
+    if _AUTH_DISABLED:
+        return _LOCAL_USER
 
     if not credentials:
         return None
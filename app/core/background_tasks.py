@@ -4,8 +4,17 @@ Handles asynchronous file processing and metadata generation tasks.
 """
 
 import asyncio
+import functools
+import heapq
+import itertools
 import logging
-from typing import Any, Callable, Dict, List, Optional, Set
+import multiprocessing
+import os
+import sys
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -22,20 +31,63 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Statuses a task never leaves
+_TERMINAL_STATUSES = frozenset(
+    {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+)
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() value to an aware UTC datetime."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+        microsecond=nanoseconds // 1000
+    )
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class BackgroundTask:
-    """Represents a background task."""
+    """Represents a background task.
+
+    Timestamps are stored as nanoseconds since the epoch (``time.time_ns()``);
+    use the ``*_dt`` properties when a datetime is needed for display.
+    """
     task_id: str
     task_type: str
     status: TaskStatus
-    created_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_at: int
+    started_at: Optional[int] = None
+    completed_at: Optional[int] = None
     result: Optional[Any] = None
     error: Optional[str] = None
     progress: float = 0.0
     metadata: Optional[Dict[str, Any]] = None
 
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as an aware UTC datetime."""
+        return _ns_to_datetime(self.created_at)
+
+    @property
+    def started_at_dt(self) -> Optional[datetime]:
+        """Start time as an aware UTC datetime, if the task has started."""
+        if self.started_at is None:
+            return None
+        return _ns_to_datetime(self.started_at)
+
+    @property
+    def completed_at_dt(self) -> Optional[datetime]:
+        """Completion time as an aware UTC datetime, if the task has finished."""
+        if self.completed_at is None:
+            return None
+        return _ns_to_datetime(self.completed_at)
+
 
 class BackgroundTaskManager:
     """Manages background tasks for the FAIR system."""
@@ -49,27 +101,47 @@ class BackgroundTaskManager:
         """
         self.max_concurrent_tasks = max_concurrent_tasks
         self.tasks: Dict[str, BackgroundTask] = {}
+        # (creation timestamp, task) in submission order, oldest first
+        self._created_order: Deque[Tuple[int, BackgroundTask]] = deque()
+        # Secondary indexes over self.tasks, kept in step by _set_status
+        self._by_status: Dict[TaskStatus, Dict[str, BackgroundTask]] = {
+            status: {} for status in TaskStatus
+        }
+        self._by_type: Dict[str, Dict[str, BackgroundTask]] = defaultdict(dict)
         self.running_tasks: Set[str] = set()
         self.task_queue: asyncio.Queue = asyncio.Queue()
-        self.semaphore = asyncio.Semaphore(max_concurrent_tasks)
-        self._worker_task: Optional[asyncio.Task] = None
+        self._workers: List[asyncio.Task] = []
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
         self._shutdown_event = asyncio.Event()
 
     async def start(self) -> None:
         """Start the background task manager."""
-        if self._worker_task is None or self._worker_task.done():
-            self._worker_task = asyncio.create_task(self._worker_loop())
+        if all(worker.done() for worker in self._workers):
+            self._shutdown_event.clear()
+            # One consumer per concurrency slot; each pulls from the shared queue
+            self._workers = [
+                asyncio.create_task(self._worker_loop())
+                for _ in range(self.max_concurrent_tasks)
+            ]
             logger.info("Background task manager started")
 
     async def stop(self) -> None:
         """Stop the background task manager."""
         self._shutdown_event.set()
-        if self._worker_task and not self._worker_task.done():
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for pool in (self._process_pool, self._thread_pool):
+            if pool is None:
+                continue
+            if sys.version_info >= (3, 9):
+                pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                pool.shutdown(wait=False)
+        self._process_pool = None
+        self._thread_pool = None
         logger.info("Background task manager stopped")
 
     async def submit_task(
@@ -89,7 +161,9 @@ class BackgroundTaskManager:
             task_type: Type of task (e.g., "file_processing", "metadata_generation")
             func: Function to execute
             *args: Arguments for the function
-            metadata: Additional metadata for the task
+            metadata: Additional metadata for the task. Set ``cpu_bound`` to
+                True to run a sync function in a worker process instead of a
+                thread; the function and its arguments must then be picklable.
             **kwargs: Keyword arguments for the function
 
         Returns:
@@ -102,11 +176,14 @@ class BackgroundTaskManager:
             task_id=task_id,
             task_type=task_type,
             status=TaskStatus.PENDING,
-            created_at=datetime.now(timezone.utc),
+            created_at=time.time_ns(),
             metadata=metadata or {}
         )
 
         self.tasks[task_id] = task
+        self._by_status[task.status][task_id] = task
+        self._by_type[task_type][task_id] = task
+        self._created_order.append((task.created_at, task))
 
         # Add task to queue
         await self.task_queue.put((task_id, func, args, kwargs))
@@ -140,11 +217,11 @@ class BackgroundTaskManager:
         if not task:
             return False
 
-        if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
+        if task.status in _TERMINAL_STATUSES:
             return False
 
-        task.status = TaskStatus.CANCELLED
-        task.completed_at = datetime.now(timezone.utc)
+        self._set_status(task, TaskStatus.CANCELLED)
+        task.completed_at = time.time_ns()
 
         logger.info(f"Cancelled task {task_id}")
         return True
@@ -166,18 +243,34 @@ class BackgroundTaskManager:
         Returns:
             List of tasks
         """
-        tasks = list(self.tasks.values())
-
-        if task_type:
-            tasks = [t for t in tasks if t.task_type == task_type]
-
+        if not status and not task_type:
+            # Submission order is creation order, so the newest tasks are at
+            # the end; skip entries for tasks that have since been removed
+            live = (
+                task
+                for _, task in reversed(self._created_order)
+                if self.tasks.get(task.task_id) is task
+            )
+            return list(itertools.islice(live, limit))
+
+        # Start from the smallest index that satisfies the filters
+        candidates: Dict[str, BackgroundTask] = self.tasks
         if status:
-            tasks = [t for t in tasks if t.status == status]
-
-        # Sort by creation time (newest first)
-        tasks.sort(key=lambda t: t.created_at, reverse=True)
+            candidates = self._by_status[status]
+        if task_type:
+            by_type = self._by_type.get(task_type, {})
+            if len(by_type) < len(candidates):
+                candidates = by_type
+
+        tasks = (
+            t
+            for t in reversed(candidates.values())
+            if (not task_type or t.task_type == task_type)
+            and (not status or t.status == status)
+        )
 
-        return tasks[:limit]
+        # Newest first by creation time
+        return heapq.nlargest(limit, tasks, key=lambda t: t.created_at)
 
     async def cleanup_old_tasks(self, max_age_hours: int = 24) -> int:
         """
@@ -189,46 +282,62 @@ class BackgroundTaskManager:
         Returns:
             Number of tasks cleaned up
         """
-        cutoff_time = datetime.now(timezone.utc).timestamp() - (max_age_hours * 3600)
-
-        tasks_to_remove = []
-        for task_id, task in self.tasks.items():
-            if (task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]
-                and task.created_at.timestamp() < cutoff_time):
-                tasks_to_remove.append(task_id)
-
-        for task_id in tasks_to_remove:
-            del self.tasks[task_id]
+        cutoff_time = time.time_ns() - max_age_hours * 3600 * 1_000_000_000
+
+        # Only the oldest entries can have expired, so stop at the first
+        # task inside the window; old tasks still in flight are kept
+        removed = 0
+        retained = []
+        while self._created_order and self._created_order[0][0] < cutoff_time:
+            entry = self._created_order.popleft()
+            task = entry[1]
+            if self.tasks.get(task.task_id) is not task:
+                continue
+            if task.status in _TERMINAL_STATUSES:
+                self._remove_task(task)
+                removed += 1
+            else:
+                retained.append(entry)
+        self._created_order.extendleft(reversed(retained))
 
-        logger.info(f"Cleaned up {len(tasks_to_remove)} old tasks")
-        return len(tasks_to_remove)
+        logger.info(f"Cleaned up {removed} old tasks")
+        return removed
 
     async def _worker_loop(self) -> None:
         """Main worker loop for processing tasks."""
         logger.info("Background task worker started")
 
-        while not self._shutdown_event.is_set():
-            try:
-                # Wait for a task with timeout
+        # Sleep until either a task is queued or shutdown is signalled
+        shutdown = asyncio.ensure_future(self._shutdown_event.wait())
+        get_item: Optional[asyncio.Future] = None
+        try:
+            while True:
                 try:
-                    task_id, func, args, kwargs = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=1.0
+                    get_item = asyncio.ensure_future(self.task_queue.get())
+                    done, _ = await asyncio.wait(
+                        {get_item, shutdown}, return_when=asyncio.FIRST_COMPLETED
                     )
-                except asyncio.TimeoutError:
-                    continue
-
-                # Check if task was cancelled
-                task = self.tasks.get(task_id)
-                if not task or task.status == TaskStatus.CANCELLED:
-                    continue
+                    if shutdown in done:
+                        # Leave an item dequeued in the same step for a restart
+                        if get_item in done:
+                            self.task_queue.put_nowait(get_item.result())
+                        break
+                    task_id, func, args, kwargs = get_item.result()
+
+                    # Check if task was cancelled
+                    task = self.tasks.get(task_id)
+                    if not task or task.status == TaskStatus.CANCELLED:
+                        continue
 
-                # Acquire semaphore to limit concurrent tasks
-                async with self.semaphore:
                     await self._execute_task(task_id, func, args, kwargs)
 
-            except Exception as e:
-                logger.error(f"Error in background task worker: {e}")
-                await asyncio.sleep(1)  # Brief pause before retrying
+                except Exception as e:
+                    logger.error(f"Error in background task worker: {e}")
+                    await asyncio.sleep(1)  # Brief pause before retrying
+        finally:
+            shutdown.cancel()
+            if get_item is not None:
+                get_item.cancel()
 
         logger.info("Background task worker stopped")
 
@@ -246,8 +355,8 @@ class BackgroundTaskManager:
 
         try:
             # Update task status
-            task.status = TaskStatus.RUNNING
-            task.started_at = datetime.now(timezone.utc)
+            self._set_status(task, TaskStatus.RUNNING)
+            task.started_at = time.time_ns()
             self.running_tasks.add(task_id)
 
             logger.info(f"Starting task {task_id}")
@@ -256,13 +365,20 @@ class BackgroundTaskManager:
             if asyncio.iscoroutinefunction(func):
                 result = await func(*args, **kwargs)
             else:
-                # Run sync function in thread pool
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, func, *args, **kwargs)
+                # Run sync function in a worker process if CPU-bound, else a thread
+                executor: Executor
+                if task.metadata and task.metadata.get("cpu_bound"):
+                    executor = self._get_process_pool()
+                else:
+                    executor = self._get_thread_pool()
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    executor, functools.partial(func, *args, **kwargs)
+                )
 
             # Update task completion
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.now(timezone.utc)
+            self._set_status(task, TaskStatus.COMPLETED)
+            task.completed_at = time.time_ns()
             task.result = result
             task.progress = 100.0
 
@@ -270,8 +386,8 @@ class BackgroundTaskManager:
 
         except Exception as e:
             # Update task failure
-            task.status = TaskStatus.FAILED
-            task.completed_at = datetime.now(timezone.utc)
+            self._set_status(task, TaskStatus.FAILED)
+            task.completed_at = time.time_ns()
             task.error = str(e)
 
             logger.error(f"Task {task_id} failed: {e}")
@@ -279,15 +395,54 @@ class BackgroundTaskManager:
         finally:
             self.running_tasks.discard(task_id)
 
+    def _set_status(self, task: BackgroundTask, status: TaskStatus) -> None:
+        """Move a task to a new status, keeping the status index current."""
+        self._by_status[task.status].pop(task.task_id, None)
+        task.status = status
+        self._by_status[status][task.task_id] = task
+
+    def _remove_task(self, task: BackgroundTask) -> None:
+        """Drop a task from the task table and its indexes."""
+        del self.tasks[task.task_id]
+        self._by_status[task.status].pop(task.task_id, None)
+        by_type = self._by_type[task.task_type]
+        by_type.pop(task.task_id, None)
+        if not by_type:
+            del self._by_type[task.task_type]
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """Create the thread pool for sync tasks on first use."""
+        if self._thread_pool is None:
+            # At most max_concurrent_tasks tasks run at once, so one thread
+            # per worker is enough and other run_in_executor users can't
+            # starve the task queue (or be starved by it)
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_tasks,
+                thread_name_prefix="mdjourney-task",
+            )
+        return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Create the process pool for CPU-bound tasks on first use."""
+        if self._process_pool is None:
+            # spawn avoids forking a process that is running an event loop
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
+
     async def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the task manager."""
         total_tasks = len(self.tasks)
         running_tasks = len(self.running_tasks)
         pending_tasks = self.task_queue.qsize()
 
-        status_counts = {}
-        for task in self.tasks.values():
-            status_counts[task.status.value] = status_counts.get(task.status.value, 0) + 1
+        status_counts = {
+            status.value: len(tasks)
+            for status, tasks in self._by_status.items()
+            if tasks
+        }
 
         return {
             "total_tasks": total_tasks,
@@ -3,9 +3,15 @@ Enhanced Configuration module for the FAIR metadata automation system.
 Centralizes all global settings, paths, and configuration constants with environment support.
 """
 
+import itertools
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
 
 # --- Global State Variables (populated at runtime) ---
 MONITOR_PATH: Optional[Path] = None
@@ -47,6 +53,30 @@ DATASET_ADMIN_FILENAME = "dataset_administrative.json"
 DATASET_STRUCT_FILENAME = "dataset_structural.json"
 EXPERIMENT_CONTEXTUAL_FILENAME = "experiment_contextual.json"
 
+# Friendly schemas.path_overrides keys -> schema filenames they override
+_SCHEMA_KEY_TO_FILENAME: Dict[str, str] = {
+    "project_descriptive": "project_descriptive.json",
+    "dataset_administrative": "dataset_administrative_schema.json",
+    "dataset_structural": "dataset_structural_schema.json",
+    "experiment_contextual": "experiment_contextual_schema.json",
+    "instrument_technical": "instrument_technical_schema.json",
+    "complete_metadata": "complete_metadata_schema.json",
+}
+
+# Schema filename -> resolved location, defaults plus any path overrides;
+# built at import and rebuilt by initialize_config
+_SCHEMA_BASE = Path(SCHEMA_BASE_PATH)
+_DEFAULT_SCHEMA_PATHS: Dict[str, Path] = {
+    filename: _SCHEMA_BASE / filename for filename in _SCHEMA_KEY_TO_FILENAME.values()
+}
+_RESOLVED_SCHEMA_PATHS: Dict[str, Path] = dict(_DEFAULT_SCHEMA_PATHS)
+
+# Configuration file names searched for by find_config_file, in order
+_CONFIG_NAMES = (".fair_meta_config.yaml",)
+
+# Working directory -> configuration file found from it by find_config_file
+_CONFIG_FILE_CACHE: Dict[Path, Path] = {}
+
 
 def initialize_config(config_path: str) -> bool:
     """
@@ -62,22 +92,24 @@ def initialize_config(config_path: str) -> bool:
 
     try:
         global CONFIG_MANAGER, MONITOR_PATH, CUSTOM_SCHEMA_PATH, SCHEMA_PATH_OVERRIDES
+        global _RESOLVED_SCHEMA_PATHS
 
         # Initialize the enhanced config manager
         CONFIG_MANAGER = ConfigManager(config_path)
+        _clear_caches()
         settings = CONFIG_MANAGER.load_config()
 
         # Validate configuration
         is_valid, errors = CONFIG_MANAGER.validate_config()
         if not is_valid:
-            print("Configuration validation errors:")
+            logger.error("Configuration validation errors:")
             for error in errors:
-                print(f"  - {error}")
+                logger.error("  - %s", error)
             return False
 
         # Validate required settings
         if not CONFIG_MANAGER.get_setting('monitor_path'):
-            print("Error: 'monitor_path' is required in configuration")
+            logger.error("'monitor_path' is required in configuration")
             return False
 
         # Populate global state variables
@@ -85,8 +117,8 @@ def initialize_config(config_path: str) -> bool:
 
         # Handle environment variable overrides with warnings
         if os.environ.get("MDJOURNEY_DATA_PATH"):
-            print(
-                "Note: MDJOURNEY_DATA_PATH is set but ignored; using monitor_path from configuration"
+            logger.info(
+                "MDJOURNEY_DATA_PATH is set but ignored; using monitor_path from configuration"
             )
 
         custom_path_setting = CONFIG_MANAGER.get_setting('schemas.custom_path')
@@ -99,50 +131,67 @@ def initialize_config(config_path: str) -> bool:
         # Handle schema path overrides
         SCHEMA_PATH_OVERRIDES = {}
         schema_paths_cfg = CONFIG_MANAGER.get_setting('schemas.path_overrides', {}) or {}
-        if isinstance(schema_paths_cfg, dict):
-            # Map friendly keys to actual schema filenames
-            key_to_filename = {
-                "project_descriptive": "project_descriptive.json",
-                "dataset_administrative": "dataset_administrative_schema.json",
-                "dataset_structural": "dataset_structural_schema.json",
-                "experiment_contextual": "experiment_contextual_schema.json",
-                "instrument_technical": "instrument_technical_schema.json",
-                "complete_metadata": "complete_metadata_schema.json",
-            }
+        if isinstance(schema_paths_cfg, Mapping):
+            # Relative overrides are resolved against the config file's
+            # directory; resolve that once and join the rest as strings
+            config_dir = None
             for key, path_str in schema_paths_cfg.items():
                 try:
-                    override_path = Path(path_str)
-                    if not override_path.is_absolute():
-                        # Resolve relative to config file location
-                        override_path = (
-                            Path(config_path).parent / override_path
-                        ).resolve()
+                    if os.path.isabs(path_str):
+                        override_path = Path(path_str)
+                    else:
+                        if config_dir is None:
+                            config_dir = os.path.realpath(
+                                os.path.dirname(config_path) or os.curdir
+                            )
+                        override_path = Path(
+                            os.path.normpath(os.path.join(config_dir, path_str))
+                        )
                     # Determine the schema filename this override applies to
-                    filename = key_to_filename.get(key, None)
-                    if filename is None:
-                        # If key looks like a filename, use it directly
-                        filename = Path(key).name
+                    # (a key that looks like a filename is used directly)
+                    filename = _SCHEMA_KEY_TO_FILENAME.get(key) or Path(key).name
                     SCHEMA_PATH_OVERRIDES[filename] = override_path
                 except Exception:
                     continue
+        _RESOLVED_SCHEMA_PATHS = {**_DEFAULT_SCHEMA_PATHS, **SCHEMA_PATH_OVERRIDES}
 
         # Validate paths
-        if not MONITOR_PATH.exists():
-            print(f"Warning: Monitor path does not exist: {MONITOR_PATH}")
-            print("Creating monitor directory...")
-            MONITOR_PATH.mkdir(parents=True, exist_ok=True)
+        # mkdir both checks and creates, so an existing path costs one call
+        try:
+            MONITOR_PATH.mkdir(parents=True)
+        except FileExistsError:
+            pass
+        else:
+            logger.warning("Monitor path did not exist; created %s", MONITOR_PATH)
 
         if CUSTOM_SCHEMA_PATH and not CUSTOM_SCHEMA_PATH.exists():
-            print(f"Warning: Custom schema path does not exist: {CUSTOM_SCHEMA_PATH}")
+            logger.warning("Custom schema path does not exist: %s", CUSTOM_SCHEMA_PATH)
 
-        print(f"Configuration loaded successfully")
+        logger.info("Configuration loaded successfully")
         return True
 
     except Exception as e:
-        print(f"Error initializing configuration: {e}")
+        logger.error("Error initializing configuration: %s", e)
         return False
 
 
+# Marks a key that is absent from the configuration in the value cache
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _lookup_config_value(key: str) -> Any:
+    """Look up a setting once per configuration load; see _clear_caches."""
+    if CONFIG_MANAGER is None:
+        return _MISSING
+    return CONFIG_MANAGER.get_setting(key, _MISSING)
+
+
+def _clear_caches() -> None:
+    """Forget memoized configuration values after configuration changes."""
+    _lookup_config_value.cache_clear()
+
+
 def get_config_manager():
     """Get the global configuration manager instance."""
     if CONFIG_MANAGER is None:
@@ -156,6 +205,10 @@ def get_config_value(key: str, default_value: Any = None) -> Any:
     """
     Get a configuration value using dot notation.
 
+    Values are memoized until the configuration is re-initialized or
+    reloaded; settings changed directly through the ConfigManager become
+    visible after the next initialize_config/reload_config_from_environment.
+
     Args:
         key: Configuration key (e.g., 'api.port', 'logging.level')
         default_value: Default value if key doesn't exist
@@ -165,52 +218,58 @@ def get_config_value(key: str, default_value: Any = None) -> Any:
     """
     if CONFIG_MANAGER is None:
         return default_value
-    return CONFIG_MANAGER.get_setting(key, default_value)
+    value = _lookup_config_value(key)
+    return default_value if value is _MISSING else value
+
+
+# Configuration sections come back as read-only mappings and lists as tuples
+# (see ConfigManager.load_config); the defaults follow the same contract.
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
 
 
-def get_api_config() -> Dict[str, Any]:
+def get_api_config() -> Mapping[str, Any]:
     """Get API configuration."""
-    return get_config_value('api', {})
+    return get_config_value('api', _EMPTY_MAPPING)
 
 
-def get_security_config() -> Dict[str, Any]:
+def get_security_config() -> Mapping[str, Any]:
     """Get security configuration."""
-    return get_config_value('security', {})
+    return get_config_value('security', _EMPTY_MAPPING)
 
 
-def get_file_processing_config() -> Dict[str, Any]:
+def get_file_processing_config() -> Mapping[str, Any]:
     """Get file processing configuration."""
-    return get_config_value('file_processing', {})
+    return get_config_value('file_processing', _EMPTY_MAPPING)
 
 
-def get_logging_config() -> Dict[str, Any]:
+def get_logging_config() -> Mapping[str, Any]:
     """Get logging configuration."""
-    return get_config_value('logging', {})
+    return get_config_value('logging', _EMPTY_MAPPING)
 
 
-def get_version_control_config() -> Dict[str, Any]:
+def get_version_control_config() -> Mapping[str, Any]:
     """Get version control configuration."""
-    return get_config_value('version_control', {})
+    return get_config_value('version_control', _EMPTY_MAPPING)
 
 
-def get_monitor_config() -> Dict[str, Any]:
+def get_monitor_config() -> Mapping[str, Any]:
     """Get monitor configuration."""
-    return get_config_value('monitor', {})
+    return get_config_value('monitor', _EMPTY_MAPPING)
 
 
-def get_database_config() -> Dict[str, Any]:
+def get_database_config() -> Mapping[str, Any]:
     """Get database configuration."""
-    return get_config_value('database', {})
+    return get_config_value('database', _EMPTY_MAPPING)
 
 
-def get_redis_config() -> Dict[str, Any]:
+def get_redis_config() -> Mapping[str, Any]:
     """Get Redis configuration."""
-    return get_config_value('redis', {})
+    return get_config_value('redis', _EMPTY_MAPPING)
 
 
-def get_frontend_config() -> Dict[str, Any]:
+def get_frontend_config() -> Mapping[str, Any]:
     """Get frontend configuration."""
-    return get_config_value('frontend', {})
+    return get_config_value('frontend', _EMPTY_MAPPING)
 
 
 def get_environment() -> str:
@@ -240,14 +299,14 @@ def get_api_host() -> str:
     return get_config_value('api.host', '0.0.0.0')
 
 
-def get_cors_origins() -> list:
+def get_cors_origins() -> Sequence[str]:
     """Get CORS allowed origins."""
-    return get_config_value('api.cors.origins', ['http://localhost:5173'])
+    return get_config_value('api.cors.origins', ('http://localhost:5173',))
 
 
-def get_rate_limit_config() -> Dict[str, Any]:
+def get_rate_limit_config() -> Mapping[str, Any]:
     """Get rate limiting configuration."""
-    return get_config_value('security.rate_limiting', {})
+    return get_config_value('security.rate_limiting', _EMPTY_MAPPING)
 
 
 def get_checksum_algorithm() -> str:
@@ -265,9 +324,9 @@ def get_max_file_size() -> str:
     return get_config_value('file_processing.max_file_size', '100MB')
 
 
-def get_supported_formats() -> list:
+def get_supported_formats() -> Sequence[str]:
     """Get supported file formats."""
-    return get_config_value('file_processing.supported_formats', ['jpg', 'jpeg', 'png', 'tiff', 'tif', 'pdf', 'txt', 'csv', 'json', 'xml'])
+    return get_config_value('file_processing.supported_formats', ('jpg', 'jpeg', 'png', 'tiff', 'tif', 'pdf', 'txt', 'csv', 'json', 'xml'))
 
 
 def is_strict_validation() -> bool:
@@ -320,9 +379,9 @@ def get_monitor_recursive() -> bool:
     return get_config_value('monitor.recursive', True)
 
 
-def get_monitor_ignore_patterns() -> list:
+def get_monitor_ignore_patterns() -> Sequence[str]:
     """Get monitor ignore patterns."""
-    return get_config_value('monitor.ignore_patterns', ['.git', '.dvc', '__pycache__', '.DS_Store'])
+    return get_config_value('monitor.ignore_patterns', ('.git', '.dvc', '__pycache__', '.DS_Store'))
 
 
 def get_monitor_scan_interval() -> int:
@@ -375,8 +434,8 @@ def get_monitor_path() -> Path:
 
 
 def get_schema_path(schema_name: str) -> Path:
-    """Get the full path to a schema file."""
-    return Path(SCHEMA_BASE_PATH) / schema_name
+    """Get the full path to a schema file, honouring configured overrides."""
+    return _RESOLVED_SCHEMA_PATHS.get(schema_name) or _SCHEMA_BASE / schema_name
 
 
 def get_metadata_dir(base_path: Path) -> Path:
@@ -396,18 +455,20 @@ def reload_config_from_environment() -> bool:
     global MONITOR_PATH, CUSTOM_SCHEMA_PATH
 
     changed = False
+    _clear_caches()
+    reset_config_file_cache()
 
     monitor_path_override = os.environ.get("MDJOURNEY_DATA_PATH")
     if monitor_path_override:
         MONITOR_PATH = Path(monitor_path_override)
-        print(f"Reloaded monitor path from environment: {MONITOR_PATH}")
+        logger.info("Reloaded monitor path from environment: %s", MONITOR_PATH)
         MONITOR_PATH.mkdir(parents=True, exist_ok=True)
         changed = True
 
     custom_schema_override = os.environ.get("MDJOURNEY_SCHEMA_PATH")
     if custom_schema_override:
         CUSTOM_SCHEMA_PATH = Path(custom_schema_override)
-        print(f"Reloaded custom schema path from environment: {CUSTOM_SCHEMA_PATH}")
+        logger.info("Reloaded custom schema path from environment: %s", CUSTOM_SCHEMA_PATH)
         changed = True
 
     return changed
@@ -420,10 +481,11 @@ def set_monitor_path(path_str: str) -> bool:
         path = Path(path_str)
         path.mkdir(parents=True, exist_ok=True)
         MONITOR_PATH = path
-        print(f"Monitor path set programmatically: {MONITOR_PATH}")
+        _clear_caches()
+        logger.info("Monitor path set programmatically: %s", MONITOR_PATH)
         return True
     except Exception as e:
-        print(f"Failed to set monitor path: {e}")
+        logger.error("Failed to set monitor path: %s", e)
         return False
 
 
@@ -433,12 +495,13 @@ def set_custom_schema_path(path_str: str) -> bool:
     try:
         path = Path(path_str)
         if not path.exists():
-            print(f"Warning: Custom schema path does not exist: {path}")
+            logger.warning("Custom schema path does not exist: %s", path)
         CUSTOM_SCHEMA_PATH = path
-        print(f"Custom schema path set programmatically: {CUSTOM_SCHEMA_PATH}")
+        _clear_caches()
+        logger.info("Custom schema path set programmatically: %s", CUSTOM_SCHEMA_PATH)
         return True
     except Exception as e:
-        print(f"Failed to set custom schema path: {e}")
+        logger.error("Failed to set custom schema path: %s", e)
         return False
 
 
@@ -446,30 +509,52 @@ def find_config_file() -> Optional[Path]:
     """
     Find the configuration file by searching current directory and parent directories.
 
+    The location found from each working directory is remembered and only
+    re-checked with a single stat on later calls; misses are not cached, so a
+    configuration file created later is still picked up.
+
     Returns:
         Path to the configuration file if found, None otherwise.
     """
-    config_name = ".fair_meta_config.yaml"
     current_dir = Path.cwd()
+    cached = _CONFIG_FILE_CACHE.get(current_dir)
+    if cached is not None and cached.exists():
+        return cached
+
+    config_file = _search_config_file(current_dir)
+    if config_file is not None:
+        _CONFIG_FILE_CACHE[current_dir] = config_file
+    return config_file
+
+
+def reset_config_file_cache() -> None:
+    """Forget configuration file locations remembered by find_config_file."""
+    _CONFIG_FILE_CACHE.clear()
+
 
-    # Search current directory and parent directories
-    for directory in [current_dir] + list(current_dir.parents):
-        config_path = directory / config_name
-        if config_path.exists():
-            return config_path
+def _search_config_file(current_dir: Path) -> Optional[Path]:
+    """Search current_dir, its parents and the project root for a config file."""
+    # Search current directory and parent directories; plain strings and
+    # os.path.isfile keep this loop free of Path object construction
+    for directory in map(str, itertools.chain((current_dir,), current_dir.parents)):
+        for config_name in _CONFIG_NAMES:
+            config_path = os.path.join(directory, config_name)
+            if os.path.isfile(config_path):
+                return Path(config_path)
 
-        # Fallback: look for config inside a nested 'mdjourney' folder commonly used in this repo
-        nested_config = directory / "mdjourney" / config_name
-        if nested_config.exists():
-            return nested_config
+            # Fallback: look for config inside a nested 'mdjourney' folder commonly used in this repo
+            nested_config = os.path.join(directory, "mdjourney", config_name)
+            if os.path.isfile(nested_config):
+                return Path(nested_config)
 
     # Final fallback: resolve relative to this module location (project mdjourney root)
     try:
         this_file = Path(__file__).resolve()
         mdjourney_root = this_file.parent.parent.parent
-        cfg = mdjourney_root / config_name
-        if cfg.exists():
-            return cfg
+        for config_name in _CONFIG_NAMES:
+            cfg = mdjourney_root / config_name
+            if cfg.exists():
+                return cfg
     except Exception:
         pass
 
@@ -3,12 +3,76 @@ Configuration Manager for the FAIR metadata automation system.
 Handles reading from and writing to configuration files with variable substitution.
 """
 
+import logging
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 
-import yaml
+logger = logging.getLogger(__name__)
+
+# PyYAML, imported on first use by _import_yaml()
+_yaml: Any = None
+
+# Matches ${VAR_NAME} or ${VAR_NAME:-default}
+_ENV_VAR_RE = re.compile(r'\$\{([^}:]+)(?::-([^}]*))?\}')
+
+
+def _import_yaml() -> Any:
+    """Import PyYAML on first use so importing this module stays cheap."""
+    global _yaml
+    if _yaml is None:
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError(
+                "PyYAML is required to read and write configuration files. "
+                "Install with: pip install pyyaml"
+            ) from e
+        _yaml = yaml
+    return _yaml
+
+
+# Container type -> function yielding (key, child) pairs for the substitution
+# walk. Dispatch is on the exact type: the YAML safe loaders only build plain
+# dicts, lists and scalars, never subclasses.
+_CHILD_ITEMS = {dict: dict.items, list: enumerate}
+
+
+def _freeze(value: Any, flat: Optional[Dict[str, Any]] = None, prefix: str = "") -> Any:
+    """
+    Return a read-only copy of a loaded configuration value.
+
+    Dicts become MappingProxyType views and lists become tuples, so the
+    cached configuration can be shared between threads without copying.
+    If ``flat`` is given, every frozen dict entry reachable through dot
+    notation is also recorded there under its dotted key; keys that
+    themselves contain a dot cannot be addressed that way and are left out,
+    matching _get_nested_value.
+    """
+    if isinstance(value, dict):
+        frozen = {}
+        for key, item in value.items():
+            if flat is not None and isinstance(key, str) and "." not in key:
+                dotted = prefix + key
+                item = frozen[key] = _freeze(item, flat, dotted + ".")
+                flat[dotted] = item
+            else:
+                frozen[key] = _freeze(item)
+        return MappingProxyType(frozen)
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a mutable deep copy of a value produced by _freeze."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
 
 
 class ConfigManager:
@@ -22,15 +86,20 @@ class ConfigManager:
             config_path: Path to the configuration file (e.g., './.fair_meta_config.yaml')
         """
         self.config_path = Path(config_path)
-        self._config_cache: Optional[Dict[str, Any]] = None
+        # Read-only snapshot of the loaded configuration (see _freeze); it is
+        # replaced, never mutated, so readers need no locking
+        self._config_cache: Optional[Mapping[str, Any]] = None
+        # Dot-notation key -> value for every reachable setting in _config_cache
+        self._flat_cache: Optional[Dict[str, Any]] = None
 
-    def load_config(self) -> Dict[str, Any]:
+    def load_config(self) -> Mapping[str, Any]:
         """
         Load configuration from the YAML file.
 
         Returns:
-            Dictionary containing the loaded configuration.
-            Returns empty dictionary if file doesn't exist.
+            Read-only mapping containing the loaded configuration, with
+            lists exposed as tuples. Returns an empty read-only mapping if
+            the file doesn't exist or cannot be loaded.
         """
         if self._config_cache is not None:
             return self._config_cache
@@ -40,49 +109,78 @@ class ConfigManager:
             config = self._load_yaml_file(self.config_path)
 
             # Substitute environment variables
-            final_config = self._substitute_env_vars(config)
+            config = self._substitute_env_vars(config)
 
-            # Cache the result
-            self._config_cache = final_config
-            return final_config
+            # Cache a frozen snapshot, indexing keys in the same pass
+            self._set_cache(config)
+            return self._config_cache
 
         except Exception as e:
-            print(f"Warning: Could not load configuration: {e}")
-            return {}
+            logger.warning("Could not load configuration: %s", e)
+            return MappingProxyType({})
 
     def _load_yaml_file(self, file_path: Path) -> Dict[str, Any]:
         """Load a YAML file and return its contents as a dictionary."""
+        yaml = _import_yaml()
         try:
             with open(file_path, "r", encoding="utf-8") as file:
-                config: Dict[str, Any] = yaml.safe_load(file)
+                # libyaml's C loader when PyYAML was built with it; same
+                # safe-loading rules as yaml.safe_load
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                config: Dict[str, Any] = yaml.load(file, Loader=loader)
                 return config if config is not None else {}
         except (yaml.YAMLError, IOError) as e:
-            print(f"Warning: Could not load YAML file {file_path}: {e}")
+            logger.warning("Could not load YAML file %s: %s", file_path, e)
             return {}
 
 
-    def _substitute_env_vars(self, config: Union[Dict[str, Any], list, str, int, float, bool]) -> Any:
-        """Recursively substitute environment variables in configuration values."""
-        if isinstance(config, dict):
-            return {key: self._substitute_env_vars(value) for key, value in config.items()}
-        elif isinstance(config, list):
-            return [self._substitute_env_vars(item) for item in config]
-        elif isinstance(config, str):
-            return self._substitute_string_env_vars(config)
-        else:
+    def _substitute_env_vars(
+        self, config: Union[Dict[str, Any], list, str, int, float, bool]
+    ) -> Any:
+        """
+        Substitute environment variables in configuration values, in place.
+
+        The walk is iterative and only descends into dicts and lists; other
+        scalars are left untouched.
+        """
+        substitute = self._substitute_string_env_vars
+        if type(config) is str:
+            return substitute(config)
+        if type(config) not in _CHILD_ITEMS:
             return config
 
-    def _substitute_string_env_vars(self, value: str) -> str:
-        """Substitute environment variables in a string value."""
-        # Pattern to match ${VAR_NAME} or ${VAR_NAME:-default}
-        pattern = r'\$\{([^}:]+)(?::-([^}]*))?\}'
+        stack = [config]
+        while stack:
+            node = stack.pop()
+            for key, value in _CHILD_ITEMS[type(node)](node):
+                kind = type(value)
+                if kind is str:
+                    node[key] = substitute(value)
+                elif kind in _CHILD_ITEMS:
+                    stack.append(value)
+        return config
+
+    def _set_cache(self, config: Dict[str, Any]) -> None:
+        """Replace the cached snapshot and its lookup index."""
+        flat: Dict[str, Any] = {}
+        self._config_cache = _freeze(config, flat)
+        self._flat_cache = flat
+
+    def _substitute_string_env_vars(
+        self, value: str, env: Optional[Mapping[str, str]] = None
+    ) -> str:
+        """Substitute environment variables in a string value (default: os.environ)."""
+        if '${' not in value:
+            return value
+        if env is None:
+            env = os.environ
 
         def replace_var(match):
             var_name = match.group(1)
             default_value = match.group(2) if match.group(2) is not None else ""
-            return os.getenv(var_name, default_value)
+            return env.get(var_name, default_value)
 
-        return re.sub(pattern, replace_var, value)
+        return _ENV_VAR_RE.sub(replace_var, value)
 
     def load_template_config(self) -> str:
         """
@@ -99,12 +197,12 @@ class ConfigManager:
                 return file.read()
 
         except (IOError, UnicodeDecodeError) as e:
-            print(
-                f"Warning: Could not load template configuration from {self.config_path}: {e}"
+            logger.warning(
+                "Could not load template configuration from %s: %s", self.config_path, e
             )
             return ""
 
-    def save_config(self, settings_dict: Dict[str, Any]) -> bool:
+    def save_config(self, settings_dict: Mapping[str, Any]) -> bool:
         """
         Save configuration to the YAML file.
 
@@ -114,17 +212,26 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise.
         """
+        yaml = _import_yaml()
         try:
             # Ensure the directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(self.config_path, "w", encoding="utf-8") as file:
-                yaml.dump(settings_dict, file, default_flow_style=False, indent=2)
+                # libyaml's C emitter when available; same output as yaml.Dumper
+                dumper = getattr(yaml, "CDumper", yaml.Dumper)
+                yaml.dump(
+                    _thaw(settings_dict),
+                    file,
+                    Dumper=dumper,
+                    default_flow_style=False,
+                    indent=2,
+                )
 
             return True
 
         except (yaml.YAMLError, IOError) as e:
-            print(f"Error: Could not save configuration to {self.config_path}: {e}")
+            logger.error("Could not save configuration to %s: %s", self.config_path, e)
             return False
 
     def get_setting(self, key: str, default_value: Any = None) -> Any:
@@ -138,11 +245,21 @@ class ConfigManager:
         Returns:
             The configuration value or default_value if not found.
         """
-        config = self.load_config()
-        return self._get_nested_value(config, key, default_value)
-
-    def _get_nested_value(self, config: Dict[str, Any], key: str, default_value: Any = None) -> Any:
+        flat = self._flat_cache
+        if flat is None:
+            config = self.load_config()
+            flat = self._flat_cache
+            if flat is None:
+                # Loading failed; nothing to cache, so try again next time
+                return self._get_nested_value(config, key, default_value)
+        return flat.get(key, default_value)
+
+    def _get_nested_value(self, config: Mapping[str, Any], key: str, default_value: Any = None) -> Any:
         """Get a nested value from config using dot notation."""
+        if '.' not in key:
+            # Top-level keys need no split or walk
+            return config.get(key, default_value) if isinstance(config, Mapping) else default_value
+
         keys = key.split('.')
         value = config
 
@@ -164,8 +281,13 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise.
         """
-        config = self.load_config()
+        # Edit a private copy and publish it as a new snapshot, so readers
+        # never observe a half-applied update
+        config = _thaw(
+            self._config_cache if self._config_cache is not None else self.load_config()
+        )
         self._set_nested_value(config, key, value)
+        self._set_cache(config)
         return self.save_config(config)
 
     def _set_nested_value(self, config: Dict[str, Any], key: str, value: Any) -> None:
@@ -180,9 +302,10 @@ class ConfigManager:
 
         current[keys[-1]] = value
 
-    def reload_config(self) -> Dict[str, Any]:
+    def reload_config(self) -> Mapping[str, Any]:
         """Clear cache and reload configuration."""
         self._config_cache = None
+        self._flat_cache = None
         return self.load_config()
 
     def validate_config(self) -> tuple[bool, list[str]]:
@@ -192,33 +315,40 @@ class ConfigManager:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        config = self.load_config()
+        if self._flat_cache is None:
+            self.load_config()
+        settings = self._flat_cache if self._flat_cache is not None else {}
         errors = []
 
         # Required fields validation
         required_fields = ['monitor_path']
         for field in required_fields:
-            if not self._get_nested_value(config, field):
+            if not settings.get(field):
                 errors.append(f"Required field '{field}' is missing or empty")
 
-        # Validate monitor_path exists or can be created
-        monitor_path = self._get_nested_value(config, 'monitor_path')
+        # Validate monitor_path is writable, or can be created. Validation has
+        # no side effects; initialize_config creates the directory.
+        monitor_path = settings.get('monitor_path')
         if monitor_path:
             try:
-                path = Path(monitor_path)
-                if not path.exists():
-                    # Try to create it
-                    path.mkdir(parents=True, exist_ok=True)
+                existing = Path(monitor_path)
+                while not existing.exists() and existing != existing.parent:
+                    existing = existing.parent
+                if not os.access(existing, os.W_OK):
+                    errors.append(
+                        f"Cannot access or create monitor_path '{monitor_path}': "
+                        f"'{existing}' is not writable"
+                    )
             except Exception as e:
                 errors.append(f"Cannot access or create monitor_path '{monitor_path}': {e}")
 
         # Validate API settings
-        api_port = self._get_nested_value(config, 'api.port')
+        api_port = settings.get('api.port')
         if api_port and (not isinstance(api_port, int) or api_port < 1 or api_port > 65535):
             errors.append("API port must be a valid port number (1-65535)")
 
         # Validate logging level
-        log_level = self._get_nested_value(config, 'logging.level')
+        log_level = settings.get('logging.level')
         if log_level and log_level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR']:
             errors.append("Logging level must be one of: DEBUG, INFO, WARNING, ERROR")
 
@@ -3,13 +3,38 @@ Custom exception hierarchy for the FAIR metadata automation system.
 Provides structured error handling with proper context and chaining.
 """
 
+import builtins
 import logging
-from typing import Any, Callable, Dict, List, Optional, Union
-from pathlib import Path
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from pathlib import Path, PurePath
 
 logger = logging.getLogger(__name__)
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert a context value to JSON-compatible types, e.g. Path to str."""
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return str(value)
+
+
+def _restore_error(cls: type, args: Tuple[Any, ...], state: Dict[str, Any]) -> Any:
+    """Rebuild a pickled MDJourneyError without re-running __init__."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
+
+
 class MDJourneyError(Exception):
     """
     Base exception for all MDJourney application errors.
@@ -17,6 +42,19 @@ class MDJourneyError(Exception):
     Provides common functionality for error context, logging, and chaining.
     """
 
+    # Keep our attributes in slots; BaseException still provides __dict__,
+    # which CPython only creates lazily when it is first accessed
+    __slots__ = ("message", "context", "cause", "_dict")
+
+    # Attach the cause's traceback to the log record even when DEBUG is off
+    verbose_logging = False
+
+    # Class name reported in logs and API responses; see __init_subclass__
+    error_type = "MDJourneyError"
+
+    # Keywords read by _build_context, in context order
+    _context_fields: Tuple[str, ...] = ()
+
     def __init__(
         self,
         message: str,
@@ -32,6 +70,7 @@ class MDJourneyError(Exception):
             cause: The underlying exception that caused this error
         """
         super().__init__(message)
+        self._dict: Optional[Dict[str, Any]] = None
         self.message = message
         self.context = context or {}
         self.cause = cause
@@ -39,29 +78,103 @@ class MDJourneyError(Exception):
         # Log the error with context
         self._log_error()
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.error_type = sys.intern(cls.__name__)
+
+    @classmethod
+    def _build_context(cls, **fields: Any) -> Dict[str, Any]:
+        """
+        Build a context dict from the fields named in _context_fields.
+
+        Only fields left as None are omitted, so falsy identifiers such as
+        ``0`` or ``""`` are still recorded. Paths are stored as strings, which
+        is what consumers of ``context`` expect.
+        """
+        context = {}
+        for name in cls._context_fields:
+            value = fields.get(name)
+            if value is not None:
+                context[name] = str(value) if isinstance(value, PurePath) else value
+        return context
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle every slot as well as the args.
+
+        BaseException only pickles args and __dict__, which would lose the
+        slotted attributes, e.g. errors sent back from a process pool.
+        """
+        state: Dict[str, Any] = {}
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state.update(self.__dict__)
+        return (_restore_error, (type(self), self.args, state))
+
     def _log_error(self) -> None:
         """Log the error with appropriate level and context."""
-        log_message = f"{self.__class__.__name__}: {self.message}"
-        if self.context:
-            log_message += f" | Context: {self.context}"
-        if self.cause:
-            log_message += f" | Caused by: {type(self.cause).__name__}: {str(self.cause)}"
+        # Skip building the context and cause text when ERROR is filtered out
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+        context = self.to_dict()["context"]
+        context_suffix = f" | Context: {context}" if context else ""
+        cause_suffix = (
+            f" | Caused by: {type(self.cause).__name__}: {self.cause}"
+            if self.cause else ""
+        )
+        logger.error(
+            "%s: %s%s%s",
+            self.error_type,
+            self.message,
+            context_suffix,
+            cause_suffix,
+            # The cause is named in the message; its traceback is only
+            # rendered when asked for
+            exc_info=(
+                self.cause
+                if self.verbose_logging or logger.isEnabledFor(logging.DEBUG)
+                else None
+            ),
+        )
+
+    def lightweight(self) -> "MDJourneyError":
+        """
+        Drop traceback and chaining references so the error can be kept.
 
-        logger.error(log_message, exc_info=self.cause)
+        Tracebacks pin every frame they pass through; call this once the
+        error has been handled and is about to be stored or serialized.
+        The cause itself is kept for to_dict. Returns the same instance.
+        """
+        self.__traceback__ = None
+        self.__context__ = None
+        self.__cause__ = None
+        if self.cause is not None:
+            self.cause.__traceback__ = None
+        return self
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert exception to dictionary for API responses."""
-        return {
-            "error_type": self.__class__.__name__,
-            "message": self.message,
-            "context": self.context,
-            "cause": str(self.cause) if self.cause else None
-        }
+        """
+        Convert exception to dictionary for API responses.
+
+        The dictionary is built on the first call and returned as-is
+        afterwards, so callers must not modify it.
+        """
+        if self._dict is None:
+            self._dict = {
+                "error_type": self.error_type,
+                "message": self.message,
+                "context": _jsonable(self.context),
+                "cause": str(self.cause) if self.cause else None
+            }
+        return self._dict
 
 
 class ConfigurationError(MDJourneyError):
     """Raised when configuration is invalid or missing."""
-    pass
+
+    verbose_logging = True
 
 
 class SchemaError(MDJourneyError):
@@ -72,6 +185,9 @@ class SchemaError(MDJourneyError):
 class SchemaValidationError(SchemaError):
     """Raised when schema validation fails."""
 
+    __slots__ = ("validation_errors",)
+    _context_fields = ("validation_errors", "schema_path", "data_path")
+
     def __init__(
         self,
         message: str,
@@ -90,14 +206,11 @@ class SchemaValidationError(SchemaError):
             data_path: Path to the data file being validated
             cause: Underlying validation exception
         """
-        context: Dict[str, Any] = {}
-        if validation_errors:
-            context["validation_errors"] = validation_errors
-        if schema_path:
-            context["schema_path"] = str(schema_path)
-        if data_path:
-            context["data_path"] = str(data_path)
-
+        context = self._build_context(
+            validation_errors=validation_errors,
+            schema_path=schema_path,
+            data_path=data_path,
+        )
         super().__init__(message, context, cause)
         self.validation_errors = validation_errors or []
 
@@ -105,6 +218,9 @@ class SchemaValidationError(SchemaError):
 class SchemaNotFoundError(SchemaError):
     """Raised when a required schema file cannot be found."""
 
+    _context_fields = ("schema_name", "searched_paths")
+    _message_format = "Schema '%s' not found"
+
     def __init__(
         self,
         schema_name: str,
@@ -119,11 +235,13 @@ class SchemaNotFoundError(SchemaError):
             searched_paths: List of paths that were searched
             cause: Underlying file system exception
         """
-        context: Dict[str, Any] = {"schema_name": schema_name}
-        if searched_paths:
-            context["searched_paths"] = [str(p) for p in searched_paths]
-
-        message = f"Schema '{schema_name}' not found"
+        context = self._build_context(
+            schema_name=schema_name,
+            searched_paths=(
+                [str(p) for p in searched_paths] if searched_paths is not None else None
+            ),
+        )
+        message = self._message_format % (schema_name,)
         super().__init__(message, context, cause)
 
 
@@ -135,6 +253,8 @@ class MetadataError(MDJourneyError):
 class MetadataGenerationError(MetadataError):
     """Raised when metadata generation fails."""
 
+    _context_fields = ("metadata_type", "target_path")
+
     def __init__(
         self,
         message: str,
@@ -151,18 +271,18 @@ class MetadataGenerationError(MetadataError):
             target_path: Path where metadata should be generated
             cause: Underlying exception
         """
-        context = {}
-        if metadata_type:
-            context["metadata_type"] = metadata_type
-        if target_path:
-            context["target_path"] = str(target_path)
-
+        context = self._build_context(
+            metadata_type=metadata_type, target_path=target_path
+        )
         super().__init__(message, context, cause)
 
 
 class MetadataValidationError(MetadataError):
     """Raised when metadata validation fails."""
 
+    __slots__ = ("validation_errors",)
+    _context_fields = ("metadata_file", "validation_errors")
+
     def __init__(
         self,
         message: str,
@@ -179,12 +299,9 @@ class MetadataValidationError(MetadataError):
             validation_errors: List of validation error messages
             cause: Underlying validation exception
         """
-        context: Dict[str, Any] = {}
-        if metadata_file:
-            context["metadata_file"] = str(metadata_file)
-        if validation_errors:
-            context["validation_errors"] = validation_errors
-
+        context = self._build_context(
+            metadata_file=metadata_file, validation_errors=validation_errors
+        )
         super().__init__(message, context, cause)
         self.validation_errors = validation_errors or []
 
@@ -197,6 +314,9 @@ class FileSystemError(MDJourneyError):
 class PathNotFoundError(FileSystemError):
     """Raised when a required path cannot be found."""
 
+    _context_fields = ("path", "path_type")
+    _message_format = "%s not found: %s"
+
     def __init__(
         self,
         path: Union[str, Path],
@@ -211,17 +331,17 @@ class PathNotFoundError(FileSystemError):
             path_type: Type of path (e.g., 'dataset', 'project', 'schema')
             cause: Underlying file system exception
         """
-        context = {"path": str(path)}
-        if path_type:
-            context["path_type"] = path_type
-
-        message = f"{path_type or 'Path'} not found: {path}"
+        context = self._build_context(path=path, path_type=path_type)
+        message = self._message_format % (path_type or 'Path', path)
         super().__init__(message, context, cause)
 
 
-class PermissionError(FileSystemError):
+class FSPermissionError(FileSystemError):
     """Raised when file system permissions are insufficient."""
 
+    _context_fields = ("path", "operation")
+    _message_format = "Insufficient permissions for %s on %s"
+
     def __init__(
         self,
         path: Union[str, Path],
@@ -236,17 +356,21 @@ class PermissionError(FileSystemError):
             operation: The operation that failed (e.g., 'read', 'write')
             cause: Underlying permission exception
         """
-        context = {"path": str(path)}
-        if operation:
-            context["operation"] = operation
-
-        message = f"Insufficient permissions for {operation or 'operation'} on {path}"
+        context = self._build_context(path=path, operation=operation)
+        message = self._message_format % (operation or 'operation', path)
         super().__init__(message, context, cause)
 
 
+# Former name of FSPermissionError, kept for existing imports. It shadows the
+# builtin PermissionError wherever it is imported, so prefer the new name.
+PermissionError = FSPermissionError
+
+
 class VersionControlError(MDJourneyError):
     """Raised when version control operations fail."""
 
+    _context_fields = ("operation", "repository_path")
+
     def __init__(
         self,
         message: str,
@@ -263,12 +387,9 @@ class VersionControlError(MDJourneyError):
             repository_path: Path to the repository
             cause: Underlying version control exception
         """
-        context = {}
-        if operation:
-            context["operation"] = operation
-        if repository_path:
-            context["repository_path"] = str(repository_path)
-
+        context = self._build_context(
+            operation=operation, repository_path=repository_path
+        )
         super().__init__(message, context, cause)
 
 
@@ -280,6 +401,9 @@ class APIError(MDJourneyError):
 class ValidationError(APIError):
     """Raised when API request validation fails."""
 
+    __slots__ = ("field_errors",)
+    _context_fields = ("field_errors",)
+
     def __init__(
         self,
         message: str,
@@ -294,10 +418,7 @@ class ValidationError(APIError):
             field_errors: Dictionary mapping field names to error lists
             cause: Underlying validation exception
         """
-        context = {}
-        if field_errors:
-            context["field_errors"] = field_errors
-
+        context = self._build_context(field_errors=field_errors)
         super().__init__(message, context, cause)
         self.field_errors = field_errors or {}
 
@@ -305,6 +426,9 @@ class ValidationError(APIError):
 class ResourceNotFoundError(APIError):
     """Raised when a requested resource cannot be found."""
 
+    _context_fields = ("resource_type", "resource_id")
+    _message_format = "%s '%s' not found"
+
     def __init__(
         self,
         resource_type: str,
@@ -319,16 +443,55 @@ class ResourceNotFoundError(APIError):
             resource_id: Identifier of the missing resource
             cause: Underlying exception
         """
-        context = {
-            "resource_type": resource_type,
-            "resource_id": resource_id
-        }
-
-        message = f"{resource_type} '{resource_id}' not found"
+        context = self._build_context(
+            resource_type=resource_type, resource_id=resource_id
+        )
+        message = self._message_format % (resource_type, resource_id)
         super().__init__(message, context, cause)
 
 
 # Utility functions for error handling
+class FileOperationErrors:
+    """
+    Context manager translating file errors into MDJourney exceptions.
+
+    FileNotFoundError becomes PathNotFoundError, the builtin
+    PermissionError becomes FSPermissionError and any other exception is
+    wrapped in MDJourneyError. The original exception is kept as ``cause``
+    (and logged with its traceback), so it is not chained as __context__.
+
+    Example:
+        with FileOperationErrors("read", path):
+            data = path.read_text()
+    """
+
+    __slots__ = ("operation", "path")
+
+    def __init__(self, operation: str, path: Union[str, Path]):
+        self.operation = operation
+        self.path = path
+
+    def __enter__(self) -> "FileOperationErrors":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        if exc_type is None or not issubclass(exc_type, Exception):
+            return False
+        raise self.translate(exc) from None
+
+    def translate(self, error: Exception) -> MDJourneyError:
+        """Return the MDJourney exception reported for ``error``."""
+        if isinstance(error, FileNotFoundError):
+            return PathNotFoundError(self.path, f"file for {self.operation}", error)
+        if isinstance(error, builtins.PermissionError):
+            return FSPermissionError(self.path, self.operation, error)
+        return MDJourneyError(
+            f"Failed to {self.operation} file at {self.path}",
+            {"operation": self.operation, "path": str(self.path)},
+            error
+        )
+
+
 def handle_file_operation(
     operation: str,
     path: Union[str, Path],
@@ -337,30 +500,30 @@ def handle_file_operation(
     """
     Decorator to handle file operation errors with proper context.
 
+    Errors are translated as by FileOperationErrors; prefer that context
+    manager around the file access itself where a decorator is not needed.
+
     Args:
         operation: Description of the operation (e.g., 'read', 'write')
         path: Path being operated on
-        error_handler: Optional custom error handler
+        error_handler: Optional custom error handler, called with errors
+            other than missing files and permission failures
 
     Returns:
         Decorated function
     """
+    errors = FileOperationErrors(operation, path)
+
     def decorator(func: Callable) -> Callable:
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
-            except FileNotFoundError as e:
-                raise PathNotFoundError(path, f"file for {operation}", e)
-            except PermissionError as e:
-                raise PermissionError(path, operation, e)
             except Exception as e:
-                if error_handler:
+                if error_handler and not isinstance(
+                    e, (FileNotFoundError, builtins.PermissionError)
+                ):
                     return error_handler(e)
-                raise MDJourneyError(
-                    f"Failed to {operation} file at {path}",
-                    {"operation": operation, "path": str(path)},
-                    e
-                )
+                raise errors.translate(e) from None
         return wrapper
     return decorator
 
@@ -376,7 +539,8 @@ def create_error_response(error: Exception) -> Dict[str, Any]:
         Dictionary suitable for JSON response
     """
     if isinstance(error, MDJourneyError):
-        return error.to_dict()
+        # The error is handled once it is turned into a response
+        return error.lightweight().to_dict()
     else:
         return {
             "error_type": type(error).__name__,
@@ -2,58 +2,110 @@
 Performance monitoring and optimization configuration for the FAIR metadata automation system.
 """
 
+import dataclasses
+import itertools
 import logging
 import os
+import sys
+import threading
 import time
-from typing import Dict, Any, Optional
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class CacheSettings:
+    """Settings for one cache."""
+
+    enabled: bool
+    ttl_seconds: int
+    max_size: int
+    persist_to_disk: bool
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class FileProcessingSettings:
+    """Settings for asynchronous file processing."""
+
+    enabled: bool
+    max_concurrent_files: int
+    chunk_size: int
+    use_thread_pool: bool
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class MetadataGenerationSettings:
+    """Settings for asynchronous metadata generation."""
+
+    enabled: bool
+    max_concurrent_generations: int
+    use_background_tasks: bool
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class SchemaLoadingSettings:
+    """Settings for asynchronous schema loading."""
+
+    enabled: bool
+    preload_common_schemas: bool
+    use_thread_pool: bool
+
+
 class PerformanceConfig:
     """Configuration for performance optimizations."""
 
-    # Cache configurations
-    CACHE_CONFIG = {
-        "schema_cache": {
-            "enabled": True,
-            "ttl_seconds": 3600,  # 1 hour
-            "max_size": 1000,
-            "persist_to_disk": True,
-        },
-        "metadata_cache": {
-            "enabled": True,
-            "ttl_seconds": 300,   # 5 minutes
-            "max_size": 5000,
-            "persist_to_disk": True,
-        },
-        "project_cache": {
-            "enabled": True,
-            "ttl_seconds": 60,    # 1 minute
-            "max_size": 100,
-            "persist_to_disk": False,
-        },
+    # Cache configurations; entries are frozen, replace them to override
+    CACHE_CONFIG: Dict[str, CacheSettings] = {
+        "schema_cache": CacheSettings(
+            enabled=True,
+            ttl_seconds=3600,  # 1 hour
+            max_size=1000,
+            persist_to_disk=True,
+        ),
+        "metadata_cache": CacheSettings(
+            enabled=True,
+            ttl_seconds=300,   # 5 minutes
+            max_size=5000,
+            persist_to_disk=True,
+        ),
+        "project_cache": CacheSettings(
+            enabled=True,
+            ttl_seconds=60,    # 1 minute
+            max_size=100,
+            persist_to_disk=False,
+        ),
     }
 
-    # Async processing configurations
-    ASYNC_CONFIG = {
-        "file_processing": {
-            "enabled": True,
-            "max_concurrent_files": 10,
-            "chunk_size": 4096,
-            "use_thread_pool": True,
-        },
-        "metadata_generation": {
-            "enabled": True,
-            "max_concurrent_generations": 5,
-            "use_background_tasks": True,
-        },
-        "schema_loading": {
-            "enabled": True,
-            "preload_common_schemas": True,
-            "use_thread_pool": True,
-        },
+    # Async processing configurations; entries are frozen, replace them to override
+    ASYNC_CONFIG: Dict[str, Any] = {
+        "file_processing": FileProcessingSettings(
+            enabled=True,
+            max_concurrent_files=10,
+            chunk_size=4096,
+            use_thread_pool=True,
+        ),
+        "metadata_generation": MetadataGenerationSettings(
+            enabled=True,
+            max_concurrent_generations=5,
+            use_background_tasks=True,
+        ),
+        "schema_loading": SchemaLoadingSettings(
+            enabled=True,
+            preload_common_schemas=True,
+            use_thread_pool=True,
+        ),
     }
 
     # Background task configurations
@@ -100,19 +152,20 @@ class PerformanceConfig:
         "enabled": True,
         "log_slow_requests": True,
         "slow_request_threshold_ms": 1000,
+        "max_slow_requests": 128,
         "log_cache_stats": True,
         "log_performance_metrics": True,
     }
 
     @classmethod
-    def get_cache_config(cls, cache_type: str) -> Dict[str, Any]:
+    def get_cache_config(cls, cache_type: str) -> Optional[CacheSettings]:
         """Get cache configuration for a specific cache type."""
-        return cls.CACHE_CONFIG.get(cache_type, {})
+        return cls.CACHE_CONFIG.get(cache_type)
 
     @classmethod
-    def get_async_config(cls, operation_type: str) -> Dict[str, Any]:
+    def get_async_config(cls, operation_type: str) -> Optional[Any]:
         """Get async configuration for a specific operation type."""
-        return cls.ASYNC_CONFIG.get(operation_type, {})
+        return cls.ASYNC_CONFIG.get(operation_type)
 
     @classmethod
     def is_feature_enabled(cls, feature_path: str) -> bool:
@@ -120,77 +173,253 @@ class PerformanceConfig:
         Check if a feature is enabled using dot notation.
 
         Args:
-            feature_path: Feature path like "cache.schema_cache.enabled"
+            feature_path: Feature path like "cache.schema_cache.enabled"; the
+                first part is a get_performance_settings() section or a
+                class attribute such as "CACHE_CONFIG"
 
         Returns:
             True if feature is enabled, False otherwise
         """
-        try:
-            parts = feature_path.split('.')
-            config = cls.__dict__
+        return bool(_feature_resolver(feature_path)(cls))
 
-            for part in parts:
-                if isinstance(config, dict):
-                    config = config.get(part)
-                else:
-                    config = getattr(config, part, None)
+    @classmethod
+    def get_performance_settings(cls) -> Mapping[str, Any]:
+        """
+        Get all performance settings as a read-only mapping.
 
-                if config is None:
-                    return False
+        The mapping is built once per class and shared; it is a live view,
+        so changes made to the settings dicts (e.g. environment overrides)
+        show through without rebuilding it.
+        """
+        view = cls.__dict__.get("_settings_view")
+        if view is None:
+            view = MappingProxyType({
+                section: MappingProxyType(getattr(cls, attribute))
+                for section, attribute in _SECTION_ATTRIBUTES.items()
+            })
+            cls._settings_view = view
+        return view
 
-            return bool(config)
-        except Exception:
-            return False
 
-    @classmethod
-    def get_performance_settings(cls) -> Dict[str, Any]:
-        """Get all performance settings as a dictionary."""
-        return {
-            "cache": cls.CACHE_CONFIG,
-            "async": cls.ASYNC_CONFIG,
-            "background_tasks": cls.BACKGROUND_TASKS,
-            "api_optimization": cls.API_OPTIMIZATION,
-            "frontend_optimization": cls.FRONTEND_OPTIMIZATION,
-            "monitoring": cls.MONITORING,
-        }
+# get_performance_settings() section names -> PerformanceConfig attributes
+_SECTION_ATTRIBUTES = {
+    "cache": "CACHE_CONFIG",
+    "async": "ASYNC_CONFIG",
+    "background_tasks": "BACKGROUND_TASKS",
+    "api_optimization": "API_OPTIMIZATION",
+    "frontend_optimization": "FRONTEND_OPTIMIZATION",
+    "monitoring": "MONITORING",
+}
+
+
+@lru_cache(maxsize=256)
+def _feature_resolver(feature_path: str) -> Callable[[type], Any]:
+    """
+    Split a feature path once and return a function that looks it up.
+
+    The lookup itself runs on every call, so later changes to the
+    configuration dicts (e.g. environment overrides) are seen.
+    """
+    section, *keys = feature_path.split('.')
+    attribute = _SECTION_ATTRIBUTES.get(section, section)
+
+    def resolve(config_cls: type) -> Any:
+        value = getattr(config_cls, attribute, None)
+        for key in keys:
+            if isinstance(value, dict):
+                value = value.get(key)
+            elif dataclasses.is_dataclass(value):
+                value = getattr(value, key, None)
+            else:
+                return None
+        return value
+
+    return resolve
+
+
+_NS_PER_MS = 1_000_000
+
+
+class _RequestAccumulator:
+    """Request statistics recorded by one thread and not yet flushed."""
+
+    __slots__ = ("lock", "pending", "thread")
+
+    def __init__(self):
+        # Only contended while the monitor is flushing this accumulator
+        self.lock = threading.Lock()
+        # endpoint index -> [count, total_ns, min_ns, max_ns]
+        self.pending: Dict[int, List[int]] = {}
+        self.thread = threading.current_thread()
 
 
 class PerformanceMonitor:
     """Monitor performance metrics and provide optimization suggestions."""
 
     def __init__(self):
-        self.metrics: Dict[str, Any] = {}
-        self.slow_requests: list = []
+        # Request metrics are kept column-wise: each endpoint gets an index
+        # into parallel lists, so recording a request is four list stores.
+        # Durations are integer nanoseconds; milliseconds appear only in
+        # reports.
+        self._endpoint_index: Dict[str, int] = {}
+        self._endpoints: List[str] = []
+        self._count: List[int] = []
+        self._total_ns: List[int] = []
+        self._min_ns: List[int] = []
+        self._max_ns: List[int] = []
+        # Requests are first recorded in a per-thread accumulator and merged
+        # into the columns above by flush(), under _lock
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._accumulators: List[_RequestAccumulator] = []
+        # Most recent slow requests as (endpoint, duration_ns, timestamp)
+        self.slow_requests: Deque[Tuple[str, int, float]] = deque()
         self.cache_stats: Dict[str, Any] = {}
+        self.reload_config()
 
-    def record_request_time(self, endpoint: str, duration_ms: float):
-        """Record request duration for monitoring."""
-        if endpoint not in self.metrics:
-            self.metrics[endpoint] = {
-                "count": 0,
-                "total_time": 0,
-                "avg_time": 0,
-                "min_time": float('inf'),
-                "max_time": 0,
+    def reload_config(self) -> None:
+        """
+        Re-read the monitoring settings from PerformanceConfig.MONITORING.
+
+        The settings are copied to attributes so recording a request does
+        not consult the config; call this after changing MONITORING.
+        """
+        monitoring = PerformanceConfig.MONITORING
+        self._log_slow = bool(monitoring.get("log_slow_requests", True))
+        self._slow_threshold_ns = int(
+            monitoring.get("slow_request_threshold_ms", 1000) * _NS_PER_MS
+        )
+        self._log_cache_stats = bool(monitoring.get("log_cache_stats", True))
+        self.slow_requests = deque(
+            self.slow_requests, maxlen=monitoring.get("max_slow_requests", 128)
+        )
+
+    @property
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint request statistics in milliseconds."""
+        self.flush()
+        return {
+            endpoint: {
+                "count": count,
+                "total_time": total_ns / _NS_PER_MS,
+                "avg_time": total_ns / count / _NS_PER_MS,
+                "min_time": min_ns / _NS_PER_MS,
+                "max_time": max_ns / _NS_PER_MS,
             }
+            for endpoint, count, total_ns, min_ns, max_ns in zip(
+                self._endpoints, self._count, self._total_ns, self._min_ns, self._max_ns
+            )
+            # Registered endpoints have no statistics until first recorded
+            if count
+        }
 
-        stats = self.metrics[endpoint]
-        stats["count"] += 1
-        stats["total_time"] += duration_ms
-        stats["avg_time"] = stats["total_time"] / stats["count"]
-        stats["min_time"] = min(stats["min_time"], duration_ms)
-        stats["max_time"] = max(stats["max_time"], duration_ms)
+    def register_endpoint(self, name: str) -> int:
+        """
+        Return the stable index of an endpoint, allocating it on first use.
+
+        Callers that record the same endpoint repeatedly (e.g. middleware,
+        once per route) can keep the index and call record_by_index() to
+        skip the name lookup.
+        """
+        i = self._endpoint_index.get(name)
+        if i is not None:
+            return i
+        name = sys.intern(name)
+        with self._lock:
+            i = self._endpoint_index.get(name)
+            if i is None:
+                # Columns are filled before the index is published, so
+                # record_by_index() never sees a partly added endpoint
+                i = len(self._endpoints)
+                self._endpoints.append(name)
+                self._count.append(0)
+                self._total_ns.append(0)
+                self._min_ns.append(0)
+                self._max_ns.append(0)
+                self._endpoint_index[name] = i
+        return i
+
+    def _get_accumulator(self) -> _RequestAccumulator:
+        """Return the calling thread's accumulator, registering it on first use."""
+        accumulator = getattr(self._local, "accumulator", None)
+        if accumulator is None:
+            accumulator = self._local.accumulator = _RequestAccumulator()
+            with self._lock:
+                self._accumulators.append(accumulator)
+        return accumulator
+
+    def flush(self) -> None:
+        """
+        Merge every thread's pending request statistics into the metrics.
+
+        Reports flush before reading, so they always include every request
+        recorded so far.
+        """
+        with self._lock:
+            for accumulator in self._accumulators:
+                with accumulator.lock:
+                    pending = accumulator.pending
+                    if not pending:
+                        continue
+                    accumulator.pending = {}
+
+                for i, (count, total_ns, min_ns, max_ns) in pending.items():
+                    if not self._count[i]:
+                        self._min_ns[i] = min_ns
+                        self._max_ns[i] = max_ns
+                    else:
+                        if min_ns < self._min_ns[i]:
+                            self._min_ns[i] = min_ns
+                        if max_ns > self._max_ns[i]:
+                            self._max_ns[i] = max_ns
+                    self._count[i] += count
+                    self._total_ns[i] += total_ns
+
+            # Threads that have exited will not record again
+            self._accumulators = [
+                accumulator for accumulator in self._accumulators
+                if accumulator.thread.is_alive()
+            ]
+
+    def record_request_ns(self, endpoint: str, duration_ns: int):
+        """
+        Record request duration in nanoseconds for monitoring.
+
+        Pass the difference of two time.perf_counter_ns() readings.
+        """
+        self.record_by_index(self.register_endpoint(endpoint), duration_ns)
+
+    def record_by_index(self, index: int, duration_ns: int):
+        """
+        Record request duration in nanoseconds for a registered endpoint.
+
+        ``index`` comes from register_endpoint(). Only the calling thread's
+        accumulator is updated; see flush().
+        """
+        accumulator = self._get_accumulator()
+        with accumulator.lock:
+            stats = accumulator.pending.get(index)
+            if stats is None:
+                accumulator.pending[index] = [1, duration_ns, duration_ns, duration_ns]
+            else:
+                stats[0] += 1
+                stats[1] += duration_ns
+                if duration_ns < stats[2]:
+                    stats[2] = duration_ns
+                elif duration_ns > stats[3]:
+                    stats[3] = duration_ns
 
         # Log slow requests
-        if PerformanceConfig.MONITORING.get("log_slow_requests", True):
-            threshold = PerformanceConfig.MONITORING.get("slow_request_threshold_ms", 1000)
-            if duration_ms > threshold:
-                self.slow_requests.append({
-                    "endpoint": endpoint,
-                    "duration_ms": duration_ms,
-                    "timestamp": time.time(),
-                })
-                logger.warning(f"Slow request detected: {endpoint} took {duration_ms:.2f}ms")
+        if self._log_slow and duration_ns > self._slow_threshold_ns:
+            endpoint = self._endpoints[index]
+            self.slow_requests.append((endpoint, duration_ns, time.time()))
+            logger.warning(
+                "Slow request detected: %s took %.2fms", endpoint, duration_ns / _NS_PER_MS
+            )
+
+    def record_request_time(self, endpoint: str, duration_ms: float):
+        """Record request duration in milliseconds for monitoring."""
+        self.record_request_ns(endpoint, round(duration_ms * _NS_PER_MS))
 
     def record_cache_stats(self, cache_type: str, hits: int, misses: int):
         """Record cache statistics."""
@@ -200,32 +429,53 @@ class PerformanceMonitor:
             "hit_rate": hits / (hits + misses) if (hits + misses) > 0 else 0,
         }
 
-        if PerformanceConfig.MONITORING.get("log_cache_stats", True):
-            hit_rate = self.cache_stats[cache_type]["hit_rate"]
-            logger.info(f"Cache stats for {cache_type}: {hit_rate:.2%} hit rate ({hits} hits, {misses} misses)")
+        if self._log_cache_stats and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Cache stats for %s: %.2f%% hit rate (%d hits, %d misses)",
+                cache_type,
+                self.cache_stats[cache_type]["hit_rate"] * 100,
+                hits,
+                misses,
+            )
 
     def get_performance_report(self) -> Dict[str, Any]:
-        """Generate a performance report."""
-        report = {
+        """
+        Generate a performance report.
+
+        Each call returns a new snapshot; later requests do not change it.
+        """
+        return {
             "request_metrics": self.metrics,
-            "cache_stats": self.cache_stats,
-            "slow_requests": self.slow_requests[-10:],  # Last 10 slow requests
+            # record_cache_stats() replaces the per-cache dicts rather than
+            # updating them, so a shallow copy is a stable snapshot
+            "cache_stats": MappingProxyType(dict(self.cache_stats)),
+            # Last 10 slow requests
+            "slow_requests": tuple(
+                {
+                    "endpoint": endpoint,
+                    "duration_ms": duration_ns / _NS_PER_MS,
+                    "timestamp": timestamp,
+                }
+                for endpoint, duration_ns, timestamp in itertools.islice(
+                    self.slow_requests, max(0, len(self.slow_requests) - 10), None
+                )
+            ),
             "optimization_suggestions": self._get_optimization_suggestions(),
         }
 
-        return report
-
     def _get_optimization_suggestions(self) -> list:
         """Generate optimization suggestions based on metrics."""
         suggestions = []
+        self.flush()
 
-        # Check for slow endpoints
-        for endpoint, stats in self.metrics.items():
-            if stats["avg_time"] > 1000:  # More than 1 second average
+        # Check for slow endpoints, scanning the metric columns directly;
+        # comparing totals avoids a division for endpoints that are fine
+        for endpoint, count, total_ns in zip(self._endpoints, self._count, self._total_ns):
+            if total_ns > 1000 * _NS_PER_MS * count:  # More than 1 second average
                 suggestions.append({
                     "type": "slow_endpoint",
                     "endpoint": endpoint,
-                    "avg_time_ms": stats["avg_time"],
+                    "avg_time_ms": total_ns / count / _NS_PER_MS,
                     "suggestion": f"Consider caching or optimizing {endpoint}",
                 })
 
@@ -259,34 +509,48 @@ def get_performance_config() -> PerformanceConfig:
     return PerformanceConfig
 
 
-# Environment-based configuration overrides
-def load_performance_config_from_env():
-    """Load performance configuration from environment variables."""
-    config = PerformanceConfig()
-
-    # Override cache settings from environment
-    if os.getenv("MDJOURNEY_CACHE_ENABLED"):
-        config.CACHE_CONFIG["schema_cache"]["enabled"] = os.getenv("MDJOURNEY_CACHE_ENABLED").lower() == "true"
+# Environment variable values read as True; anything else is False
+def _to_bool(value: str) -> bool:
+    """Parse a boolean environment variable value; only "true" is true."""
+    return value.lower() == "true"
 
-    if os.getenv("MDJOURNEY_SCHEMA_CACHE_TTL"):
-        config.CACHE_CONFIG["schema_cache"]["ttl_seconds"] = int(os.getenv("MDJOURNEY_SCHEMA_CACHE_TTL"))
 
-    if os.getenv("MDJOURNEY_METADATA_CACHE_TTL"):
-        config.CACHE_CONFIG["metadata_cache"]["ttl_seconds"] = int(os.getenv("MDJOURNEY_METADATA_CACHE_TTL"))
+# Environment variable -> (PerformanceConfig attribute, [settings name,] field,
+# converter); settings names refer to the frozen entries of CACHE_CONFIG and
+# ASYNC_CONFIG
+_ENV_OVERRIDES: Tuple[Tuple[str, Tuple[str, ...], Callable[[str], Any]], ...] = (
+    ("MDJOURNEY_CACHE_ENABLED", ("CACHE_CONFIG", "schema_cache", "enabled"), _to_bool),
+    ("MDJOURNEY_SCHEMA_CACHE_TTL", ("CACHE_CONFIG", "schema_cache", "ttl_seconds"), int),
+    ("MDJOURNEY_METADATA_CACHE_TTL", ("CACHE_CONFIG", "metadata_cache", "ttl_seconds"), int),
+    ("MDJOURNEY_ASYNC_ENABLED", ("ASYNC_CONFIG", "file_processing", "enabled"), _to_bool),
+    (
+        "MDJOURNEY_MAX_CONCURRENT_FILES",
+        ("ASYNC_CONFIG", "file_processing", "max_concurrent_files"),
+        int,
+    ),
+    ("MDJOURNEY_BACKGROUND_TASKS_ENABLED", ("BACKGROUND_TASKS", "enabled"), _to_bool),
+    ("MDJOURNEY_MAX_CONCURRENT_TASKS", ("BACKGROUND_TASKS", "max_concurrent_tasks"), int),
+)
 
-    # Override async settings from environment
-    if os.getenv("MDJOURNEY_ASYNC_ENABLED"):
-        config.ASYNC_CONFIG["file_processing"]["enabled"] = os.getenv("MDJOURNEY_ASYNC_ENABLED").lower() == "true"
 
-    if os.getenv("MDJOURNEY_MAX_CONCURRENT_FILES"):
-        config.ASYNC_CONFIG["file_processing"]["max_concurrent_files"] = int(os.getenv("MDJOURNEY_MAX_CONCURRENT_FILES"))
-
-    # Override background task settings from environment
-    if os.getenv("MDJOURNEY_BACKGROUND_TASKS_ENABLED"):
-        config.BACKGROUND_TASKS["enabled"] = os.getenv("MDJOURNEY_BACKGROUND_TASKS_ENABLED").lower() == "true"
+# Environment-based configuration overrides
+def load_performance_config_from_env():
+    """Load performance configuration from environment variables."""
+    config = PerformanceConfig()
 
-    if os.getenv("MDJOURNEY_MAX_CONCURRENT_TASKS"):
-        config.BACKGROUND_TASKS["max_concurrent_tasks"] = int(os.getenv("MDJOURNEY_MAX_CONCURRENT_TASKS"))
+    for env_key, (attribute, *keys), convert in _ENV_OVERRIDES:
+        value = os.environ.get(env_key)
+        if not value:
+            continue
+        container = getattr(config, attribute)
+        if len(keys) == 1:
+            container[keys[0]] = convert(value)
+        else:
+            # Frozen settings are swapped for an updated copy
+            section, field = keys
+            container[section] = dataclasses.replace(
+                container[section], **{field: convert(value)}
+            )
 
     logger.info("Performance configuration loaded from environment variables")
     return config
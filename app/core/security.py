@@ -3,10 +3,14 @@ Security module for the FAIR metadata automation system.
 Handles input validation, path sanitization, and security utilities.
 """
 
+import json
 import re
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
 from urllib.parse import quote, unquote
 
 from app.core.exceptions import ValidationError, SecurityError
@@ -15,8 +19,10 @@ from app.core.exceptions import ValidationError, SecurityError
 class InputValidator:
     """Validates and sanitizes user inputs to prevent security vulnerabilities."""
 
-    # Allowed characters for IDs (alphanumeric, underscore, hyphen)
-    ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+    # Allowed characters for IDs (alphanumeric, underscore, hyphen). Used
+    # with fullmatch; this also rules out '.', '/' and backslash, so IDs need no
+    # separate path traversal check.
+    ID_PATTERN = re.compile(r'[a-zA-Z0-9_-]+', re.ASCII)
 
     # Maximum length for various fields
     MAX_ID_LENGTH = 100
@@ -24,17 +30,17 @@ class InputValidator:
     MAX_SCHEMA_TYPE_LENGTH = 50
 
     # Allowed metadata types
-    ALLOWED_METADATA_TYPES = {
+    ALLOWED_METADATA_TYPES = frozenset({
         'project_descriptive',
         'dataset_administrative',
         'dataset_structural',
         'experiment_contextual',
         'instrument_technical',
         'complete_metadata'
-    }
+    })
 
     # Allowed schema types
-    ALLOWED_SCHEMA_TYPES = {
+    ALLOWED_SCHEMA_TYPES = frozenset({
         'project',
         'dataset_administrative',
         'dataset_structural',
@@ -42,7 +48,15 @@ class InputValidator:
         'instrument_technical',
         'complete_metadata',
         'contextual'
-    }
+    })
+
+    # Error messages for rejected types, built once
+    _INVALID_METADATA_TYPE_MESSAGE = (
+        f"Invalid metadata type. Allowed values: {', '.join(sorted(ALLOWED_METADATA_TYPES))}"
+    )
+    _INVALID_SCHEMA_TYPE_MESSAGE = (
+        f"Invalid schema type. Allowed values: {', '.join(sorted(ALLOWED_SCHEMA_TYPES))}"
+    )
 
     @classmethod
     def validate_id(cls, value: str, field_name: str = "ID") -> str:
@@ -69,15 +83,12 @@ class InputValidator:
         if len(value) > cls.MAX_ID_LENGTH:
             raise ValidationError(f"{field_name} exceeds maximum length of {cls.MAX_ID_LENGTH}")
 
-        # Check for path traversal attempts
-        if '..' in value or '/' in value or '\\' in value:
-            raise ValidationError(f"{field_name} contains invalid characters")
-
         # Check for allowed characters only
-        if not cls.ID_PATTERN.match(value):
+        if not cls.ID_PATTERN.fullmatch(value):
             raise ValidationError(f"{field_name} contains invalid characters. Only alphanumeric, underscore, and hyphen are allowed")
 
-        return value.strip()
+        # ID_PATTERN admits no whitespace, so there is nothing to strip
+        return value
 
     @classmethod
     def validate_metadata_type(cls, value: str) -> str:
@@ -93,6 +104,11 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
+        # Allowed values pass with a single set lookup; the checks below
+        # only pick the error message
+        if isinstance(value, str) and value in cls.ALLOWED_METADATA_TYPES:
+            return value
+
         if not value:
             raise ValidationError("Metadata type cannot be empty")
 
@@ -102,15 +118,8 @@ class InputValidator:
         if len(value) > cls.MAX_METADATA_TYPE_LENGTH:
             raise ValidationError(f"Metadata type exceeds maximum length of {cls.MAX_METADATA_TYPE_LENGTH}")
 
-        # Check for path traversal attempts
-        if '..' in value or '/' in value or '\\' in value:
-            raise ValidationError("Metadata type contains invalid characters")
-
-        # Check against allowed values
-        if value not in cls.ALLOWED_METADATA_TYPES:
-            raise ValidationError(f"Invalid metadata type. Allowed values: {', '.join(cls.ALLOWED_METADATA_TYPES)}")
-
-        return value.strip()
+        # Not an allowed value; none of them contain path characters
+        raise ValidationError(cls._INVALID_METADATA_TYPE_MESSAGE)
 
     @classmethod
     def validate_schema_type(cls, value: str) -> str:
@@ -126,6 +135,11 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
+        # Allowed values pass with a single set lookup; the checks below
+        # only pick the error message
+        if isinstance(value, str) and value in cls.ALLOWED_SCHEMA_TYPES:
+            return value
+
         if not value:
             raise ValidationError("Schema type cannot be empty")
 
@@ -135,15 +149,8 @@ class InputValidator:
         if len(value) > cls.MAX_SCHEMA_TYPE_LENGTH:
             raise ValidationError(f"Schema type exceeds maximum length of {cls.MAX_SCHEMA_TYPE_LENGTH}")
 
-        # Check for path traversal attempts
-        if '..' in value or '/' in value or '\\' in value:
-            raise ValidationError("Schema type contains invalid characters")
-
-        # Check against allowed values
-        if value not in cls.ALLOWED_SCHEMA_TYPES:
-            raise ValidationError(f"Invalid schema type. Allowed values: {', '.join(cls.ALLOWED_SCHEMA_TYPES)}")
-
-        return value.strip()
+        # Not an allowed value; none of them contain path characters
+        raise ValidationError(cls._INVALID_SCHEMA_TYPE_MESSAGE)
 
     @classmethod
     def validate_json_payload(cls, payload: Optional[Dict[str, Any]], max_size: int = 1024 * 1024) -> Optional[Dict[str, Any]]:
@@ -166,11 +173,11 @@ class InputValidator:
         if not isinstance(payload, dict):
             raise ValidationError("Payload must be a JSON object")
 
-        # Check payload size (rough estimate)
-        import json
+        # Check payload size (rough estimate). json.dumps escapes non-ASCII
+        # characters by default, so the string's length is its size in
+        # bytes and it need not be encoded.
         try:
-            payload_str = json.dumps(payload)
-            if len(payload_str.encode('utf-8')) > max_size:
+            if len(json.dumps(payload)) > max_size:
                 raise ValidationError(f"Payload exceeds maximum size of {max_size} bytes")
         except (TypeError, ValueError) as e:
             raise ValidationError(f"Invalid JSON payload: {str(e)}")
@@ -178,6 +185,10 @@ class InputValidator:
         return payload
 
 
+# A normalized relative path starting with this climbs out of its base
+_PARDIR_PREFIX = os.pardir + os.sep
+
+
 class PathSanitizer:
     """Sanitizes file paths to prevent path traversal attacks."""
 
@@ -191,37 +202,45 @@ class PathSanitizer:
             base_path: Base path to resolve against (optional)
 
         Returns:
-            Sanitized Path object
+            Sanitized Path object, with symlinks resolved
 
         Raises:
             SecurityError: If path traversal is detected
         """
-        if isinstance(path, str):
-            path = Path(path)
+        return Path(os.path.realpath(cls._sanitize(path, base_path)))
 
-        # Convert to absolute path
-        if not path.is_absolute():
-            if base_path:
-                path = base_path / path
-            else:
-                path = path.resolve()
+    @classmethod
+    def _sanitize(cls, path: Union[str, Path], base_path: Optional[Union[str, Path]] = None) -> str:
+        """
+        Return the absolute, normalized form of a path as a string.
 
-        # Normalize the path
-        try:
-            normalized_path = path.resolve()
-        except (OSError, ValueError) as e:
-            raise SecurityError(f"Invalid path: {str(e)}")
+        Normalization is lexical and does not touch the filesystem: '.' and
+        empty components are dropped and each '..' removes the component
+        before it. A relative path may not climb out of base_path, and no
+        path may climb above its root. Symlinks are not followed; callers
+        resolve the result before relying on where it points.
+        """
+        path = os.fspath(path)
+        if '\0' in path:
+            raise SecurityError("Invalid path: embedded null byte")
 
-        # Check for path traversal attempts
-        if '..' in str(normalized_path) or normalized_path.parts.count('..') > 0:
-            raise SecurityError("Path traversal detected")
+        if not os.path.isabs(path):
+            if base_path:
+                return cls._join_under(os.path.abspath(os.fspath(base_path)), path)
+            path = os.path.join(os.getcwd(), path)
 
-        # Additional security checks
-        if any(part.startswith('.') and part not in ['.', '..'] for part in normalized_path.parts):
-            # Allow hidden files/directories but log them
-            pass
+        drive, rest = os.path.splitdrive(path)
+        return cls._join_under(drive + os.sep, rest.lstrip(os.sep + (os.altsep or "")))
 
-        return normalized_path
+    @staticmethod
+    def _join_under(base: str, relative: str) -> str:
+        """Join a relative path to a normalized base, refusing to leave it."""
+        relative = os.path.normpath(relative)
+        if relative == os.pardir or relative.startswith(_PARDIR_PREFIX):
+            raise SecurityError("Path traversal detected")
+        if relative == os.curdir:
+            return base
+        return os.path.join(base, relative)
 
     @classmethod
     def validate_path_access(cls, path: Path, base_path: Path) -> Path:
@@ -239,15 +258,16 @@ class PathSanitizer:
             SecurityError: If path is outside base path
         """
         try:
-            sanitized_path = cls.sanitize_path(path, base_path)
+            # The lexical check rejects '..' escapes cheaply; resolving
+            # symlinks afterwards catches links that point out of the base
+            sanitized_path = os.path.realpath(cls._sanitize(path, base_path))
+            base = os.path.realpath(cls._sanitize(base_path))
 
             # Ensure the path is within the base path
-            try:
-                sanitized_path.relative_to(base_path)
-            except ValueError:
+            if os.path.commonpath([sanitized_path, base]) != base:
                 raise SecurityError("Path is outside allowed directory")
 
-            return sanitized_path
+            return Path(sanitized_path)
 
         except Exception as e:
             if isinstance(e, SecurityError):
@@ -255,33 +275,67 @@ class PathSanitizer:
             raise SecurityError(f"Path validation failed: {str(e)}")
 
 
+# Headers added to every HTTP response; read-only so the shared mapping
+# cannot be altered by a caller
+_SECURITY_HEADERS: Mapping[str, str] = MappingProxyType({
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Content-Security-Policy": "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' data: https:; connect-src 'self'",
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "Permissions-Policy": "geolocation=(), microphone=(), camera=()"
+})
+
+
 class SecurityHeaders:
     """Manages security headers for HTTP responses."""
 
     @classmethod
-    def get_security_headers(cls) -> Dict[str, str]:
+    def get_security_headers(cls) -> Mapping[str, str]:
         """
-        Get a dictionary of security headers.
+        Get the security headers.
 
         Returns:
-            Dictionary of security headers
+            Read-only mapping of security headers, shared between calls
         """
-        return {
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "X-XSS-Protection": "1; mode=block",
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "Content-Security-Policy": "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' data: https:; connect-src 'self'",
-            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
-            "Permissions-Policy": "geolocation=(), microphone=(), camera=()"
-        }
+        return _SECURITY_HEADERS
+
+
+# Number of independently locked client tables in a RateLimiter; a power of
+# two so a client's shard is picked with a mask
+_RATE_LIMIT_SHARDS = 64
+
+# Longest time between sweeps of idle buckets from a shard
+_RATE_LIMIT_SWEEP_NS = 60 * 1_000_000_000
+
+
+class _RateLimitShard:
+    """One lock-protected table of client token buckets."""
+
+    __slots__ = ("lock", "buckets", "next_sweep")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # client_id -> [tokens, monotonic_ns() of last refill]
+        self.buckets: Dict[str, List[float]] = {}
+        self.next_sweep = 0
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter for API endpoints."""
+    """
+    Simple in-memory rate limiter for API endpoints.
+
+    Each client has a token bucket holding up to max_requests tokens, refilled
+    at max_requests per window_seconds; a request takes one token. Clients
+    are spread over shards with their own locks, so concurrent callers
+    rarely wait on each other. Buckets idle for a whole window are full
+    again and are swept out, so memory is bounded by the clients seen
+    within about one window.
+    """
 
     def __init__(self):
-        self._requests: Dict[str, List[float]] = {}
+        self._shards = [_RateLimitShard() for _ in range(_RATE_LIMIT_SHARDS)]
 
     def is_allowed(self, client_id: str, max_requests: int = 100, window_seconds: int = 3600) -> bool:
         """
@@ -295,25 +349,43 @@ class RateLimiter:
         Returns:
             True if request is allowed, False otherwise
         """
-        import time
+        current_time = time.monotonic_ns()
+        window_ns = max(window_seconds * 1_000_000_000, 1)
+        shard = self._shards[hash(client_id) & (_RATE_LIMIT_SHARDS - 1)]
+
+        with shard.lock:
+            buckets = shard.buckets
+            if current_time >= shard.next_sweep:
+                self._sweep(shard, current_time, window_ns)
+
+            bucket = buckets.get(client_id)
+            if bucket is None:
+                bucket = buckets[client_id] = [float(max_requests), current_time]
+            else:
+                # Refill for the time since the last request, up to a full bucket
+                refill = (current_time - bucket[1]) * max_requests / window_ns
+                bucket[0] = min(float(max_requests), bucket[0] + refill)
+                bucket[1] = current_time
 
-        current_time = time.time()
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return True
 
-        # Clean old requests outside the window
-        if client_id in self._requests:
-            self._requests[client_id] = [
-                req_time for req_time in self._requests[client_id]
-                if current_time - req_time < window_seconds
-            ]
-        else:
-            self._requests[client_id] = []
+        return False
 
-        # Check if under limit
-        if len(self._requests[client_id]) < max_requests:
-            self._requests[client_id].append(current_time)
-            return True
+    @staticmethod
+    def _sweep(shard: _RateLimitShard, current_time: int, window_ns: int) -> None:
+        """
+        Drop buckets idle for at least a window; call with the shard locked.
 
-        return False
+        Such a bucket has refilled completely, so forgetting it is the same
+        as keeping it: the client's next request starts a full bucket.
+        """
+        cutoff = current_time - window_ns
+        idle = [client_id for client_id, bucket in shard.buckets.items() if bucket[1] <= cutoff]
+        for client_id in idle:
+            del shard.buckets[client_id]
+        shard.next_sweep = current_time + min(window_ns, _RATE_LIMIT_SWEEP_NS)
 
 
 # Global rate limiter instance
@@ -17,7 +17,7 @@ from app.core.exceptions import (
     MetadataValidationError,
     SchemaNotFoundError,
     PathNotFoundError,
-    PermissionError,
+    FSPermissionError,
     VersionControlError,
     MDJourneyError,
 )
@@ -588,8 +588,9 @@ class MetadataGenerator:
                 with open(contextual_filepath, "w") as f:
                     json.dump(contextual_data, f, indent=4)
                 logger.info(f"Generated experiment contextual template: {contextual_filepath}")
+            # The builtin PermissionError: OS permission failures become FSPermissionError
             except PermissionError as e:
-                raise PermissionError(contextual_filepath, "write", e)
+                raise FSPermissionError(contextual_filepath, "write", e)
             except Exception as e:
                 raise MetadataGenerationError(
                     f"Failed to write contextual template to {contextual_filepath}",
@@ -609,7 +610,7 @@ class MetadataGenerator:
 
             return contextual_filepath
 
-        except (SchemaNotFoundError, MetadataValidationError, PermissionError, MetadataGenerationError):
+        except (SchemaNotFoundError, MetadataValidationError, FSPermissionError, MetadataGenerationError):
             # Re-raise our custom exceptions
             raise
         except Exception as e:
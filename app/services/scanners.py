@@ -3,14 +3,57 @@ File scanner implementations for the FAIR metadata automation system.
 Contains concrete implementations of the IFileScanner interface.
 """
 
+import mimetypes
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 from ..utils.helpers import calculate_checksum_incremental, get_current_timestamp
 from .interfaces import IFileScanner
 
+# Extension -> MIME type lookup, built once at import. The system registry
+# loaded by mimetypes covers uncommon extensions; the explicit entries keep
+# results for common research formats stable across platforms.
+mimetypes.init()
+_MIME_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        **mimetypes.types_map,
+        ".txt": "text/plain",
+        ".csv": "text/csv",
+        ".json": "application/json",
+        ".xml": "application/xml",
+        ".html": "text/html",
+        ".htm": "text/html",
+        ".css": "text/css",
+        ".js": "application/javascript",
+        ".py": "text/x-python",
+        ".md": "text/markdown",
+        ".pdf": "application/pdf",
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".png": "image/png",
+        ".gif": "image/gif",
+        ".svg": "image/svg+xml",
+        ".zip": "application/zip",
+        ".tar": "application/x-tar",
+        ".gz": "application/gzip",
+        ".bz2": "application/x-bzip2",
+    }
+)
+
+_COMPRESSION_EXTENSIONS: Mapping[str, str] = MappingProxyType(
+    {
+        ".gz": "gzip",
+        ".bz2": "bzip2",
+        ".zip": "zip",
+        ".tar": "tar",
+        ".7z": "7zip",
+        ".rar": "rar",
+    }
+)
+
 
 class DirmetaScanner(IFileScanner):
     """A file scanner implementation that uses the 'dirmeta' library.
@@ -184,41 +227,11 @@ class BasicFileScanner(IFileScanner):
 
     def _guess_mime_type(self, file_path: Path) -> str:
         """Guess MIME type based on file extension."""
-        mime_types = {
-            ".txt": "text/plain",
-            ".csv": "text/csv",
-            ".json": "application/json",
-            ".xml": "application/xml",
-            ".html": "text/html",
-            ".htm": "text/html",
-            ".css": "text/css",
-            ".js": "application/javascript",
-            ".py": "text/x-python",
-            ".md": "text/markdown",
-            ".pdf": "application/pdf",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".gif": "image/gif",
-            ".svg": "image/svg+xml",
-            ".zip": "application/zip",
-            ".tar": "application/x-tar",
-            ".gz": "application/gzip",
-            ".bz2": "application/x-bzip2",
-        }
-        return mime_types.get(file_path.suffix.lower(), "application/octet-stream")
+        return _MIME_TYPES.get(file_path.suffix.lower(), "application/octet-stream")
 
     def _detect_compression(self, file_path: Path) -> str:
         """Detect compression type based on file extension."""
-        compression_extensions = {
-            ".gz": "gzip",
-            ".bz2": "bzip2",
-            ".zip": "zip",
-            ".tar": "tar",
-            ".7z": "7zip",
-            ".rar": "rar",
-        }
-        return compression_extensions.get(file_path.suffix.lower(), "none")
+        return _COMPRESSION_EXTENSIONS.get(file_path.suffix.lower(), "none")
 
     def _get_permissions_string(self, mode: int) -> str:
         """Convert file mode to permissions string."""
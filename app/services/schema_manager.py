@@ -17,7 +17,7 @@ from app.core.exceptions import (
     SchemaNotFoundError,
     SchemaValidationError,
     PathNotFoundError,
-    PermissionError,
+    FSPermissionError,
     MDJourneyError,
 )
 
@@ -145,10 +145,11 @@ class SchemaManager:
                 )
             logger.warning(error_msg)
             return None
+        # The builtin PermissionError: OS permission failures become FSPermissionError
         except PermissionError as e:
             error_msg = f"Permission denied accessing schema: {resolved_path}"
             if not app_config.ALLOW_MISSING_SCHEMAS:
-                raise PermissionError(resolved_path, "read", e)
+                raise FSPermissionError(resolved_path, "read", e)
             logger.warning(error_msg)
             return None
         except json.JSONDecodeError as e:
@@ -5,10 +5,145 @@ Handles Git and DVC operations for metadata and data versioning.
 """
 
 import datetime
-import os
+import itertools
+import logging
 import subprocess
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - optional dependency
+    pygit2 = None
+
+logger = logging.getLogger(__name__)
+
+# Errors raised by either Git backend (CLI or in-process libgit2)
+_GIT_ERRORS: Tuple[Type[Exception], ...] = (subprocess.CalledProcessError,)
+if pygit2 is not None:
+    _GIT_ERRORS += (pygit2.GitError,)
+
+# Maximum number of paths passed to a single ``git add`` invocation, keeping
+# the argument list well below platform ARG_MAX limits.
+GIT_ADD_BATCH_SIZE = 500
+
+
+def _batched(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    """Yield successive lists of at most ``size`` items."""
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _import_dvc() -> Optional[Tuple[Any, Type[Exception]]]:
+    """Import the DVC Python API on demand.
+
+    DVC's import graph is large, so it is only loaded when a DVC operation
+    actually runs.
+
+    Returns:
+        Tuple of (``dvc.repo.Repo``, ``dvc.exceptions.DvcException``), or None
+        if the dvc package is not installed
+    """
+    try:
+        from dvc.exceptions import DvcException
+        from dvc.repo import Repo
+    except ImportError:
+        return None
+    return Repo, DvcException
+
+
+def _porcelain_code(flags: int) -> str:
+    """Translate libgit2 status flags into a ``git status --porcelain`` XY code."""
+    if flags & pygit2.GIT_STATUS_CONFLICTED:
+        return "UU"
+    if flags & pygit2.GIT_STATUS_WT_NEW:
+        return "??"
+
+    index_code = " "
+    for flag, code in (
+        (pygit2.GIT_STATUS_INDEX_NEW, "A"),
+        (pygit2.GIT_STATUS_INDEX_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_INDEX_DELETED, "D"),
+        (pygit2.GIT_STATUS_INDEX_RENAMED, "R"),
+        (pygit2.GIT_STATUS_INDEX_TYPECHANGE, "T"),
+    ):
+        if flags & flag:
+            index_code = code
+            break
+
+    worktree_code = " "
+    for flag, code in (
+        (pygit2.GIT_STATUS_WT_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_WT_DELETED, "D"),
+        (pygit2.GIT_STATUS_WT_RENAMED, "R"),
+        (pygit2.GIT_STATUS_WT_TYPECHANGE, "T"),
+    ):
+        if flags & flag:
+            worktree_code = code
+            break
+
+    return index_code + worktree_code
+
+
+class _StatusSnapshot(NamedTuple):
+    """Working tree status plus the branch information read alongside it."""
+
+    status: str  # ``git status --porcelain`` text
+    branch: str  # ``git branch --show-current`` text
+    has_head: bool  # False until the current branch has a commit
+
+
+def _parse_porcelain_v2(output: bytes) -> _StatusSnapshot:
+    """Parse ``git status --porcelain=v2 --branch`` output.
+
+    Entries are rewritten in the v1 ``XY path`` form so callers see the same
+    status text as ``git status --porcelain``.
+    """
+    branch = ""
+    has_head = False
+    entries = []
+    for line in output.split(b"\n"):
+        if line.startswith(b"# "):
+            key, _, value = line[2:].partition(b" ")
+            if key == b"branch.head" and value != b"(detached)":
+                branch = value.decode("utf-8", "replace")
+            elif key == b"branch.oid":
+                has_head = value != b"(initial)"
+            continue
+
+        kind = line[:1]
+        if kind == b"1":
+            xy, path = line[2:4], line.split(b" ", 8)[8]
+        elif kind == b"2":
+            xy = line[2:4]
+            new_path, _, orig_path = line.split(b" ", 9)[9].partition(b"\t")
+            path = orig_path + b" -> " + new_path
+        elif kind == b"u":
+            xy, path = line[2:4], line.split(b" ", 10)[10]
+        elif kind == b"?":
+            xy, path = b"??", line[2:]
+        else:
+            continue
+        entries.append(xy.replace(b".", b" ") + b" " + path)
+
+    # Only entry lines are decoded; a clean tree never decodes anything
+    status = b"\n".join(entries).strip().decode("utf-8", "replace") if entries else ""
+    return _StatusSnapshot(status, branch, has_head)
 
 
 class VersionControlManager:
@@ -23,13 +158,35 @@ class VersionControlManager:
         self.repo_path = Path(repo_path).resolve()
         self.git_path = self.repo_path / ".git"
         self.dvc_path = self.repo_path / ".dvc"
+        self._repository: Optional[Any] = None
+        # In-process DVC handle and its exception types, loaded on first use
+        self._dvc_repo: Optional[Any] = None
+        self._dvc_errors: Tuple[Type[Exception], ...] = ()
+
+        # Repository setup is deferred to ensure_initialized() so that
+        # constructing a manager never touches the filesystem or spawns git
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def ensure_initialized(self) -> None:
+        """Initialize the Git and DVC repositories on first use.
 
-        # Initialize Git repository if it doesn't exist
-        if not self.git_path.exists():
-            self._init_git_repo()
+        Safe to call repeatedly; only the first call does any work.
+        """
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+
+            # Initialize Git repository if it doesn't exist
+            if not self.git_path.exists():
+                self._init_git_repo()
 
-        # Initialize DVC if not already initialized
-        self._init_dvc()
+            # Initialize DVC if not already initialized
+            self._init_dvc()
+
+            self._initialized = True
 
     def _init_git_repo(self) -> None:
         """Initialize a new Git repository at the repo root."""
@@ -38,7 +195,7 @@ class VersionControlManager:
             subprocess.run(
                 ["git", "init"], cwd=self.repo_path, check=True, capture_output=True
             )
-            print(f"Initialized Git repository in {self.repo_path}")
+            logger.info("Initialized Git repository in %s", self.repo_path)
 
             # Create a README file for initial commit
             readme_path = self.repo_path / "README.md"
@@ -60,10 +217,10 @@ class VersionControlManager:
                 check=True,
                 capture_output=True,
             )
-            print("Created initial Git commit")
+            logger.info("Created initial Git commit")
 
         except subprocess.CalledProcessError as e:
-            print(f"Error initializing Git repository: {e}")
+            logger.error("Error initializing Git repository: %s", e)
             raise
 
     def _init_dvc(self) -> None:
@@ -71,10 +228,18 @@ class VersionControlManager:
         try:
             # Check if DVC is already initialized
             if not self.dvc_path.exists():
-                subprocess.run(
-                    ["dvc", "init"], cwd=self.repo_path, check=True, capture_output=True
-                )
-                print("Initialized DVC")
+                dvc_api = _import_dvc()
+                if dvc_api is not None:
+                    repo_cls, self._dvc_errors = dvc_api[0], (dvc_api[1],)
+                    self._dvc_repo = repo_cls.init(str(self.repo_path))
+                else:
+                    subprocess.run(
+                        ["dvc", "init"],
+                        cwd=self.repo_path,
+                        check=True,
+                        capture_output=True,
+                    )
+                logger.info("Initialized DVC")
 
                 # Add .dvc to Git
                 subprocess.run(
@@ -89,12 +254,90 @@ class VersionControlManager:
                     check=True,
                     capture_output=True,
                 )
-                print("Added DVC to Git")
-
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            print(f"Error initializing DVC: {e}")
+                logger.info("Added DVC to Git")
+
+        except (
+            subprocess.CalledProcessError,
+            FileNotFoundError,
+            *self._dvc_errors,
+        ) as e:
+            logger.error("Error initializing DVC: %s", e)
             # Don't raise the error, just log it
-            print("DVC initialization failed, but continuing...")
+            logger.warning("DVC initialization failed, but continuing...")
+
+    def _get_dvc_repo(self) -> Optional[Any]:
+        """Return an in-process DVC repository handle, if dvc is installed.
+
+        The handle is opened once and reused, so DVC operations avoid paying
+        the CLI's interpreter start-up and module import cost on every call.
+        Returns None when the dvc package is unavailable or the repository
+        cannot be opened, in which case callers fall back to the ``dvc`` CLI.
+        """
+        if self._dvc_repo is None:
+            dvc_api = _import_dvc()
+            if dvc_api is None:
+                return None
+            repo_cls, dvc_error = dvc_api
+            self._dvc_errors = (dvc_error,)
+            try:
+                self._dvc_repo = repo_cls(str(self.repo_path))
+            except dvc_error as e:
+                logger.warning(
+                    "Could not open DVC repository in-process, using dvc CLI: %s", e
+                )
+                return None
+        return self._dvc_repo
+
+    def _get_repository(self) -> Optional[Any]:
+        """Return an in-process libgit2 handle for the repository, if available.
+
+        The handle is opened once and reused, so read-only queries avoid
+        spawning a ``git`` process and re-reading the index each time.
+        Returns None when pygit2 is not installed or the repository cannot be
+        opened, in which case callers fall back to the ``git`` CLI.
+        """
+        if pygit2 is None:
+            return None
+        if self._repository is None:
+            try:
+                self._repository = pygit2.Repository(str(self.repo_path))
+            except (pygit2.GitError, KeyError) as e:
+                logger.warning(
+                    "Could not open repository with pygit2, using git CLI: %s", e
+                )
+                return None
+        return self._repository
+
+    def _read_status(self) -> _StatusSnapshot:
+        """Read the working tree status and current branch.
+
+        Uses the in-process repository when available; otherwise a single
+        ``git status --porcelain=v2 --branch`` call yields both the entries
+        and the branch header, instead of separate status and branch calls.
+        """
+        repository = self._get_repository()
+        if repository is not None:
+            entries = repository.status(untracked_files="normal")
+            status = "\n".join(
+                f"{_porcelain_code(flags)} {path}"
+                for path, flags in sorted(entries.items())
+                if not flags & pygit2.GIT_STATUS_IGNORED
+            ).strip()
+            return _StatusSnapshot(
+                status,
+                self._current_branch(repository),
+                not repository.head_is_unborn,
+            )
+
+        # Output is kept as bytes and decoded explicitly as UTF-8 rather than
+        # with the locale codec
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch"],
+            cwd=self.repo_path,
+            check=True,
+            capture_output=True,
+        )
+        return _parse_porcelain_v2(result.stdout)
 
     def commit_metadata_changes(
         self, message: Optional[str] = None, files: Optional[List[str]] = None
@@ -105,33 +348,27 @@ class VersionControlManager:
             message: Commit message (optional)
             files: Specific files to commit (optional)
         """
+        self.ensure_initialized()
+
         try:
             # Check if there are changes to commit
-            status_result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=self.repo_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-
-            if not status_result.stdout.strip():
-                print("No changes to commit")
+            if not self._read_status().status:
+                logger.info("No changes to commit")
                 return
 
-            # Add metadata files to Git
+            # Add metadata files to Git, one invocation per batch of paths
             if files:
-                for file in files:
+                for batch in _batched(files, GIT_ADD_BATCH_SIZE):
                     subprocess.run(
-                        ["git", "add", file],
+                        ["git", "add", "--", *batch],
                         cwd=self.repo_path,
                         check=True,
                         capture_output=True,
                     )
             else:
-                # Add all metadata files
+                # Add all metadata files; Git expands the pathspecs itself
                 subprocess.run(
-                    ["git", "add", "*.json", "*.md", "*.txt"],
+                    ["git", "add", "--", "*.json", "*.md", "*.txt"],
                     cwd=self.repo_path,
                     check=True,
                     capture_output=True,
@@ -145,10 +382,10 @@ class VersionControlManager:
                 check=True,
                 capture_output=True,
             )
-            print(f"Committed metadata changes: {commit_message}")
+            logger.info("Committed metadata changes: %s", commit_message)
 
-        except subprocess.CalledProcessError as e:
-            print(f"Error committing metadata changes: {e}")
+        except _GIT_ERRORS as e:
+            logger.error("Error committing metadata changes: %s", e)
             raise
 
     def add_data_file_to_dvc(self, file_path: str, dataset_path: str) -> None:
@@ -158,46 +395,46 @@ class VersionControlManager:
             file_path: Path to the data file to add
             dataset_path: Path to the dataset directory
         """
+        self.ensure_initialized()
+
         try:
-            # Convert to relative path from repo root
+            # Resolve once and derive every other path from the result
             file_path_obj = Path(file_path).resolve()
             rel_file_path = file_path_obj.relative_to(self.repo_path)
+            filename = file_path_obj.name
+            dvc_file = str(rel_file_path) + ".dvc"
+            dvc_file_abs = self.repo_path / dvc_file
 
             # Check if file is already tracked by DVC
-            dvc_file = str(rel_file_path) + ".dvc"
-            if os.path.exists(os.path.join(self.repo_path, dvc_file)):
-                print(f"File {os.path.basename(file_path)} is already tracked by DVC")
+            if dvc_file_abs.is_file():
+                logger.info("File %s is already tracked by DVC", filename)
                 return
 
             # Add file to DVC (DVC will create .dvc file alongside the data file)
-            subprocess.run(
-                ["dvc", "add", str(rel_file_path)],
-                cwd=self.repo_path,
-                check=True,
-                capture_output=True,
-            )
-
-            # Add the .dvc file to Git
-            if os.path.exists(os.path.join(self.repo_path, dvc_file)):
+            dvc_repo = self._get_dvc_repo()
+            if dvc_repo is not None:
+                # Absolute target, since in-process DVC resolves paths from cwd
+                dvc_repo.add(str(file_path_obj))
+            else:
                 subprocess.run(
-                    ["git", "add", dvc_file],
+                    ["dvc", "add", str(rel_file_path)],
                     cwd=self.repo_path,
                     check=True,
                     capture_output=True,
                 )
 
-                # Check if there are changes to commit
-                status_result = subprocess.run(
-                    ["git", "status", "--porcelain"],
+            # Add the .dvc file to Git
+            if dvc_file_abs.is_file():
+                subprocess.run(
+                    ["git", "add", dvc_file],
                     cwd=self.repo_path,
                     check=True,
                     capture_output=True,
-                    text=True,
                 )
 
-                if status_result.stdout.strip():
+                # Check if there are changes to commit
+                if self._read_status().status:
                     # Commit the .dvc file
-                    filename = Path(file_path).name
                     message = f"Add data file to DVC: {filename}"
                     subprocess.run(
                         ["git", "commit", "-m", message],
@@ -205,12 +442,12 @@ class VersionControlManager:
                         check=True,
                         capture_output=True,
                     )
-                    print(f"Added {filename} to DVC tracking")
+                    logger.info("Added %s to DVC tracking", filename)
                 else:
-                    print(f"No changes to commit for {filename}")
+                    logger.info("No changes to commit for %s", filename)
 
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            print(f"Error adding file to DVC: {e}")
+        except (*_GIT_ERRORS, FileNotFoundError, *self._dvc_errors) as e:
+            logger.error("Error adding file to DVC: %s", e)
             raise
 
     def get_git_status(self) -> Dict[str, Any]:
@@ -219,43 +456,36 @@ class VersionControlManager:
         Returns:
             Dictionary containing Git status information
         """
-        try:
-            # Get status
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=self.repo_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+        self.ensure_initialized()
 
-            # Get current branch
-            branch_result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=self.repo_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+        try:
+            # Get status and current branch
+            snapshot = self._read_status()
 
             # Get last commit
-            commit_result = subprocess.run(
-                ["git", "log", "-1", "--oneline"],
-                cwd=self.repo_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            repository = self._get_repository()
+            if repository is not None:
+                last_commit = self._last_commit_summary(repository)
+            elif snapshot.has_head:
+                commit_result = subprocess.run(
+                    ["git", "log", "-1", "--oneline"],
+                    cwd=self.repo_path,
+                    check=True,
+                    capture_output=True,
+                )
+                last_commit = commit_result.stdout.strip().decode("utf-8", "replace")
+            else:
+                last_commit = ""
 
             return {
-                "status": result.stdout.strip(),
-                "branch": branch_result.stdout.strip(),
-                "last_commit": commit_result.stdout.strip(),
-                "has_changes": bool(result.stdout.strip()),
+                "status": snapshot.status,
+                "branch": snapshot.branch,
+                "last_commit": last_commit,
+                "has_changes": bool(snapshot.status),
             }
 
-        except subprocess.CalledProcessError as e:
-            print(f"Error getting Git status: {e}")
+        except _GIT_ERRORS as e:
+            logger.error("Error getting Git status: %s", e)
             return {
                 "status": "",
                 "branch": "",
@@ -264,13 +494,43 @@ class VersionControlManager:
                 "error": str(e),
             }
 
+    @staticmethod
+    def _current_branch(repository: Any) -> str:
+        """Mirror ``git branch --show-current`` using an open repository."""
+        if repository.head_is_detached:
+            return ""
+        if repository.head_is_unborn:
+            # HEAD points at a branch that has no commits yet
+            return repository.references["HEAD"].target.rpartition("refs/heads/")[2]
+        return repository.head.shorthand
+
+    @staticmethod
+    def _last_commit_summary(repository: Any) -> str:
+        """Mirror ``git log -1 --oneline`` using an open repository."""
+        if repository.head_is_unborn:
+            return ""
+        commit = repository.head.peel(pygit2.Commit)
+        subject = commit.message.strip().split("\n", 1)[0]
+        return f"{commit.short_id} {subject}"
+
     def get_dvc_status(self) -> Dict[str, Any]:
         """Get the current DVC status.
 
         Returns:
             Dictionary containing DVC status information
         """
+        self.ensure_initialized()
+
         try:
+            dvc_repo = self._get_dvc_repo()
+            if dvc_repo is not None:
+                # Maps each out-of-date stage/output to its list of changes
+                changes = dvc_repo.status()
+                return {
+                    "status": "\n".join(sorted(changes)),
+                    "has_changes": bool(changes),
+                }
+
             result = subprocess.run(
                 ["dvc", "status"],
                 cwd=self.repo_path,
@@ -284,8 +544,12 @@ class VersionControlManager:
                 "has_changes": "not in sync" in result.stdout.lower(),
             }
 
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            print(f"Error getting DVC status: {e}")
+        except (
+            subprocess.CalledProcessError,
+            FileNotFoundError,
+            *self._dvc_errors,
+        ) as e:
+            logger.error("Error getting DVC status: %s", e)
             return {
                 "status": "",
                 "has_changes": False,
@@ -299,6 +563,8 @@ class VersionControlManager:
             tag_name: Name of the tag
             message: Tag message (uses tag name if None)
         """
+        self.ensure_initialized()
+
         try:
             if not message:
                 message = f"Tag: {tag_name}"
@@ -309,10 +575,10 @@ class VersionControlManager:
                 check=True,
                 capture_output=True,
             )
-            print(f"Created tag: {tag_name}")
+            logger.info("Created tag: %s", tag_name)
 
         except subprocess.CalledProcessError as e:
-            print(f"Error creating tag: {e}")
+            logger.error("Error creating tag: %s", e)
             raise
 
     def get_file_history(self, file_path: str) -> List[Dict[str, Any]]:
@@ -324,6 +590,8 @@ class VersionControlManager:
         Returns:
             List of commit information dictionaries
         """
+        self.ensure_initialized()
+
         try:
             # Convert to relative path from repo root
             file_path_obj = Path(file_path).resolve()
@@ -334,7 +602,9 @@ class VersionControlManager:
                     "git",
                     "log",
                     "--follow",
-                    "--pretty=format:%H|%an|%ad|%s",
+                    # Unit/record separators cannot appear in commit fields,
+                    # so subjects containing "|" no longer corrupt records
+                    "--pretty=format:%H%x1f%an%x1f%ad%x1f%s%x1e",
                     "--date=iso",
                     str(rel_file_path),
                 ],
@@ -344,24 +614,17 @@ class VersionControlManager:
                 text=True,
             )
 
-            history = []
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    parts = line.split("|")
-                    if len(parts) == 4:
-                        history.append(
-                            {
-                                "hash": parts[0],
-                                "author": parts[1],
-                                "date": parts[2],
-                                "message": parts[3],
-                            }
-                        )
-
-            return history
+            return [
+                {"hash": commit, "author": author, "date": date, "message": subject}
+                for commit, author, date, subject in (
+                    record.lstrip("\n").split("\x1f", 3)
+                    for record in result.stdout.split("\x1e")
+                    if record.strip()
+                )
+            ]
 
         except subprocess.CalledProcessError as e:
-            print(f"Error getting file history: {e}")
+            logger.error("Error getting file history: %s", e)
             return []
 
     def revert_to_commit(self, commit_hash: str) -> None:
@@ -370,6 +633,8 @@ class VersionControlManager:
         Args:
             commit_hash: Hash of the commit to revert to
         """
+        self.ensure_initialized()
+
         try:
             subprocess.run(
                 ["git", "reset", "--hard", commit_hash],
@@ -377,10 +642,10 @@ class VersionControlManager:
                 check=True,
                 capture_output=True,
             )
-            print(f"Reverted to commit: {commit_hash}")
+            logger.info("Reverted to commit: %s", commit_hash)
 
         except subprocess.CalledProcessError as e:
-            print(f"Error reverting to commit: {e}")
+            logger.error("Error reverting to commit: %s", e)
             raise
 
 
@@ -399,6 +664,7 @@ def init_version_control(repo_path: str = ".") -> VersionControlManager:
     """
     global _vc_manager
     _vc_manager = VersionControlManager(repo_path)
+    _vc_manager.ensure_initialized()
     return _vc_manager
 
 
@@ -2,9 +2,46 @@
 Utility functions for the FAIR Metadata Automation System.
 
 This package contains helper functions and utilities used throughout the application.
+Helpers are re-exported lazily: ``app.utils.helpers`` (and the configuration it
+pulls in) is only imported the first time one of the names below is accessed.
 """
 
-from . import (
-    helpers as utils,  # Back-compat alias so `from app.utils import utils` works
-)
-from .helpers import *
+import importlib
+from typing import Any, Dict, List
+
+# Public name -> submodule that defines it
+_EXPORTS: Dict[str, str] = {
+    "MIN_CHECKSUM_BUFFER_SIZE": "helpers",
+    "calculate_checksum_incremental": "helpers",
+    "ensure_directory_exists": "helpers",
+    "format_file_size": "helpers",
+    "get_current_date": "helpers",
+    "get_current_timestamp": "helpers",
+    "get_project_id_from_path": "helpers",
+    "is_dataset_folder": "helpers",
+    "is_project_folder": "helpers",
+    "sanitize_filename": "helpers",
+}
+
+# Module aliases; `utils` keeps `from app.utils import utils` working
+_MODULE_ALIASES: Dict[str, str] = {"utils": "helpers"}
+
+__all__ = sorted([*_EXPORTS, *_MODULE_ALIASES])
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve re-exported helpers on first access and cache them."""
+    if name in _MODULE_ALIASES:
+        value = importlib.import_module(f".{_MODULE_ALIASES[name]}", __name__)
+    elif name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *__all__])
@@ -22,6 +22,31 @@ def get_current_date() -> str:
     return datetime.now().strftime("%Y-%m-%d")
 
 
+# Smallest read buffer used when hashing; matches hashlib.file_digest() and
+# keeps per-chunk interpreter overhead negligible next to the hash itself
+MIN_CHECKSUM_BUFFER_SIZE = 256 * 1024
+
+
+def _new_hash(algorithm: str) -> Any:
+    """Create a hash object for the given algorithm name.
+
+    ``blake3`` is supported when the optional blake3 package is installed;
+    every other name is resolved through hashlib (OpenSSL).
+    """
+    name = algorithm.lower()
+    if name == "blake3":
+        try:
+            from blake3 import blake3
+        except ImportError as e:
+            raise ImportError(
+                "The blake3 checksum algorithm requires the blake3 package. "
+                "Install with: pip install 'mdjourney[blake3]'"
+            ) from e
+
+        return blake3(max_threads=blake3.AUTO)
+    return getattr(hashlib, name)()
+
+
 def calculate_checksum_incremental(
     filepath: Path,
     algorithm: str = None,
@@ -30,10 +55,14 @@ def calculate_checksum_incremental(
     """
     Calculate checksum of a file using incremental reading.
 
+    The file is read unbuffered into a single reusable buffer, so large files
+    are hashed without allocating a new bytes object per chunk.
+
     Args:
         filepath: Path to the file
         algorithm: Hash algorithm to use (default: from config)
-        chunk_size: Size of chunks to read (default: from config)
+        chunk_size: Size of chunks to read (default: from config); raised to
+            at least MIN_CHECKSUM_BUFFER_SIZE
 
     Returns:
         Hexadecimal checksum string
@@ -48,15 +77,17 @@ def calculate_checksum_incremental(
         chunk_size = get_chunk_size()
 
     # Get the hash function
-    hash_func = getattr(hashlib, algorithm.lower())()
+    hash_func = _new_hash(algorithm)
 
     try:
-        with open(filepath, "rb") as f:
+        buffer = bytearray(max(chunk_size, MIN_CHECKSUM_BUFFER_SIZE))
+        view = memoryview(buffer)
+        with open(filepath, "rb", buffering=0) as f:
             while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
+                size = f.readinto(buffer)
+                if not size:
                     break
-                hash_func.update(chunk)
+                hash_func.update(view[:size])
 
         return str(hash_func.hexdigest())
     except Exception as e:
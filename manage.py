@@ -9,36 +9,7 @@ import sys
 import logging
 
 
-def main():
-    """Main CLI entry point."""
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-    logger = logging.getLogger("mdjourney.cli")
-    parser = argparse.ArgumentParser(
-        prog="mdjourney",
-        description="FAIR-compliant research data metadata automation system",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  mdjourney setup                    # Interactive setup
-  mdjourney setup --monitor-path ./data --schema-path ./schemas
-  mdjourney monitor                  # Start file system monitor
-  mdjourney api                      # Start API server
-  mdjourney start                    # Start all services
-  mdjourney start --monitor-only     # Start only monitor
-  mdjourney start --api-only         # Start only API
-  mdjourney start --backend-only     # Start only backend (API + Monitor)
-  mdjourney start --frontend-only    # Start only frontend
-  mdjourney version                  # Show version information
-        """,
-    )
-
-    parser.add_argument("--version", action="version", version="%(prog)s 1.0.0")
-
-    subparsers = parser.add_subparsers(
-        dest="command", help="Available commands", metavar="COMMAND"
-    )
-
-    # Setup command
+def _add_setup(subparsers):
     setup_parser = subparsers.add_parser("setup", help="Configure the system")
     setup_parser.add_argument("--monitor-path", help="Directory to monitor for changes")
     setup_parser.add_argument(
@@ -50,10 +21,12 @@ Examples:
         help="Path to save configuration file",
     )
 
-    # Monitor command
+
+def _add_monitor(subparsers):
     subparsers.add_parser("monitor", help="Start file system monitor")
 
-    # API command
+
+def _add_api(subparsers):
     api_parser = subparsers.add_parser("api", help="Start API server")
     api_parser.add_argument("--host", default="0.0.0.0", help="API server host")
     api_parser.add_argument("--port", type=int, default=8000, help="API server port")
@@ -61,7 +34,8 @@ Examples:
         "--reload", action="store_true", help="Enable auto-reload for development"
     )
 
-    # Start command
+
+def _add_start(subparsers):
     start_parser = subparsers.add_parser("start", help="Start all services")
     start_parser.add_argument(
         "--monitor-only", action="store_true", help="Start only the monitor service"
@@ -85,7 +59,8 @@ Examples:
         "--no-reload", action="store_true", help="Disable API auto-reload"
     )
 
-    # Test command
+
+def _add_test(subparsers):
     test_parser = subparsers.add_parser("test", help="Run tests")
     test_parser.add_argument("--unit", action="store_true", help="Run only unit tests")
     test_parser.add_argument(
@@ -95,21 +70,94 @@ Examples:
         "--verbose", "-v", action="store_true", help="Verbose output"
     )
 
-    # Lint command
+
+def _add_lint(subparsers):
     subparsers.add_parser("lint", help="Run linting and code formatting checks")
 
-    # Format command
+
+def _add_format(subparsers):
     subparsers.add_parser("format", help="Format code using black and isort")
 
-    # Version command
+
+def _add_version(subparsers):
     subparsers.add_parser("version", help="Show version information")
 
+
+# Subcommand name -> function registering its parser (in --help order)
+SUBCOMMANDS = {
+    "setup": _add_setup,
+    "monitor": _add_monitor,
+    "api": _add_api,
+    "start": _add_start,
+    "test": _add_test,
+    "lint": _add_lint,
+    "format": _add_format,
+    "version": _add_version,
+}
+
+
+def _sniff_subcommand(argv):
+    """
+    Return the subcommand named on the command line, if any.
+
+    Only the first positional token is considered. Top-level help requests and
+    unknown commands return None so the full parser is built to handle them.
+    """
+    for token in argv[1:]:
+        if token in ("-h", "--help"):
+            return None
+        if not token.startswith("-"):
+            return token if token in SUBCOMMANDS else None
+    return None
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        prog="mdjourney",
+        description="FAIR-compliant research data metadata automation system",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  mdjourney setup                    # Interactive setup
+  mdjourney setup --monitor-path ./data --schema-path ./schemas
+  mdjourney monitor                  # Start file system monitor
+  mdjourney api                      # Start API server
+  mdjourney start                    # Start all services
+  mdjourney start --monitor-only     # Start only monitor
+  mdjourney start --api-only         # Start only API
+  mdjourney start --backend-only     # Start only backend (API + Monitor)
+  mdjourney start --frontend-only    # Start only frontend
+  mdjourney version                  # Show version information
+        """,
+    )
+
+    parser.add_argument("--version", action="version", version="%(prog)s 1.0.0")
+
+    subparsers = parser.add_subparsers(
+        dest="command", help="Available commands", metavar="COMMAND"
+    )
+
+    # Only build the parser for the requested command; everything else
+    # (no command, --help, typos) gets the full tree
+    command = _sniff_subcommand(sys.argv)
+    if command:
+        SUBCOMMANDS[command](subparsers)
+    else:
+        for add_subcommand in SUBCOMMANDS.values():
+            add_subcommand(subparsers)
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         return 1
 
+    # Configure logging only once a command will actually run, so that
+    # --help, --version and usage errors exit without touching it
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    logger = logging.getLogger("mdjourney.cli")
+
     # Route to appropriate command handler
     try:
         if args.command == "setup":
@@ -167,7 +215,10 @@ Examples:
                 logger.error("uvicorn not installed. Install with: pip install 'mdjourney[api]'")
                 return 1
 
-            logger.info(f"Starting API server on {args.host}:{args.port}")
+            from scripts.process_manager import uvicorn_loop
+
+            loop = uvicorn_loop()
+            logger.info(f"Starting API server on {args.host}:{args.port} ({loop} event loop)")
             logger.info(f"Documentation: http://{args.host}:{args.port}/docs")
 
             uvicorn.run(
@@ -175,6 +226,7 @@ Examples:
                 host=args.host,
                 port=args.port,
                 reload=args.reload,
+                loop=loop,
                 log_level="info",
             )
 
@@ -202,7 +254,6 @@ Examples:
 
         elif args.command == "test":
             import subprocess
-            import sys
 
             test_args = ["python", "-m", "pytest"]
 
@@ -221,7 +272,6 @@ Examples:
 
         elif args.command == "lint":
             import subprocess
-            import sys
 
             logger.info("Running linting checks...")
 
@@ -251,7 +301,6 @@ Examples:
 
         elif args.command == "format":
             import subprocess
-            import sys
 
             logger.info("Formatting code...")
 
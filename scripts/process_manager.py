@@ -4,6 +4,7 @@ Process manager for the FAIR metadata automation system.
 Handles starting, monitoring, and stopping system services.
 """
 
+import importlib.util
 import os
 import signal
 import subprocess
@@ -16,6 +17,18 @@ from typing import List, Optional
 from app.core.config import find_config_file, get_monitor_path, initialize_config
 
 
+def uvicorn_loop() -> str:
+    """
+    Pick the event loop implementation for uvicorn.
+
+    uvloop (installed with uvicorn[standard]) is used where available; it does
+    not support Windows. Choosing explicitly saves uvicorn probing for it.
+    """
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        return "uvloop"
+    return "asyncio"
+
+
 class ProcessManager:
     """Manages system processes for the FAIR metadata automation system."""
 
@@ -110,6 +123,8 @@ class ProcessManager:
                     "--port",
                     str(port),
                     "--reload" if reload else "--no-reload",
+                    "--loop",
+                    uvicorn_loop(),
                 ],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
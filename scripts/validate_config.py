@@ -93,7 +93,7 @@ def validate_configuration(config_path: str, environment: str = None) -> Tuple[b
         file_processing_config = config_manager.get_setting('file_processing', {})
         if file_processing_config:
             checksum_algo = file_processing_config.get('checksum_algorithm')
-            if checksum_algo and checksum_algo not in ['sha1', 'sha256', 'sha512', 'md5']:
+            if checksum_algo and checksum_algo not in ['sha1', 'sha256', 'sha512', 'md5', 'blake3']:
                 errors.append(f"Unsupported checksum algorithm: {checksum_algo}")
 
             chunk_size = file_processing_config.get('chunk_size')
@@ -0,0 +1,188 @@
+"""
+Unit tests for the authentication module.
+Tests cover API key management and role-based access control.
+"""
+
+import asyncio
+import hashlib
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException, Request
+
+from app.core import auth
+from app.core.auth import (
+    APIKeyManager,
+    RoleBasedAccessControl,
+    get_client_ip,
+    get_current_user,
+    get_optional_user,
+    require_permission,
+)
+
+
+class TestAPIKeyManager:
+    """Test cases for the APIKeyManager class."""
+
+    def test_generated_key_validates(self):
+        """Test that a generated key validates and unknown keys do not."""
+        manager = APIKeyManager()
+        api_key = manager.generate_api_key("ci", ["viewer"])
+
+        key_info = manager.validate_api_key(api_key)
+        assert key_info["name"] == "ci"
+        assert key_info["roles"] == ["viewer"]
+        assert manager.validate_api_key("not-a-key") is None
+
+    def test_keys_are_not_stored_in_plaintext(self):
+        """Test that only key digests are kept in memory."""
+        with patch.dict("os.environ", {"MDJOURNEY_API_KEY": "env-secret"}):
+            manager = APIKeyManager()
+        api_key = manager.generate_api_key("ci", ["viewer"])
+
+        assert "env-secret" not in manager._api_keys
+        assert api_key not in manager._api_keys
+        assert manager.validate_api_key("env-secret")["name"] == "default"
+
+    def test_digests_are_keyed(self):
+        """Test that stored digests depend on the server pepper."""
+        manager = APIKeyManager()
+        api_key = manager.generate_api_key("ci", ["viewer"])
+
+        unkeyed = hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+        assert unkeyed not in manager._api_keys
+        with patch.object(auth, "_API_KEY_PEPPER", b"other-pepper"):
+            assert manager.validate_api_key(api_key) is None
+        assert manager.validate_api_key(api_key) is not None
+
+    def test_validation_tracks_last_use_without_mutating(self):
+        """Test that last use is recorded outside the returned key info."""
+        manager = APIKeyManager()
+        api_key = manager.generate_api_key("ci", ["viewer"])
+        assert manager.get_last_used(api_key) is None
+
+        key_info = manager.validate_api_key(api_key)
+        snapshot = dict(key_info)
+        assert manager.validate_api_key(api_key) == snapshot
+        assert manager.get_last_used(api_key) is not None
+
+    def test_revoke_api_key(self):
+        """Test that a revoked key no longer validates."""
+        manager = APIKeyManager()
+        api_key = manager.generate_api_key("ci", ["editor"])
+
+        assert manager.revoke_api_key(api_key) is True
+        assert manager.revoke_api_key(api_key) is False
+        assert manager.validate_api_key(api_key) is None
+        assert manager.get_last_used(api_key) is None
+
+
+class TestLocalUser:
+    """Test cases for the identity used when authentication is disabled."""
+
+    def test_local_user_when_auth_disabled(self):
+        """Test that both dependencies return the local admin user."""
+        with patch("app.core.auth._AUTH_DISABLED", True):
+            user = get_current_user(None)
+            optional_user = get_optional_user(None)
+
+        assert user is optional_user
+        assert user["name"] == "local_user"
+        assert list(user["roles"]) == ["admin"]
+        with pytest.raises(TypeError):
+            user["roles"] = ["viewer"]
+
+    def test_optional_user_without_credentials(self):
+        """Test that an unauthenticated request gets no user when enabled."""
+        with patch("app.core.auth._AUTH_DISABLED", False):
+            assert get_optional_user(None) is None
+            with pytest.raises(HTTPException):
+                get_current_user(None)
+
+
+class TestRoleBasedAccessControl:
+    """Test cases for the RoleBasedAccessControl class."""
+
+    @pytest.mark.parametrize(
+        "roles,permission,expected",
+        [
+            (["admin"], "manage", True),
+            (["viewer", "editor"], "write", True),
+            (["viewer"], "write", False),
+            (["unknown"], "read", False),
+            ([], "read", False),
+        ],
+    )
+    def test_has_permission(self, roles, permission, expected):
+        """Test permission checks across single and multiple roles."""
+        assert RoleBasedAccessControl.has_permission(roles, permission) is expected
+
+    @pytest.mark.parametrize(
+        "method,path,expected",
+        [
+            ("GET", "/api/v1/projects", "read"),
+            ("GET", "/api/v1/projects/p_42/datasets", "read"),
+            ("PUT", "/api/v1/datasets/d_1/metadata/admin", "write"),
+            ("POST", "/api/v1/config/reload", "manage"),
+            ("GET", "/api/v1/projects/p_42/datasets/extra", None),
+            ("DELETE", "/api/v1/projects", None),
+        ],
+    )
+    def test_get_endpoint_permission(self, method, path, expected):
+        """Test that templated endpoints match concrete request paths."""
+        assert RoleBasedAccessControl.get_endpoint_permission(method, path) == expected
+
+
+class TestGetClientIP:
+    """Test cases for client address resolution."""
+
+    def _request(self, headers, host="10.0.0.9"):
+        scope = {
+            "type": "http",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+            "client": (host, 1234),
+        }
+        return Request(scope)
+
+    def test_forwarded_for_first_hop(self):
+        """Test that the first X-Forwarded-For entry is the client."""
+        request = self._request({"X-Forwarded-For": " 1.2.3.4 , 5.6.7.8, 9.9.9.9"})
+        assert get_client_ip(request) == "1.2.3.4"
+
+    def test_real_ip_and_direct_fallback(self):
+        """Test X-Real-IP and the direct connection fallbacks."""
+        assert get_client_ip(self._request({"X-Real-IP": "4.3.2.1"})) == "4.3.2.1"
+        assert get_client_ip(self._request({})) == "10.0.0.9"
+
+
+class TestRequirePermission:
+    """Test cases for the require_permission decorator."""
+
+    @staticmethod
+    @require_permission("write")
+    async def _update(user_info=None):
+        return "updated"
+
+    def test_allows_role_with_permission(self):
+        """Test that a user holding the permission reaches the endpoint."""
+        result = asyncio.run(self._update(user_info={"roles": ["editor"]}))
+        assert result == "updated"
+
+    def test_accepts_current_user_keyword(self):
+        """Test that the user may also be bound as ``current_user``."""
+
+        @require_permission("read")
+        async def _read(current_user=None):
+            return current_user["roles"]
+
+        assert asyncio.run(_read(current_user={"roles": ["viewer"]})) == ["viewer"]
+
+    @pytest.mark.parametrize(
+        "user_info,status_code",
+        [(None, 401), ({"roles": ["viewer"]}, 403), ({"roles": ["unknown"]}, 403)],
+    )
+    def test_rejects_missing_or_insufficient_user(self, user_info, status_code):
+        """Test that missing users and insufficient roles are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(self._update(user_info=user_info))
+        assert exc_info.value.status_code == status_code
@@ -0,0 +1,227 @@
+"""
+Unit tests for the background task manager.
+Each test drives the manager on its own event loop via asyncio.run.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.core.background_tasks import (
+    BackgroundTask,
+    BackgroundTaskManager,
+    TaskStatus,
+)
+
+
+class TestBackgroundTaskManager:
+    """Test cases for the BackgroundTaskManager class."""
+
+    def test_tasks_run_concurrently(self):
+        """Test that up to max_concurrent_tasks tasks run at the same time."""
+
+        async def scenario():
+            manager = BackgroundTaskManager(max_concurrent_tasks=3)
+            await manager.start()
+            running = 0
+            peak = 0
+            release = asyncio.Event()
+
+            async def job():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await release.wait()
+                running -= 1
+
+            for i in range(3):
+                await manager.submit_task(f"task-{i}", "test", job)
+            while peak < 3:
+                await asyncio.sleep(0.01)
+            release.set()
+            while manager.running_tasks or not manager.task_queue.empty():
+                await asyncio.sleep(0.01)
+            await manager.stop()
+            return manager, peak
+
+        manager, peak = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+        assert peak == 3
+        assert all(t.status == TaskStatus.COMPLETED for t in manager.tasks.values())
+
+    def test_restart_after_stop(self):
+        """Test that idle workers stop on signal and can be started again."""
+
+        async def scenario():
+            manager = BackgroundTaskManager(max_concurrent_tasks=2)
+            await manager.start()
+            await asyncio.sleep(0)
+            await manager.stop()
+            assert manager._workers == []
+
+            await manager.submit_task("later", "test", lambda: "ok")
+            await manager.start()
+            while manager.tasks["later"].status != TaskStatus.COMPLETED:
+                await asyncio.sleep(0.01)
+            await manager.stop()
+            return manager.tasks["later"]
+
+        task = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+        assert task.result == "ok"
+
+    def test_failed_task_records_error(self):
+        """Test that exceptions raised by a task are captured on the task."""
+
+        async def scenario():
+            manager = BackgroundTaskManager(max_concurrent_tasks=1)
+            await manager.start()
+
+            def boom():
+                raise RuntimeError("boom")
+
+            await manager.submit_task("bad", "test", boom)
+            while manager.tasks["bad"].status in (
+                TaskStatus.PENDING,
+                TaskStatus.RUNNING,
+            ):
+                await asyncio.sleep(0.01)
+            await manager.stop()
+            return manager.tasks["bad"]
+
+        task = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+        assert task.status == TaskStatus.FAILED
+        assert task.error == "boom"
+        assert task.completed_at is not None
+
+    def test_duplicate_task_id_rejected(self):
+        """Test that a task id can only be submitted once."""
+
+        async def scenario():
+            manager = BackgroundTaskManager()
+            await manager.submit_task("dup", "test", lambda: None)
+            with pytest.raises(ValueError):
+                await manager.submit_task("dup", "test", lambda: None)
+
+        asyncio.run(scenario())
+
+    def test_cpu_bound_task_runs_in_process_pool(self):
+        """Test that cpu_bound tasks run in a worker process."""
+
+        async def scenario():
+            manager = BackgroundTaskManager(max_concurrent_tasks=1)
+            await manager.start()
+            await manager.submit_task(
+                "cpu", "test", os.getpid, metadata={"cpu_bound": True}
+            )
+            await manager.submit_task("io", "test", os.getpid)
+            await manager.submit_task(
+                "thread", "test", lambda: threading.current_thread().name
+            )
+            while any(
+                t.status in (TaskStatus.PENDING, TaskStatus.RUNNING)
+                for t in manager.tasks.values()
+            ):
+                await asyncio.sleep(0.01)
+            await manager.stop()
+            return manager.tasks
+
+        tasks = asyncio.run(asyncio.wait_for(scenario(), timeout=30))
+        assert tasks["cpu"].status == TaskStatus.COMPLETED
+        assert tasks["cpu"].result != os.getpid()
+        assert tasks["io"].result == os.getpid()
+        assert tasks["thread"].result.startswith("mdjourney-task")
+
+    def test_cleanup_old_tasks_keeps_unfinished(self):
+        """Test that cleanup removes expired finished tasks only."""
+
+        async def scenario():
+            manager = BackgroundTaskManager()
+            for task_id in ("done", "failed", "pending"):
+                await manager.submit_task(task_id, "test", lambda: None)
+            manager._set_status(manager.tasks["done"], TaskStatus.COMPLETED)
+            manager._set_status(manager.tasks["failed"], TaskStatus.FAILED)
+
+            assert await manager.cleanup_old_tasks(max_age_hours=1) == 0
+            assert await manager.cleanup_old_tasks(max_age_hours=0) == 2
+            assert set(manager.tasks) == {"pending"}
+
+            # The unfinished task is still tracked for a later sweep
+            assert await manager.cancel_task("pending") is True
+            assert await manager.cleanup_old_tasks(max_age_hours=0) == 1
+            return manager
+
+        manager = asyncio.run(scenario())
+        assert manager.tasks == {}
+
+    def test_list_tasks_and_stats_use_indexes(self):
+        """Test filtering, ordering and counts across status transitions."""
+
+        async def scenario():
+            manager = BackgroundTaskManager()
+            for i in range(4):
+                task_type = "scan" if i % 2 else "generate"
+                await manager.submit_task(f"t{i}", task_type, lambda: None)
+            await manager.cancel_task("t1")
+            await manager.cancel_task("t2")
+
+            newest = await manager.list_tasks(limit=2)
+            cancelled = await manager.list_tasks(status=TaskStatus.CANCELLED)
+            scans = await manager.list_tasks(task_type="scan")
+            pending_scans = await manager.list_tasks(
+                task_type="scan", status=TaskStatus.PENDING
+            )
+            stats = await manager.get_stats()
+            return newest, cancelled, scans, pending_scans, stats
+
+        newest, cancelled, scans, pending_scans, stats = asyncio.run(scenario())
+        assert [t.task_id for t in newest] == ["t3", "t2"]
+        assert [t.task_id for t in cancelled] == ["t2", "t1"]
+        assert [t.task_id for t in scans] == ["t3", "t1"]
+        assert [t.task_id for t in pending_scans] == ["t3"]
+        assert stats["total_tasks"] == 4
+        assert stats["status_counts"] == {"pending": 2, "cancelled": 2}
+
+    def test_unfiltered_list_walks_newest_first(self):
+        """Test that unfiltered listing stops at the limit and skips removed tasks."""
+
+        async def scenario():
+            manager = BackgroundTaskManager()
+            for i in range(5):
+                await manager.submit_task(f"t{i}", "scan", lambda: None)
+            manager._remove_task(manager.tasks["t3"])
+            with patch("app.core.background_tasks.heapq.nlargest") as nlargest:
+                newest = await manager.list_tasks(limit=3)
+            assert not nlargest.called
+            return newest
+
+        newest = asyncio.run(scenario())
+        assert [t.task_id for t in newest] == ["t4", "t2", "t1"]
+
+    def test_timestamps_convert_to_utc_datetimes(self):
+        """Test that nanosecond timestamps are exposed as aware datetimes."""
+
+        async def scenario():
+            manager = BackgroundTaskManager()
+            await manager.submit_task("t", "test", lambda: None)
+            return manager.tasks["t"]
+
+        before = datetime.now(timezone.utc)
+        task = asyncio.run(scenario())
+        after = datetime.now(timezone.utc)
+
+        assert isinstance(task.created_at, int)
+        assert before - timedelta(milliseconds=1) <= task.created_at_dt <= after
+        assert task.created_at_dt.tzinfo is timezone.utc
+        assert task.started_at_dt is None and task.completed_at_dt is None
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="needs slots=True")
+    def test_background_task_uses_slots(self):
+        """Test that task records carry no per-instance __dict__."""
+        task = BackgroundTask("t", "test", TaskStatus.PENDING, created_at=0)
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = 1
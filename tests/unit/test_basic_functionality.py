@@ -184,3 +184,36 @@ def test_directory_creation():
         ensure_directory_exists(Path(test_dir))
         assert os.path.exists(test_dir)
         assert os.path.isdir(test_dir)
+
+
+@pytest.mark.unit
+def test_checksum_matches_hashlib():
+    """Test that incremental checksums match a one-shot hashlib digest."""
+    import hashlib
+    import tempfile
+
+    from app.utils.helpers import (
+        MIN_CHECKSUM_BUFFER_SIZE,
+        calculate_checksum_incremental,
+    )
+
+    data = b"fair-metadata" * (MIN_CHECKSUM_BUFFER_SIZE // 5)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "data.bin"
+        file_path.write_bytes(data)
+
+        for algorithm in ("sha256", "md5"):
+            expected = hashlib.new(algorithm, data).hexdigest()
+            assert calculate_checksum_incremental(file_path, algorithm, 4096) == expected
+
+
+@pytest.mark.unit
+def test_blake3_without_package_names_extra():
+    """Test that a missing blake3 package raises an actionable ImportError."""
+    from unittest.mock import patch
+
+    from app.utils.helpers import _new_hash
+
+    with patch.dict(sys.modules, {"blake3": None}):
+        with pytest.raises(ImportError, match=r"mdjourney\[blake3\]"):
+            _new_hash("blake3")
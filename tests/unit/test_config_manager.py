@@ -0,0 +1,297 @@
+"""
+Unit tests for the configuration manager module.
+Tests load real YAML files written to a temporary directory.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.core import config
+from app.core.config_manager import ConfigManager
+
+SAMPLE_CONFIG = """
+monitor_path: ./data
+debug: false
+api:
+  port: 8080
+  cors:
+    origins:
+      - http://localhost:5173
+logging:
+  level: INFO
+schemas:
+  path_overrides:
+    custom.json: ./custom.json
+"""
+
+
+@pytest.fixture
+def config_file(temp_dir):
+    """Write the sample configuration and return its path."""
+    path = Path(temp_dir) / ".fair_meta_config.yaml"
+    path.write_text(SAMPLE_CONFIG)
+    return path
+
+
+class TestConfigManager:
+    """Test cases for the ConfigManager class."""
+
+    def test_get_setting_dot_notation(self, config_file):
+        """Test lookups of sections, leaves and missing keys."""
+        manager = ConfigManager(str(config_file))
+
+        assert manager.get_setting("api.port") == 8080
+        assert manager.get_setting("api")["port"] == 8080
+        assert manager.get_setting("api.cors.origins") == ("http://localhost:5173",)
+        assert manager.get_setting("debug", True) is False
+        assert manager.get_setting("api.missing", "fallback") == "fallback"
+        assert manager.get_setting("api.port.value", "fallback") == "fallback"
+
+    def test_get_setting_matches_nested_walk(self, config_file):
+        """Test that cached lookups agree with walking the loaded config."""
+        manager = ConfigManager(str(config_file))
+        config = manager.load_config()
+
+        assert manager._flat_cache
+        for key in (
+            *manager._flat_cache,
+            "monitor_path",
+            "logging.level",
+            "api.cors",
+            "schemas.path_overrides",
+            "schemas.path_overrides.custom.json",
+            "nope",
+        ):
+            expected = manager._get_nested_value(config, key, "default")
+            assert manager.get_setting(key, "default") == expected
+
+    def test_get_nested_value_top_level_keys(self, config_file):
+        """Test single-segment lookups on mappings and non-mappings."""
+        manager = ConfigManager(str(config_file))
+        config = manager.load_config()
+
+        assert manager._get_nested_value(config, "debug", True) is False
+        assert manager._get_nested_value(config, "nope", "default") == "default"
+        assert manager._get_nested_value(["debug"], "debug", "default") == "default"
+        assert manager._get_nested_value(config, "api.cors.origins") == (
+            "http://localhost:5173",
+        )
+
+    def test_update_setting_refreshes_lookups(self, config_file):
+        """Test that updated settings are visible and persisted."""
+        manager = ConfigManager(str(config_file))
+        assert manager.get_setting("api.port") == 8080
+
+        assert manager.update_setting("api.port", 9000) is True
+        assert manager.get_setting("api.port") == 9000
+        assert ConfigManager(str(config_file)).get_setting("api.port") == 9000
+
+    def test_cached_config_is_read_only(self, config_file):
+        """Test that callers cannot mutate the shared configuration."""
+        manager = ConfigManager(str(config_file))
+        config = manager.load_config()
+
+        with pytest.raises(TypeError):
+            config["debug"] = True
+        with pytest.raises(TypeError):
+            manager.get_setting("api")["port"] = 1
+        assert isinstance(manager.get_setting("api.cors.origins"), tuple)
+
+    def test_update_setting_publishes_new_snapshot(self, config_file):
+        """Test that updates replace the snapshot instead of mutating it."""
+        manager = ConfigManager(str(config_file))
+        before = manager.load_config()
+
+        assert manager.update_setting("api.cors.origins", ["https://a.example"])
+        assert before["api"]["port"] == 8080
+        assert before["api"]["cors"]["origins"] == ("http://localhost:5173",)
+        assert manager.get_setting("api.cors.origins") == ("https://a.example",)
+        assert manager.load_config() is not before
+
+    def test_validate_config_has_no_side_effects(self, temp_dir):
+        """Test that validation checks monitor_path without creating it."""
+        monitor_path = Path(temp_dir) / "missing" / "data"
+        path = Path(temp_dir) / "config.yaml"
+        path.write_text(f"monitor_path: {monitor_path}\napi:\n  port: 70000\n")
+        manager = ConfigManager(str(path))
+
+        is_valid, errors = manager.validate_config()
+        assert is_valid is False
+        assert errors == ["API port must be a valid port number (1-65535)"]
+        assert not monitor_path.exists()
+
+        with patch("app.core.config_manager.os.access", return_value=False):
+            _, errors = manager.validate_config()
+        assert any("Cannot access or create monitor_path" in e for e in errors)
+
+    def test_save_config_round_trip(self, config_file, temp_dir):
+        """Test that saved settings load back unchanged."""
+        settings = ConfigManager(str(config_file)).load_config()
+        target = ConfigManager(str(Path(temp_dir) / "nested" / "saved.yaml"))
+
+        assert target.save_config(settings) is True
+        assert target.reload_config() == settings
+
+    def test_missing_file_returns_defaults(self, temp_dir):
+        """Test that a missing configuration file yields defaults."""
+        manager = ConfigManager(str(Path(temp_dir) / "missing.yaml"))
+        assert manager.get_setting("api.port", 8000) == 8000
+
+
+    def test_env_var_substitution(self, temp_dir, monkeypatch):
+        """Test ${VAR} and ${VAR:-default} placeholders in string values."""
+        monkeypatch.setenv("MDJ_TEST_HOST", "example.org")
+        monkeypatch.delenv("MDJ_TEST_UNSET", raising=False)
+        path = Path(temp_dir) / "config.yaml"
+        path.write_text(
+            "api:\n"
+            "  host: ${MDJ_TEST_HOST}\n"
+            "  url: http://${MDJ_TEST_HOST}:${MDJ_TEST_UNSET:-8000}/v1\n"
+            "  empty: ${MDJ_TEST_UNSET}\n"
+            "  plain: no placeholders\n"
+            "  origins: ['${MDJ_TEST_HOST}', 5]\n"
+        )
+        manager = ConfigManager(str(path))
+
+        assert manager.get_setting("api.host") == "example.org"
+        assert manager.get_setting("api.url") == "http://example.org:8000/v1"
+        assert manager.get_setting("api.empty") == ""
+        assert manager.get_setting("api.plain") == "no placeholders"
+        assert manager.get_setting("api.origins") == ("example.org", 5)
+
+    def test_env_var_substitution_in_nested_lists(self, temp_dir, monkeypatch):
+        """Test placeholders inside lists of mappings and nested lists."""
+        monkeypatch.setenv("MDJ_TEST_HOST", "example.org")
+        path = Path(temp_dir) / "config.yaml"
+        path.write_text(
+            "servers:\n"
+            "  - name: ${MDJ_TEST_HOST}\n"
+            "    ports: [80, '${MDJ_TEST_PORT:-443}']\n"
+            "  - [['${MDJ_TEST_HOST}'], true]\n"
+        )
+        manager = ConfigManager(str(path))
+
+        assert manager.get_setting("servers") == (
+            {"name": "example.org", "ports": (80, "443")},
+            (("example.org",), True),
+        )
+
+class TestConfigValueCache:
+    """Test cases for memoized lookups in app.core.config."""
+
+    @pytest.fixture
+    def manager(self, config_file, monkeypatch):
+        """Install a ConfigManager as the global one for the test."""
+        manager = ConfigManager(str(config_file))
+        monkeypatch.setattr(config, "CONFIG_MANAGER", manager)
+        config._clear_caches()
+        yield manager
+        config._clear_caches()
+
+    def test_values_memoized_until_cleared(self, manager):
+        """Test that lookups are cached and refreshed by _clear_caches."""
+        assert config.get_api_port() == 8080
+        assert config.get_config_value("api.missing", "fallback") == "fallback"
+
+        manager.update_setting("api.port", 9000)
+        assert config.get_api_port() == 8080
+
+        config._clear_caches()
+        assert config.get_api_port() == 9000
+
+    def test_defaults_without_manager(self, monkeypatch):
+        """Test that defaults are returned before initialization."""
+        monkeypatch.setattr(config, "CONFIG_MANAGER", None)
+        assert config.get_api_port() == 8000
+        assert config.get_cors_origins() == ("http://localhost:5173",)
+        assert config.get_api_config() == {}
+        with pytest.raises(TypeError):
+            config.get_api_config()["port"] = 1
+
+
+class TestSchemaPaths:
+    """Test cases for schema path resolution in app.core.config."""
+
+    @pytest.fixture
+    def initialized(self, config_file, temp_dir, monkeypatch):
+        """Initialize configuration from the sample file, restoring globals after."""
+        for name in (
+            "CONFIG_MANAGER",
+            "MONITOR_PATH",
+            "CUSTOM_SCHEMA_PATH",
+            "SCHEMA_PATH_OVERRIDES",
+            "_RESOLVED_SCHEMA_PATHS",
+        ):
+            monkeypatch.setattr(config, name, getattr(config, name))
+        monkeypatch.chdir(temp_dir)
+        assert config.initialize_config(str(config_file)) is True
+        yield
+        config._clear_caches()
+
+    def test_defaults_and_overrides(self, initialized, temp_dir):
+        """Test that packaged defaults and configured overrides are both served."""
+        assert config.get_schema_path("project_descriptive.json") == (
+            Path(config.SCHEMA_BASE_PATH) / "project_descriptive.json"
+        )
+        assert config.get_schema_path("custom.json") == (
+            Path(temp_dir) / "custom.json"
+        ).resolve()
+        assert config.get_schema_path("other.json") == (
+            Path(config.SCHEMA_BASE_PATH) / "other.json"
+        )
+
+
+    def test_relative_overrides_resolve_against_config_dir(
+        self, initialized, temp_dir
+    ):
+        """Test relative, parent-relative and absolute override paths."""
+        config_dir = Path(temp_dir) / "conf"
+        config_dir.mkdir()
+        absolute = Path(temp_dir) / "abs.json"
+        path = config_dir / "settings.yaml"
+        path.write_text(
+            "monitor_path: ./data\n"
+            "schemas:\n"
+            "  path_overrides:\n"
+            "    project_descriptive: schemas/project.json\n"
+            "    dataset_structural: ../shared/struct.json\n"
+            f"    complete_metadata: {absolute}\n"
+        )
+        assert config.initialize_config(str(path)) is True
+
+        resolved_dir = config_dir.resolve()
+        assert config.get_schema_path("project_descriptive.json") == (
+            resolved_dir / "schemas" / "project.json"
+        )
+        assert config.get_schema_path("dataset_structural_schema.json") == (
+            resolved_dir.parent / "shared" / "struct.json"
+        )
+        assert config.get_schema_path("complete_metadata_schema.json") == absolute
+
+
+class TestFindConfigFile:
+    """Test cases for configuration file discovery."""
+
+    def test_found_location_is_reused(self, temp_dir, monkeypatch):
+        """Test that a found file is remembered and a removed one is not."""
+        config.reset_config_file_cache()
+        nested = Path(temp_dir) / "a" / "b"
+        nested.mkdir(parents=True)
+        config_path = Path(temp_dir) / ".fair_meta_config.yaml"
+        config_path.write_text(SAMPLE_CONFIG)
+        monkeypatch.chdir(nested)
+
+        assert config.find_config_file().resolve() == config_path.resolve()
+        with patch.object(config, "_search_config_file") as mock_search:
+            assert config.find_config_file().resolve() == config_path.resolve()
+        mock_search.assert_not_called()
+
+        config_path.unlink()
+        with patch.object(
+            config, "_search_config_file", return_value=None
+        ) as mock_search:
+            assert config.find_config_file() is None
+        mock_search.assert_called_once()
+        config.reset_config_file_cache()
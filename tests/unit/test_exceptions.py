@@ -0,0 +1,293 @@
+"""
+Unit tests for the exception hierarchy.
+Tests cover error context, logging on construction and API serialization.
+"""
+
+import copy
+import logging
+import pickle
+from pathlib import Path
+
+import pytest
+
+from app.core import exceptions
+from app.core.exceptions import (
+    ConfigurationError,
+    FileOperationErrors,
+    FSPermissionError,
+    MDJourneyError,
+    MetadataGenerationError,
+    PathNotFoundError,
+    ResourceNotFoundError,
+    SchemaNotFoundError,
+    SchemaValidationError,
+    create_error_response,
+    handle_file_operation,
+)
+
+
+class TestErrorContext:
+    """Test cases for the context recorded by each error type."""
+
+    @pytest.mark.parametrize(
+        "error,expected",
+        [
+            (
+                SchemaValidationError("bad", ["e1"], Path("s.json"), None),
+                {"validation_errors": ["e1"], "schema_path": "s.json"},
+            ),
+            (
+                SchemaNotFoundError("dataset", [Path("a"), "b"]),
+                {"schema_name": "dataset", "searched_paths": ["a", "b"]},
+            ),
+            (SchemaNotFoundError("dataset"), {"schema_name": "dataset"}),
+            (
+                SchemaNotFoundError("dataset", []),
+                {"schema_name": "dataset", "searched_paths": []},
+            ),
+            (MetadataGenerationError("bad"), {}),
+            (
+                PathNotFoundError(Path("/data"), "project"),
+                {"path": "/data", "path_type": "project"},
+            ),
+            (
+                ResourceNotFoundError("dataset", "d_1"),
+                {"resource_type": "dataset", "resource_id": "d_1"},
+            ),
+        ],
+    )
+    def test_context_includes_only_given_fields(self, error, expected):
+        """Test that serialized context holds the given fields in order."""
+        context = error.to_dict()["context"]
+        assert context == expected
+        assert list(context) == list(expected)
+
+    def test_falsy_identifiers_are_kept(self):
+        """Test that falsy but meaningful values are not dropped from context."""
+        error = ResourceNotFoundError("", 0)
+        assert error.to_dict()["context"] == {"resource_type": "", "resource_id": 0}
+
+    def test_paths_are_stored_as_strings(self):
+        """Test that context holds paths as strings, as consumers expect."""
+        error = PathNotFoundError(Path("/data/p_1"), "project")
+        assert error.context["path"] == "/data/p_1"
+        assert SchemaNotFoundError("s", [Path("a")]).context["searched_paths"] == ["a"]
+
+
+    @pytest.mark.parametrize(
+        "error,message",
+        [
+            (SchemaNotFoundError("dataset"), "Schema 'dataset' not found"),
+            (PathNotFoundError(Path("/data")), "Path not found: /data"),
+            (PathNotFoundError("/data", "project"), "project not found: /data"),
+            (FSPermissionError("/data"), "Insufficient permissions for operation on /data"),
+            (ResourceNotFoundError("dataset", "d_1"), "dataset 'd_1' not found"),
+        ],
+    )
+    def test_messages(self, error, message):
+        """Test the messages built from each class's message format."""
+        assert error.message == message
+        assert str(error) == message
+
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            MDJourneyError("failed"),
+            SchemaValidationError("bad", ["e1"]),
+            PathNotFoundError("/data"),
+        ],
+    )
+    def test_attributes_live_in_slots(self, error):
+        """Test that constructing an error does not populate __dict__."""
+        assert error.__dict__ == {}
+        assert error.message and isinstance(error.context, dict)
+
+
+class TestErrorPickling:
+    """Test cases for copying errors and sending them between processes."""
+
+    @pytest.mark.parametrize("clone", [lambda e: pickle.loads(pickle.dumps(e)), copy.copy])
+    def test_round_trip_keeps_slots(self, clone):
+        """Test that pickling and copying keep every slotted attribute."""
+        error = SchemaValidationError("bad", ["x"], Path("s.json"), cause=ValueError("v"))
+        restored = clone(error)
+
+        assert type(restored) is SchemaValidationError
+        assert restored.args == error.args
+        assert restored.message == "bad"
+        assert restored.validation_errors == ["x"]
+        assert restored.context == error.context
+        assert str(restored.cause) == "v"
+        assert restored.to_dict() == error.to_dict()
+
+    def test_unpickling_does_not_log(self, caplog):
+        """Test that restoring an error does not run __init__ again."""
+        data = pickle.dumps(MDJourneyError("boom", {"k": 1}))
+        caplog.clear()
+        with caplog.at_level(logging.ERROR, logger=exceptions.__name__):
+            restored = pickle.loads(data)
+        assert restored.context == {"k": 1}
+        assert caplog.records == []
+
+
+class TestErrorLogging:
+    """Test cases for logging performed when errors are constructed."""
+
+    def test_logs_message_context_and_cause(self, caplog):
+        """Test that the log record carries the message, context and cause."""
+        cause = ValueError("bad value")
+        with caplog.at_level(logging.ERROR, logger=exceptions.__name__):
+            PathNotFoundError("/data/x", "dataset", cause)
+
+        record = caplog.records[-1]
+        assert record.getMessage() == (
+            "PathNotFoundError: dataset not found: /data/x"
+            " | Context: {'path': '/data/x', 'path_type': 'dataset'}"
+            " | Caused by: ValueError: bad value"
+        )
+        assert record.exc_info is None
+
+    def test_traceback_attached_when_debug_or_verbose(self, caplog):
+        """Test that the cause traceback is logged at DEBUG or when verbose."""
+        cause = ValueError("bad value")
+        with caplog.at_level(logging.DEBUG, logger=exceptions.__name__):
+            MDJourneyError("failed", cause=cause)
+        assert caplog.records[-1].exc_info[1] is cause
+
+        caplog.clear()
+        with caplog.at_level(logging.ERROR, logger=exceptions.__name__):
+            ConfigurationError("bad config", cause=cause)
+        assert caplog.records[-1].exc_info[1] is cause
+
+    def test_no_formatting_when_error_level_disabled(self, monkeypatch):
+        """Test that context is not rendered when ERROR records are filtered."""
+
+        class Unprintable:
+            def __repr__(self):
+                raise AssertionError("context was formatted")
+
+        monkeypatch.setattr(exceptions.logger, "disabled", True)
+        error = MDJourneyError("failed", {"value": Unprintable()})
+        assert error.message == "failed"
+
+
+class TestTracebackRetention:
+    """Test cases for releasing frames held by handled errors."""
+
+    def test_lightweight_drops_tracebacks(self):
+        """Test that lightweight clears tracebacks but keeps the cause."""
+        try:
+            try:
+                raise ValueError("bad value")
+            except ValueError as e:
+                raise MDJourneyError("failed", cause=e) from e
+        except MDJourneyError as e:
+            error = e
+
+        assert error.__traceback__ is not None
+        assert error.lightweight() is error
+        assert error.__traceback__ is None
+        assert error.__cause__ is None and error.__context__ is None
+        assert error.cause.__traceback__ is None
+        assert error.to_dict()["cause"] == "bad value"
+
+    def test_create_error_response_releases_frames(self):
+        """Test that serializing an error for a response drops its traceback."""
+        try:
+            raise MDJourneyError("failed", cause=OSError("disk"))
+        except MDJourneyError as e:
+            error = e
+
+        assert create_error_response(error)["cause"] == "disk"
+        assert error.__traceback__ is None
+
+    def test_handle_file_operation_does_not_chain(self, temp_dir):
+        """Test that wrapped file errors keep the cause without chaining it."""
+
+        @handle_file_operation("read", temp_dir)
+        def read():
+            raise FileNotFoundError(temp_dir)
+
+        with pytest.raises(PathNotFoundError) as exc_info:
+            read()
+        assert isinstance(exc_info.value.cause, FileNotFoundError)
+        assert exc_info.value.__suppress_context__ is True
+
+
+class TestFileOperationErrors:
+    """Test cases for translating file errors."""
+
+    @pytest.mark.parametrize(
+        "raised,expected",
+        [
+            (FileNotFoundError("gone"), PathNotFoundError),
+            (PermissionError("denied"), FSPermissionError),
+            (IsADirectoryError("dir"), MDJourneyError),
+        ],
+    )
+    def test_context_manager_translates(self, raised, expected, temp_dir):
+        """Test that builtin file errors become MDJourney exceptions."""
+        with pytest.raises(expected) as exc_info:
+            with FileOperationErrors("write", temp_dir):
+                raise raised
+        assert type(exc_info.value) is expected
+        assert exc_info.value.cause is raised
+        assert exc_info.value.__suppress_context__ is True
+
+    def test_context_manager_passes_success(self, temp_dir):
+        """Test that nothing is raised or suppressed without an error."""
+        with FileOperationErrors("read", temp_dir) as errors:
+            value = 1
+        assert value == 1 and errors.operation == "read"
+
+    def test_error_handler_only_for_other_errors(self, temp_dir):
+        """Test that the decorator's handler does not swallow file errors."""
+
+        @handle_file_operation("read", temp_dir, error_handler=lambda e: "handled")
+        def read(error):
+            raise error
+
+        assert read(ValueError("bad")) == "handled"
+        with pytest.raises(FSPermissionError):
+            read(PermissionError("denied"))
+
+
+class TestErrorResponse:
+    """Test cases for create_error_response."""
+
+    def test_mdjourney_error(self):
+        """Test that application errors serialize their context."""
+        error = SchemaValidationError(
+            "invalid", validation_errors=["a"], schema_path="s.json"
+        )
+        assert create_error_response(error) == {
+            "error_type": "SchemaValidationError",
+            "message": "invalid",
+            "context": {"validation_errors": ["a"], "schema_path": "s.json"},
+            "cause": None,
+        }
+
+    def test_to_dict_is_built_once(self):
+        """Test that repeated serialization reuses the same dictionary."""
+        error = ResourceNotFoundError("dataset", "d_1")
+        assert error.to_dict() is error.to_dict()
+        assert error.to_dict()["error_type"] == "ResourceNotFoundError"
+
+    def test_error_type_per_subclass(self):
+        """Test that every subclass reports its own class name."""
+
+        class CustomError(PathNotFoundError):
+            pass
+
+        assert MDJourneyError.error_type == "MDJourneyError"
+        assert PathNotFoundError.error_type == "PathNotFoundError"
+        assert CustomError("/x").to_dict()["error_type"] == "CustomError"
+
+    @pytest.mark.parametrize("error", [KeyError("k"), RuntimeError("boom")])
+    def test_other_exceptions(self, error):
+        """Test that foreign exceptions get the same response shape."""
+        response = create_error_response(error)
+        assert response["error_type"] == type(error).__name__
+        assert response["message"] == str(error)
+        assert response["context"] == {} and response["cause"] is None
@@ -0,0 +1,278 @@
+"""
+Unit tests for the performance monitoring module.
+Tests cover request metrics, slow request tracking and the report.
+"""
+
+import dataclasses
+import logging
+import threading
+
+import pytest
+
+from app.core.performance import (
+    PerformanceConfig,
+    PerformanceMonitor,
+    load_performance_config_from_env,
+)
+
+
+@pytest.fixture
+def monitor():
+    """Create a fresh PerformanceMonitor."""
+    return PerformanceMonitor()
+
+
+class TestPerformanceMonitor:
+    """Test cases for the PerformanceMonitor class."""
+
+    def test_request_metrics_per_endpoint(self, monitor):
+        """Test count, total, average, min and max per endpoint."""
+        for duration in (30.0, 10.0, 20.0):
+            monitor.record_request_time("/api/v1/projects", duration)
+        monitor.record_request_time("/api/v1/datasets", 5.0)
+
+        assert monitor.metrics == {
+            "/api/v1/projects": {
+                "count": 3,
+                "total_time": 60.0,
+                "avg_time": 20.0,
+                "min_time": 10.0,
+                "max_time": 30.0,
+            },
+            "/api/v1/datasets": {
+                "count": 1,
+                "total_time": 5.0,
+                "avg_time": 5.0,
+                "min_time": 5.0,
+                "max_time": 5.0,
+            },
+        }
+
+    def test_record_request_ns(self, monitor):
+        """Test that nanosecond durations are reported in milliseconds."""
+        monitor.record_request_ns("/api", 2_500_000)
+        monitor.record_request_ns("/api", 500_000)
+        monitor.record_request_time("/api", 1.5)
+
+        assert monitor.metrics["/api"] == {
+            "count": 3,
+            "total_time": 4.5,
+            "avg_time": 1.5,
+            "min_time": 0.5,
+            "max_time": 2.5,
+        }
+
+    def test_record_by_registered_index(self, monitor):
+        """Test that registered endpoints keep one index and start empty."""
+        index = monitor.register_endpoint("/api/v1/" + "projects")
+        assert monitor.register_endpoint("/api/v1/projects") == index
+        assert monitor.register_endpoint("/other") == index + 1
+        assert monitor.metrics == {}
+
+        monitor.record_by_index(index, 3_000_000)
+        monitor.record_request_ns("/api/v1/projects", 1_000_000)
+        assert monitor.metrics == {
+            "/api/v1/projects": {
+                "count": 2,
+                "total_time": 4.0,
+                "avg_time": 2.0,
+                "min_time": 1.0,
+                "max_time": 3.0,
+            }
+        }
+
+    def test_requests_from_many_threads(self, monitor):
+        """Test that per-thread accumulators are all merged into the metrics."""
+
+        def record(offset):
+            for i in range(100):
+                monitor.record_request_ns("/api", offset + i)
+
+        threads = [threading.Thread(target=record, args=(n * 1000,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        monitor.record_request_ns("/api", 5_000)
+
+        metrics = monitor.metrics["/api"]
+        assert metrics["count"] == 401
+        assert metrics["min_time"] == 0.0
+        assert metrics["max_time"] == 0.005
+        assert monitor._accumulators == [monitor._local.accumulator]
+
+    def test_report_suggests_slow_endpoints(self, monitor):
+        """Test that slow requests and endpoints show up in the report."""
+        monitor.record_request_time("/fast", 10.0)
+        monitor.record_request_time("/slow", 2500.0)
+
+        report = monitor.get_performance_report()
+        assert list(report["request_metrics"]) == ["/fast", "/slow"]
+        assert [r["endpoint"] for r in report["slow_requests"]] == ["/slow"]
+        assert report["optimization_suggestions"] == [
+            {
+                "type": "slow_endpoint",
+                "endpoint": "/slow",
+                "avg_time_ms": 2500.0,
+                "suggestion": "Consider caching or optimizing /slow",
+            }
+        ]
+
+    def test_suggestions_use_average_time(self, monitor):
+        """Test slow endpoint and low hit rate suggestions."""
+        monitor.record_request_time("/mixed", 1900.0)
+        monitor.record_request_time("/mixed", 100.0)
+        monitor.record_request_time("/edge", 1000.0)
+        monitor.record_cache_stats("schema_cache", 1, 3)
+        monitor.record_cache_stats("metadata_cache", 3, 1)
+
+        suggestions = monitor.get_performance_report()["optimization_suggestions"]
+        assert [(s["type"], s.get("endpoint", s.get("cache_type"))) for s in suggestions] == [
+            ("low_cache_hit_rate", "schema_cache"),
+        ]
+
+    def test_report_is_a_snapshot(self, monitor):
+        """Test that a report cannot alter the monitor and does not change later."""
+        monitor.record_cache_stats("schema_cache", 3, 1)
+        report = monitor.get_performance_report()
+
+        with pytest.raises(TypeError):
+            report["cache_stats"]["schema_cache"] = {}
+        assert report["slow_requests"] == ()
+
+        monitor.record_request_time("/slow", 1500.0)
+        monitor.record_cache_stats("file_cache", 1, 1)
+        assert report["slow_requests"] == () and report["request_metrics"] == {}
+        assert list(report["cache_stats"]) == ["schema_cache"]
+
+        fresh = monitor.get_performance_report()
+        assert fresh is not report
+        assert [r["endpoint"] for r in fresh["slow_requests"]] == ["/slow"]
+        assert list(fresh["request_metrics"]) == ["/slow"]
+
+    def test_slow_requests_are_bounded(self, monkeypatch):
+        """Test that only the most recent slow requests are retained."""
+        monkeypatch.setitem(PerformanceConfig.MONITORING, "max_slow_requests", 15)
+        monitor = PerformanceMonitor()
+        for i in range(20):
+            monitor.record_request_time(f"/slow/{i}", 1500.0 + i)
+
+        assert len(monitor.slow_requests) == 15
+        assert monitor.slow_requests[0][:2] == ("/slow/5", 1_505_000_000)
+        report = monitor.get_performance_report()
+        assert [r["endpoint"] for r in report["slow_requests"]] == [
+            f"/slow/{i}" for i in range(10, 20)
+        ]
+        assert report["slow_requests"][-1]["duration_ms"] == 1519.0
+
+    def test_reload_config_refreshes_settings(self, monitor, monkeypatch):
+        """Test that monitoring settings are snapshotted until reloaded."""
+        monkeypatch.setitem(PerformanceConfig.MONITORING, "slow_request_threshold_ms", 50)
+        monitor.record_request_time("/a", 100.0)
+        assert len(monitor.slow_requests) == 0
+
+        monitor.reload_config()
+        monitor.record_request_time("/a", 100.0)
+        assert [r[0] for r in monitor.slow_requests] == ["/a"]
+
+        monkeypatch.setitem(PerformanceConfig.MONITORING, "log_slow_requests", False)
+        monitor.reload_config()
+        monitor.record_request_time("/b", 100.0)
+        assert [r[0] for r in monitor.slow_requests] == ["/a"]
+
+    def test_log_messages(self, monitor, caplog):
+        """Test the slow request and cache statistics log lines."""
+        with caplog.at_level(logging.INFO, logger="app.core.performance"):
+            monitor.record_request_time("/slow", 1234.5)
+            monitor.record_cache_stats("schema_cache", 3, 1)
+
+        assert [r.getMessage() for r in caplog.records] == [
+            "Slow request detected: /slow took 1234.50ms",
+            "Cache stats for schema_cache: 75.00% hit rate (3 hits, 1 misses)",
+        ]
+
+
+class TestPerformanceConfig:
+    """Test cases for the PerformanceConfig class."""
+
+    @pytest.mark.parametrize(
+        "feature_path,expected",
+        [
+            ("cache.schema_cache.enabled", True),
+            ("CACHE_CONFIG.project_cache.persist_to_disk", False),
+            ("monitoring.log_slow_requests", True),
+            ("cache.schema_cache.missing", False),
+            ("cache.schema_cache.enabled.extra", False),
+            ("unknown.feature", False),
+        ],
+    )
+    def test_is_feature_enabled(self, feature_path, expected):
+        """Test feature lookups by section name and attribute name."""
+        assert PerformanceConfig.is_feature_enabled(feature_path) is expected
+
+    def test_settings_are_frozen(self):
+        """Test that cache and async settings cannot be changed in place."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            PerformanceConfig.get_cache_config("schema_cache").enabled = False
+        assert PerformanceConfig.get_async_config("file_processing").chunk_size == 4096
+        assert PerformanceConfig.get_cache_config("unknown") is None
+
+    def test_performance_settings_view(self, monkeypatch):
+        """Test that the settings view is shared, read-only and live."""
+        settings = PerformanceConfig.get_performance_settings()
+        assert PerformanceConfig.get_performance_settings() is settings
+        assert list(settings) == [
+            "cache",
+            "async",
+            "background_tasks",
+            "api_optimization",
+            "frontend_optimization",
+            "monitoring",
+        ]
+        with pytest.raises(TypeError):
+            settings["monitoring"]["enabled"] = False
+
+        monkeypatch.setitem(PerformanceConfig.MONITORING, "enabled", False)
+        assert settings["monitoring"]["enabled"] is False
+
+    def test_is_feature_enabled_sees_changes(self, monkeypatch):
+        """Test that repeated lookups reflect configuration changes."""
+        assert PerformanceConfig.is_feature_enabled("background_tasks.enabled")
+        monkeypatch.setitem(PerformanceConfig.BACKGROUND_TASKS, "enabled", False)
+        assert not PerformanceConfig.is_feature_enabled("background_tasks.enabled")
+
+
+class TestEnvironmentOverrides:
+    """Test cases for load_performance_config_from_env."""
+
+    def test_overrides_applied(self, monkeypatch):
+        """Test that set variables override and unset or empty ones do not."""
+        for name in ("schema_cache", "metadata_cache"):
+            monkeypatch.setitem(
+                PerformanceConfig.CACHE_CONFIG, name, PerformanceConfig.CACHE_CONFIG[name]
+            )
+        monkeypatch.setitem(PerformanceConfig.BACKGROUND_TASKS, "enabled", False)
+        monkeypatch.setitem(PerformanceConfig.BACKGROUND_TASKS, "max_concurrent_tasks", 5)
+        monkeypatch.setenv("MDJOURNEY_CACHE_ENABLED", "False")
+        monkeypatch.setenv("MDJOURNEY_SCHEMA_CACHE_TTL", "60")
+        monkeypatch.setenv("MDJOURNEY_BACKGROUND_TASKS_ENABLED", "TRUE")
+        monkeypatch.setenv("MDJOURNEY_MAX_CONCURRENT_TASKS", "")
+
+        load_performance_config_from_env()
+
+        schema_cache = PerformanceConfig.get_cache_config("schema_cache")
+        assert schema_cache.enabled is False
+        assert schema_cache.ttl_seconds == 60
+        assert schema_cache.max_size == 1000
+        assert PerformanceConfig.BACKGROUND_TASKS["enabled"] is True
+        assert PerformanceConfig.BACKGROUND_TASKS["max_concurrent_tasks"] == 5
+
+    @pytest.mark.parametrize("value", ["1", "yes", "on"])
+    def test_only_true_enables_flags(self, monkeypatch, value):
+        """Test that boolean flags keep their "true"-only parsing."""
+        monkeypatch.setitem(PerformanceConfig.BACKGROUND_TASKS, "enabled", True)
+        monkeypatch.setenv("MDJOURNEY_BACKGROUND_TASKS_ENABLED", value)
+
+        load_performance_config_from_env()
+
+        assert PerformanceConfig.BACKGROUND_TASKS["enabled"] is False
@@ -10,6 +10,7 @@ from unittest.mock import Mock, mock_open, patch
 
 import pytest
 
+from app.core.exceptions import FSPermissionError
 from app.services.schema_manager import (
     SchemaManager,
     get_schema_manager,
@@ -60,6 +61,19 @@ class TestSchemaManager:
             with pytest.raises(FileNotFoundError):
                 manager.load_schema("nonexistent.json")
 
+    def test_load_schema_permission_denied(self):
+        """Test that an OS permission failure is raised as FSPermissionError."""
+        with patch("builtins.open", side_effect=PermissionError("denied")), patch(
+            "app.services.schema_manager.app_config.ALLOW_MISSING_SCHEMAS", False, create=True
+        ):
+            with patch("pathlib.Path.exists", return_value=True):
+                manager = SchemaManager()
+
+                with pytest.raises(FSPermissionError) as exc_info:
+                    manager.load_schema("locked.json")
+        assert isinstance(exc_info.value.cause, PermissionError)
+        assert exc_info.value.context["operation"] == "read"
+
     def test_load_schema_invalid_json(self):
         """Test schema loading with invalid JSON."""
         with patch("builtins.open", mock_open(read_data="invalid json")):
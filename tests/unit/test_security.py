@@ -0,0 +1,199 @@
+"""
+Unit tests for the security module.
+Tests cover input validation, path sanitization, headers and rate limiting.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.core import security
+from app.core.exceptions import SecurityError, ValidationError
+from app.core.security import (
+    InputValidator,
+    PathSanitizer,
+    RateLimiter,
+    SecurityHeaders,
+)
+
+
+class TestInputValidator:
+    """Test cases for the InputValidator class."""
+
+    @pytest.mark.parametrize("value", ["p_42", "dataset-1", "A" * 100])
+    def test_valid_ids(self, value):
+        """Test that alphanumeric, underscore and hyphen IDs are accepted."""
+        assert InputValidator.validate_id(value) == value
+
+    @pytest.mark.parametrize(
+        "value",
+        ["", "../etc", "a/b", "a\\b", "a.b", "p 1", "p_1\n", "ünicode", "A" * 101],
+    )
+    def test_invalid_ids(self, value):
+        """Test that traversal, separators and other characters are rejected."""
+        with pytest.raises(ValidationError):
+            InputValidator.validate_id(value, "Project ID")
+
+    def test_metadata_and_schema_types(self):
+        """Test that only the allowed type names are accepted."""
+        assert InputValidator.validate_metadata_type("dataset_structural") == "dataset_structural"
+        assert InputValidator.validate_schema_type("project") == "project"
+        for value in ("../project", "project/", "project_descriptive\\"):
+            with pytest.raises(ValidationError):
+                InputValidator.validate_metadata_type(value)
+            with pytest.raises(ValidationError):
+                InputValidator.validate_schema_type(value)
+
+    @pytest.mark.parametrize(
+        "value,message",
+        [
+            ("", "Metadata type cannot be empty"),
+            (["project_descriptive"], "Metadata type must be a string"),
+            ("x" * 51, "Metadata type exceeds maximum length of 50"),
+        ],
+    )
+    def test_metadata_type_error_messages(self, value, message):
+        """Test that rejected values still get a specific message."""
+        with pytest.raises(ValidationError) as exc_info:
+            InputValidator.validate_metadata_type(value)
+        assert exc_info.value.message == message
+
+    def test_invalid_type_message_lists_sorted_values(self):
+        """Test that the rejection message lists the allowed values in order."""
+        with pytest.raises(ValidationError) as exc_info:
+            InputValidator.validate_schema_type("unknown")
+        assert exc_info.value.message == (
+            "Invalid schema type. Allowed values: complete_metadata, contextual, "
+            "dataset_administrative, dataset_structural, experiment_contextual, "
+            "instrument_technical, project"
+        )
+
+
+    def test_json_payload_size(self):
+        """Test that the serialized size, in bytes, is checked."""
+        payload = {"title": "é" * 10}
+        # Serialized as {"title": "\u00e9..."}: 13 + 6 * 10 bytes
+        assert InputValidator.validate_json_payload(payload, max_size=73) is payload
+        with pytest.raises(ValidationError):
+            InputValidator.validate_json_payload(payload, max_size=72)
+        with pytest.raises(ValidationError):
+            InputValidator.validate_json_payload({"when": object()})
+        assert InputValidator.validate_json_payload(None) is None
+
+
+@pytest.fixture
+def base(temp_dir):
+    """Return the temporary directory as a resolved Path."""
+    return Path(temp_dir).resolve()
+
+
+class TestPathSanitizer:
+    """Test cases for the PathSanitizer class."""
+
+    def test_sanitize_relative_to_base(self, base):
+        """Test that relative paths are joined to the base and normalized."""
+        assert PathSanitizer.sanitize_path("a/./b/../c", base) == base / "a" / "c"
+
+    def test_dots_inside_names_are_allowed(self, base):
+        """Test that names containing '..' are not mistaken for traversal."""
+        path = base / "v1..v2.csv"
+        assert PathSanitizer.sanitize_path(path) == path
+
+    @pytest.mark.parametrize(
+        "path,base_path",
+        [
+            ("a/../../outside", Path("/srv/data")),
+            ("../data", Path("/srv/data")),
+            ("/..", None),
+        ],
+    )
+    def test_traversal_above_floor_is_rejected(self, path, base_path):
+        """Test that '..' may not climb above the base path or the root."""
+        with pytest.raises(SecurityError):
+            PathSanitizer.sanitize_path(path, base_path)
+
+    def test_symlinks_are_resolved(self, base):
+        """Test that the sanitized path is where a symlink points."""
+        (base / "target").mkdir()
+        (base / "link").symlink_to(base / "target")
+        assert PathSanitizer.sanitize_path("link/file", base) == base / "target" / "file"
+
+    def test_validate_path_access(self, base):
+        """Test that paths must stay inside the base path."""
+        assert PathSanitizer.validate_path_access(Path("p_1"), base) == base / "p_1"
+        with pytest.raises(SecurityError):
+            PathSanitizer.validate_path_access(Path("../outside"), base)
+
+    def test_symlink_escaping_base_is_rejected(self, base):
+        """Test that a link inside the base cannot reach outside it."""
+        allowed, outside = base / "allowed", base / "outside"
+        allowed.mkdir()
+        outside.mkdir()
+        (outside / "passwd").write_text("secret")
+        (allowed / "evil").symlink_to(outside)
+
+        with pytest.raises(SecurityError):
+            PathSanitizer.validate_path_access(allowed / "evil" / "passwd", allowed)
+        with pytest.raises(SecurityError):
+            PathSanitizer.validate_path_access(Path("evil/passwd"), allowed)
+
+    def test_sibling_with_common_prefix_is_outside(self):
+        """Test that containment compares whole components, not prefixes."""
+        base = Path("/srv/data")
+        assert PathSanitizer.validate_path_access(Path("/srv/data/p_1"), base) == base / "p_1"
+        with pytest.raises(SecurityError):
+            PathSanitizer.validate_path_access(Path("/srv/data2/p_1"), base)
+
+    def test_null_byte_is_rejected(self):
+        """Test that paths with embedded NUL bytes are invalid."""
+        with pytest.raises(SecurityError):
+            PathSanitizer.sanitize_path("/srv/data/p\0_1")
+
+
+class TestSecurityHeaders:
+    """Test cases for the SecurityHeaders class."""
+
+    def test_headers_are_shared_and_read_only(self):
+        """Test that every call returns the same immutable mapping."""
+        headers = SecurityHeaders.get_security_headers()
+        assert SecurityHeaders.get_security_headers() is headers
+        assert headers["X-Frame-Options"] == "DENY"
+        with pytest.raises(TypeError):
+            headers["X-Frame-Options"] = "SAMEORIGIN"
+
+
+class TestRateLimiter:
+    """Test cases for the RateLimiter class."""
+
+    def test_limit_within_window(self):
+        """Test that requests beyond the limit are refused per client."""
+        limiter = RateLimiter()
+        assert [limiter.is_allowed("a", max_requests=2) for _ in range(3)] == [True, True, False]
+        assert limiter.is_allowed("b", max_requests=2) is True
+
+    def test_tokens_refill_over_the_window(self):
+        """Test that spent tokens come back at max_requests per window."""
+        limiter = RateLimiter()
+        times = [0, 0, 0, 500_000_000, 1_000_000_000, 10_000_000_000, 10_000_000_000, 10_000_000_000]
+        with patch("time.monotonic_ns", side_effect=times):
+            results = [limiter.is_allowed("a", max_requests=2, window_seconds=2) for _ in times]
+        # A full bucket of two, then one token per second, never more than two
+        assert results == [True, True, False, False, True, True, True, False]
+
+    def test_idle_buckets_are_evicted(self, monkeypatch):
+        """Test that buckets idle for a whole window are swept out."""
+        monkeypatch.setattr(security, "_RATE_LIMIT_SHARDS", 1)
+        limiter = RateLimiter()
+        buckets = limiter._shards[0].buckets
+
+        with patch("time.monotonic_ns", return_value=0):
+            for i in range(200):
+                limiter.is_allowed(f"10.0.0.{i}", max_requests=5, window_seconds=2)
+        with patch("time.monotonic_ns", return_value=1_000_000_000):
+            limiter.is_allowed("10.0.0.0", max_requests=5, window_seconds=2)
+        assert len(buckets) == 200
+
+        with patch("time.monotonic_ns", return_value=2_000_000_000):
+            assert limiter.is_allowed("10.0.1.0", max_requests=5, window_seconds=2)
+        assert sorted(buckets) == ["10.0.0.0", "10.0.1.0"]
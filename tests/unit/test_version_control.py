@@ -0,0 +1,191 @@
+"""
+Unit tests for the version control module.
+Tests run against a throwaway Git repository in a temporary directory.
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.services.version_control import (
+    GIT_ADD_BATCH_SIZE,
+    VersionControlManager,
+    _batched,
+)
+
+
+@pytest.fixture
+def git_env(monkeypatch):
+    """Provide a deterministic Git identity for commits made during tests."""
+    monkeypatch.setenv("GIT_AUTHOR_NAME", "Test User")
+    monkeypatch.setenv("GIT_AUTHOR_EMAIL", "test@example.com")
+    monkeypatch.setenv("GIT_COMMITTER_NAME", "Test User")
+    monkeypatch.setenv("GIT_COMMITTER_EMAIL", "test@example.com")
+
+
+@pytest.fixture
+def vc_manager(temp_dir, git_env):
+    """Create a VersionControlManager backed by a fresh repository."""
+    manager = VersionControlManager(temp_dir)
+    manager.ensure_initialized()
+    return manager
+
+
+class TestVersionControlManager:
+    """Test cases for the VersionControlManager class."""
+
+    def test_init_is_lazy(self, temp_dir, git_env):
+        """Test that construction defers repository setup until first use."""
+        with patch("app.services.version_control.subprocess.run") as mock_run:
+            manager = VersionControlManager(temp_dir)
+        mock_run.assert_not_called()
+        assert not (Path(temp_dir) / ".git").exists()
+
+        manager.get_git_status()
+        assert (Path(temp_dir) / ".git").exists()
+
+    def test_batched_splits_into_chunks(self):
+        """Test that paths are grouped into batches of the requested size."""
+        batches = list(_batched([str(i) for i in range(5)], 2))
+        assert batches == [["0", "1"], ["2", "3"], ["4"]]
+        assert list(_batched([], GIT_ADD_BATCH_SIZE)) == []
+
+    def test_commit_metadata_changes_adds_files_in_one_call(self, vc_manager):
+        """Test that all requested files are staged with a single git add."""
+        files = []
+        for i in range(3):
+            path = Path(vc_manager.repo_path) / f"metadata_{i}.json"
+            path.write_text("{}")
+            files.append(path.name)
+
+        real_run = subprocess.run
+        with patch(
+            "app.services.version_control.subprocess.run", side_effect=real_run
+        ) as mock_run:
+            vc_manager.commit_metadata_changes("Add metadata", files)
+
+        add_calls = [
+            call.args[0] for call in mock_run.call_args_list if call.args[0][1] == "add"
+        ]
+        assert add_calls == [["git", "add", "--", *files]]
+
+        tracked = subprocess.run(
+            ["git", "ls-files"],
+            cwd=vc_manager.repo_path,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert set(files) <= set(tracked)
+
+    def test_git_status_matches_cli(self, vc_manager):
+        """Test that the in-process status mirrors the git CLI output."""
+        pytest.importorskip("pygit2")
+        repo = Path(vc_manager.repo_path)
+        (repo / "README.md").write_text("changed\n")
+        (repo / "untracked.json").write_text("{}")
+        (repo / "staged.txt").write_text("new\n")
+        subprocess.run(["git", "add", "staged.txt"], cwd=repo, check=True)
+
+        def git(*args):
+            return subprocess.run(
+                ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+            ).stdout.strip()
+
+        status = vc_manager.get_git_status()
+        assert status["status"] == git("status", "--porcelain")
+        assert status["branch"] == git("branch", "--show-current")
+        assert status["last_commit"] == git("log", "-1", "--oneline")
+        assert status["has_changes"] is True
+
+    def test_get_file_history_keeps_pipe_in_subject(self, vc_manager):
+        """Test that commit subjects containing '|' are parsed intact."""
+        path = Path(vc_manager.repo_path) / "metadata.json"
+        path.write_text("{}")
+        vc_manager.commit_metadata_changes("Update a | b", [path.name])
+        path.write_text('{"a": 1}')
+        vc_manager.commit_metadata_changes("Second update", [path.name])
+
+        history = vc_manager.get_file_history(str(path))
+        assert [entry["message"] for entry in history] == [
+            "Second update",
+            "Update a | b",
+        ]
+        assert all(len(entry["hash"]) == 40 for entry in history)
+        assert all(entry["author"] == "Test User" for entry in history)
+
+    def test_add_data_file_to_dvc_skips_tracked_file(self, vc_manager):
+        """Test that files with an existing .dvc pointer are not re-added."""
+        data_file = Path(vc_manager.repo_path) / "data.csv"
+        data_file.write_text("a,b\n")
+        Path(str(data_file) + ".dvc").write_text("outs: []\n")
+
+        with patch("app.services.version_control.subprocess.run") as mock_run:
+            vc_manager.add_data_file_to_dvc(str(data_file), vc_manager.repo_path)
+        mock_run.assert_not_called()
+
+    def test_add_data_file_to_dvc_uses_python_api(self, vc_manager):
+        """Test that DVC runs in-process when the dvc package is importable."""
+        data_file = Path(vc_manager.repo_path) / "data.csv"
+        data_file.write_text("a,b\n")
+
+        class FakeDvcError(Exception):
+            pass
+
+        class FakeRepo:
+            def __init__(self, root):
+                self.root = root
+
+            def add(self, target):
+                Path(target + ".dvc").write_text("outs: []\n")
+
+        with patch(
+            "app.services.version_control._import_dvc",
+            return_value=(FakeRepo, FakeDvcError),
+        ):
+            vc_manager.add_data_file_to_dvc(str(data_file), vc_manager.repo_path)
+
+        assert vc_manager.get_file_history(str(data_file) + ".dvc")[0][
+            "message"
+        ] == "Add data file to DVC: data.csv"
+
+    def test_git_status_cli_fallback(self, vc_manager):
+        """Test that status falls back to the git CLI without pygit2."""
+        with patch("app.services.version_control.pygit2", None):
+            clean = vc_manager.get_git_status()
+            (Path(vc_manager.repo_path) / "new.json").write_text("{}")
+            dirty = vc_manager.get_git_status()
+
+        assert clean["status"] == "" and clean["has_changes"] is False
+        assert dirty["status"] == "?? new.json" and dirty["has_changes"] is True
+        assert isinstance(dirty["branch"], str) and dirty["branch"]
+        assert dirty["last_commit"].endswith("Initial commit: FAIR metadata system setup")
+
+    def test_git_status_cli_matches_porcelain_v1(self, vc_manager):
+        """Test that porcelain v2 entries are reported in the v1 format."""
+        repo = Path(vc_manager.repo_path)
+        (repo / "tracked.json").write_text("{}")
+        (repo / "other.json").write_text("[]")
+        vc_manager.commit_metadata_changes("Add files", ["tracked.json", "other.json"])
+
+        (repo / "README.md").write_text("changed\n")
+        (repo / "untracked.txt").write_text("new\n")
+        subprocess.run(
+            ["git", "mv", "tracked.json", "renamed.json"], cwd=repo, check=True
+        )
+        subprocess.run(["git", "rm", "-q", "other.json"], cwd=repo, check=True)
+
+        expected = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        with patch("app.services.version_control.pygit2", None):
+            status = vc_manager.get_git_status()
+
+        assert status["status"] == expected
+        assert "R  tracked.json -> renamed.json" in status["status"]